@@ -0,0 +1,117 @@
+# Copyright Pincer 2021-Present
+# Full MIT License can be found in `LICENSE` at the project root.
+
+"""Measures the cost of decoding gateway events with every available JSON
+codec.
+
+Run from the project root with ``python -m benchmarks.codec``.
+"""
+
+from json import dumps
+from timeit import Timer
+
+from pincer.core.dispatch import GatewayDispatch
+from pincer.utils.codec import (
+    ORJSON_CODEC,
+    STDLIB_CODEC,
+    get_codec,
+    set_codec,
+)
+
+USER = {
+    "id": "80351110224678912",
+    "username": "Nelly",
+    "discriminator": "1337",
+    "avatar": "8342729096ea3675442027381ff50dfe",
+    "public_flags": 64,
+}
+
+MESSAGE_CREATE = {
+    "op": 0,
+    "s": 42,
+    "t": "MESSAGE_CREATE",
+    "d": {
+        "id": "334385199974967042",
+        "channel_id": "290926798999357250",
+        "guild_id": "290926798999357249",
+        "author": USER,
+        "member": {
+            "roles": ["290926798999357251"],
+            "joined_at": "2021-06-14T18:22:10.112000+00:00",
+            "deaf": False,
+            "mute": False,
+        },
+        "content": "Supa Hot " * 20,
+        "timestamp": "2021-12-11T22:39:17.493000+00:00",
+        "edited_timestamp": None,
+        "tts": False,
+        "mention_everyone": False,
+        "mentions": [USER] * 3,
+        "mention_roles": [],
+        "attachments": [],
+        "embeds": [],
+        "pinned": False,
+        "type": 0,
+    },
+}
+
+GUILD_CREATE = {
+    "op": 0,
+    "s": 3,
+    "t": "GUILD_CREATE",
+    "d": {
+        "id": "290926798999357249",
+        "name": "Pincer",
+        "owner_id": USER["id"],
+        "roles": [
+            {"id": str(i), "name": f"role {i}", "permissions": "104324673"}
+            for i in range(50)
+        ],
+        "channels": [
+            {"id": str(i), "name": f"channel-{i}", "type": 0, "position": i}
+            for i in range(100)
+        ],
+        "members": [
+            {
+                "user": {**USER, "id": str(i)},
+                "roles": ["1", "2"],
+                "joined_at": "2021-06-14T18:22:10.112000+00:00",
+                "deaf": False,
+                "mute": False,
+            }
+            for i in range(1000)
+        ],
+    },
+}
+
+
+def bench(payload: bytes, number: int) -> float:
+    """Returns the average time in microseconds of decoding one event."""
+    timer = Timer(lambda: GatewayDispatch.from_string(payload))
+    return min(timer.repeat(5, number)) / number * 1e6
+
+
+def main():
+    default = get_codec()
+    codecs = [c for c in (STDLIB_CODEC, ORJSON_CODEC) if c is not None]
+
+    print(f"{'event':<16}{'size':>10}", *(f"{c.name:>12}" for c in codecs))
+
+    for event, number in ((MESSAGE_CREATE, 20_000), (GUILD_CREATE, 100)):
+        payload = dumps(event).encode()
+        results = []
+
+        for codec in codecs:
+            set_codec(codec)
+            results.append(bench(payload, number))
+
+        print(
+            f"{event['t']:<16}{len(payload):>9}B",
+            *(f"{result:>10.1f}us" for result in results),
+        )
+
+    set_codec(default)
+
+
+if __name__ == "__main__":
+    main()
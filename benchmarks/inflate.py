@@ -0,0 +1,78 @@
+# Copyright Pincer 2021-Present
+# Full MIT License can be found in `LICENSE` at the project root.
+
+"""Measures gateway decompression per shard for both compression modes.
+
+Run from the project root with ``python -m benchmarks.inflate``.
+"""
+
+from json import dumps
+from zlib import Z_SYNC_FLUSH, compress, compressobj
+
+from pincer.core.dispatch import GatewayDispatch
+from pincer.core.inflator import Inflator
+
+from .codec import GUILD_CREATE, MESSAGE_CREATE
+
+SHARDS = 4
+EVENTS = 5_000
+# Large messages are split in frames of this size.
+FRAME_SIZE = 16 * 1024
+
+
+def stream(payloads):
+    """Compresses the payloads like ``zlib-stream``."""
+    context = compressobj()
+
+    for payload in payloads:
+        data = context.compress(payload) + context.flush(Z_SYNC_FLUSH)
+
+        for start in range(0, len(data), FRAME_SIZE):
+            yield data[start : start + FRAME_SIZE]
+
+
+def payload(payloads):
+    """Compresses the payloads like ``zlib-payload``."""
+    for data in payloads:
+        yield compress(data)
+
+
+def events(shard: int):
+    for idx in range(EVENTS):
+        event = dict(MESSAGE_CREATE, s=idx)
+        event["d"] = dict(event["d"], content=f"shard {shard} message {idx}")
+        yield dumps(event).encode()
+
+    yield dumps(GUILD_CREATE).encode()
+
+
+def main():
+    print(
+        f"{'mode':<14}{'shard':>6}{'in':>12}{'out':>12}{'ratio':>8}"
+        f"{'cpu':>10}{'per event':>12}"
+    )
+
+    for mode, compressor in (
+        ("zlib-stream", stream),
+        ("zlib-payload", payload),
+    ):
+        for shard in range(SHARDS):
+            frames = list(compressor(events(shard)))
+            inflator = Inflator(mode)
+
+            for frame in frames:
+                data = inflator.decompress(frame)
+
+                if data is not None:
+                    GatewayDispatch.from_string(data)
+
+            print(
+                f"{mode:<14}{shard:>6}{inflator.bytes_in:>11}B"
+                f"{inflator.bytes_out:>11}B{inflator.ratio:>8.1f}"
+                f"{inflator.cpu_time * 1e3:>8.1f}ms"
+                f"{inflator.cpu_time / (EVENTS + 1) * 1e6:>10.2f}us"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+# Copyright Pincer 2021-Present
+# Full MIT License can be found in `LICENSE` at the project root.
+
+"""Measures the memory used by every cached member, user and channel.
+
+Run from the project root with ``python -m benchmarks.memory``.
+"""
+
+import tracemalloc
+
+from pincer.objects import Channel, GuildMember, Role, User
+
+from .codec import USER
+
+COUNT = 10_000
+
+MEMBER = {
+    "user": USER,
+    "roles": ["290926798999357251", "290926798999357252"],
+    "joined_at": "2021-06-14T18:22:10.112000+00:00",
+    "deaf": False,
+    "mute": False,
+}
+
+CHANNEL = {
+    "id": "290926798999357250",
+    "type": 0,
+    "name": "general",
+    "position": 3,
+    "guild_id": "290926798999357249",
+    "permission_overwrites": [],
+}
+
+ROLE = {
+    "id": "290926798999357251",
+    "name": "Moderator",
+    "color": 3447003,
+    "hoist": True,
+    "managed": False,
+    "mentionable": True,
+    "permissions": "104324673",
+    "position": 5,
+}
+
+
+def measure(build, data) -> float:
+    """Returns the bytes allocated per object while keeping ``COUNT``
+    objects alive."""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objects = [build(dict(data)) for _ in range(COUNT)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    # The objects are only released once they have been measured.
+    del objects
+    return (after - before) / COUNT
+
+
+def main():
+    for name, build, data in (
+        ("GuildMember", GuildMember.from_dict, MEMBER),
+        ("User", User.from_dict, USER),
+        ("Channel", Channel.from_dict, CHANNEL),
+        ("Role", Role.from_dict, ROLE),
+    ):
+        print(f"{name:<12}{measure(build, data):>8.0f} bytes")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+# Copyright Pincer 2021-Present
+# Full MIT License can be found in `LICENSE` at the project root.
+
+"""Measures the construction of API objects from decoded events.
+
+Run from the project root with ``python -m benchmarks.objects``. A gateway
+recording made with :class:`~pincer.core.recorder.GatewayRecorder` can be
+passed to use its ``MESSAGE_CREATE`` and ``GUILD_CREATE`` events instead
+of the built-in ones::
+
+    python -m benchmarks.objects traffic.pgr
+"""
+
+import sys
+from json import dumps
+from timeit import Timer
+
+from pincer.core.dispatch import GatewayDispatch
+from pincer.core.inflator import Inflator
+from pincer.core.recorder import BINARY, CONNECT, read_recording
+from pincer.objects import Guild, GuildMember, UserMessage
+
+from .codec import GUILD_CREATE, MESSAGE_CREATE
+
+# Fields of a guild which the codec benchmark leaves out.
+GUILD = {
+    **GUILD_CREATE["d"],
+    "features": ["COMMUNITY"],
+    "nsfw_level": 0,
+    "verification_level": 1,
+    "roles": [
+        {
+            **role,
+            "color": 0,
+            "hoist": False,
+            "managed": False,
+            "mentionable": False,
+            "position": position,
+        }
+        for position, role in enumerate(GUILD_CREATE["d"]["roles"])
+    ],
+}
+
+
+def recorded_events(path: str):
+    """Yields the ``MESSAGE_CREATE`` and ``GUILD_CREATE`` events of a
+    recording."""
+    inflators = {}
+
+    for frame in read_recording(path):
+        inflator = inflators.setdefault(frame.shard, Inflator("zlib-stream"))
+
+        if frame.kind == CONNECT:
+            inflator.reset()
+            continue
+
+        data = inflator.decompress(frame.data) if frame.kind == BINARY else frame.data
+
+        if data:
+            dispatch = GatewayDispatch.from_string(data)
+
+            if dispatch.event_name in ("MESSAGE_CREATE", "GUILD_CREATE"):
+                yield dispatch
+
+
+def bench(build, events, repeat: int) -> float:
+    """Returns the average time in microseconds of building one event."""
+    timer = Timer(lambda: [build(event) for event in events])
+    return min(timer.repeat(5, repeat)) / (repeat * len(events)) * 1e6
+
+
+def main():
+    if len(sys.argv) > 1:
+        events = list(recorded_events(sys.argv[1]))
+    else:
+        events = [
+            GatewayDispatch.from_string(dumps(event))
+            for event in (MESSAGE_CREATE, {**GUILD_CREATE, "d": GUILD})
+        ]
+
+    messages = [e.data for e in events if e.event_name == "MESSAGE_CREATE"]
+    guilds = [e.data for e in events if e.event_name == "GUILD_CREATE"]
+    members = [member for guild in guilds for member in guild["members"]]
+
+    for name, build, data, repeat in (
+        ("UserMessage", UserMessage.from_dict, messages, 200),
+        ("Guild", Guild.from_dict, guilds, 2),
+        ("GuildMember", GuildMember.from_dict, members, 2),
+    ):
+        if data:
+            print(
+                f"{name:<20}{len(data):>6} objects",
+                f"{bench(build, data, repeat):>10.1f}us",
+            )
+
+    if messages:
+        # A handler which only reads the content and the author's id.
+        UserMessage.lazy_fields = True
+        result = bench(
+            lambda data: UserMessage.from_dict(data).author.id, messages, 200
+        )
+        UserMessage.lazy_fields = False
+
+        print(
+            f"{'UserMessage (lazy)':<20}{len(messages):>6} objects",
+            f"{result:>10.1f}us",
+        )
+
+
+if __name__ == "__main__":
+    main()
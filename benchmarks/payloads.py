@@ -0,0 +1,74 @@
+# Copyright Pincer 2021-Present
+# Full MIT License can be found in `LICENSE` at the project root.
+
+"""Measures the serialization of outbound payloads.
+
+Run from the project root with ``python -m benchmarks.payloads``.
+"""
+
+from timeit import Timer
+
+from pincer.objects import (
+    AppCommand,
+    AppCommandOption,
+    AppCommandOptionType,
+    AppCommandType,
+    Embed,
+    Message,
+    UserMessage,
+)
+from pincer.utils.codec import dumpb
+
+from .codec import MESSAGE_CREATE
+
+EMBED = (
+    Embed(title="Pincer", description="An asynchronous API wrapper")
+    .add_field(name="Repository", value="https://github.com/Pincer-org/Pincer")
+    .add_field(name="Documentation", value="https://docs.pincer.dev")
+    .set_thumbnail(url="https://pincer.dev/img/icon.png")
+)
+
+COMMAND = AppCommand(
+    name="ban",
+    description="Bans a member",
+    type=AppCommandType.CHAT_INPUT,
+    options=[
+        AppCommandOption(
+            type=AppCommandOptionType.USER,
+            name="member",
+            description="The member to ban",
+            required=True,
+        ),
+        AppCommandOption(
+            type=AppCommandOptionType.STRING,
+            name="reason",
+            description="Why the member is banned",
+        ),
+    ],
+)
+
+
+def bench(encode, repeat: int = 2000) -> float:
+    """Returns the average time in microseconds of encoding a payload."""
+    timer = Timer(encode)
+    return min(timer.repeat(5, repeat)) / repeat * 1e6
+
+
+def main():
+    message = Message(embeds=[EMBED, EMBED])
+    user_message = UserMessage.from_dict(MESSAGE_CREATE["d"])
+
+    for name, obj in (
+        ("Embed", EMBED),
+        ("AppCommand", COMMAND),
+        ("Message", message),
+        ("UserMessage", user_message),
+    ):
+        print(
+            f"{name:<12}{bench(obj.to_dict):>10.1f}us",
+            f"{bench(lambda: dumpb(obj.to_dict())):>10.1f}us with JSON",
+        )
+
+
+if __name__ == "__main__":
+    main()
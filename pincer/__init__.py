@@ -55,8 +55,10 @@ from .exceptions import (
     NotFoundError,
     MethodNotAllowedError,
     RateLimitError,
+    DeadlineExceededError,
     GatewayError,
     ServerError,
+    CircuitOpenError,
     EmbedOverflow,
     ImageEncodingError,
 )
@@ -98,6 +100,7 @@ __all__ = (
     "ChatCommandHandler",
     "Client",
     "Cog",
+    "CircuitOpenError",
     "CogAlreadyExists",
     "CogError",
     "CogNotFound",
@@ -107,6 +110,7 @@ __all__ = (
     "CommandError",
     "CommandIsNotCoroutine",
     "CommandReturnIsEmpty",
+    "DeadlineExceededError",
     "DisallowedIntentsError",
     "DispatchError",
     "EmbedFieldError",
@@ -8,12 +8,16 @@ from dataclasses import dataclass
 class GatewayConfig:
     """This file is to make maintaining the library and its gateway
     configuration easier. Leave compression blank for no compression.
+
+    ``zlib-stream`` compresses the whole connection with one zlib context,
+    which compresses far better than ``zlib-payload`` where only large
+    payloads are compressed on their own.
     """
 
     MAX_RETRIES: int = 5
     version: int = 9
     encoding: str = "json"
-    compression: str = "zlib-payload"
+    compression: str = "zlib-stream"
 
     @classmethod
     def make_uri(cls, uri) -> str:
@@ -25,7 +29,7 @@ class GatewayConfig:
         """
         return (
             f"{uri}" f"?v={cls.version}" f"&encoding={cls.encoding}"
-        ) + f"&compress={cls.compression}" * cls.compressed()
+        ) + f"&compress={cls.compression}" * (cls.compression == "zlib-stream")
 
     @classmethod
     def compressed(cls) -> bool:
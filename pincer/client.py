@@ -9,6 +9,7 @@ from asyncio import (
     iscoroutinefunction,
     ensure_future,
     create_task,
+    gather,
     get_event_loop,
 )
 from collections import defaultdict
@@ -35,11 +36,14 @@ from .objects.app.command import InteractableStructure
 from . import __package__
 from .commands import ChatCommandHandler
 from .core import HTTPClient
+from .core.connection import ConnectionPool
 from .core.gateway import GatewayInfo, Gateway
+from .core.health import ShardSupervisor
+from .core.identify import IdentifyScheduler
 
 from .exceptions import InvalidEventName, GatewayConnectionError
 
-from .middleware import middleware
+from .middleware import PURE_MIDDLEWARE, middleware
 from .objects import (
     Role,
     Channel,
@@ -63,13 +67,21 @@ from .utils.extraction import get_index
 from .utils.insertion import should_pass_cls, should_pass_gateway
 from .utils.shards import calculate_shard_id
 from .utils.types import CheckFunction
-from .utils.types import Coro
+from .utils.types import Coro, TYPE_REGISTRY
 
 if TYPE_CHECKING:
     from .utils.snowflake import Snowflake
     from .core.dispatch import GatewayDispatch
     from .objects.app.throttling import ThrottleInterface
     from .objects.guild import Webhook
+    from .core.cache import ResponseCache
+    from .core.connection import ConnectionConfig
+    from .core.cluster import ClusterClient
+    from .core.health import ShardHealth
+    from .core.pipeline import PipelineConfig
+    from .core.recorder import GatewayRecorder
+    from .core.session import SessionStore
+    from .core.ratelimit_state import RateLimitState
 
     from collections.abc import AsyncIterator
 
@@ -141,6 +153,10 @@ def event_middleware(call: str, *, override: bool = False):
                 call,
             )
 
+        if override:
+            # Custom middleware can have side effects, it is always run.
+            PURE_MIDDLEWARE.pop(call, None)
+
         if not override and callable(_events.get(call)):
             raise RuntimeError(
                 f"Middleware event with call `{call}` has "
@@ -162,6 +178,7 @@ for event, middleware_ in middleware.items():
     event_middleware(event)(middleware_)
 
 
+@TYPE_REGISTRY.register
 class Client(Interactable, CogManager):
     """The client is the main instance which is between the programmer
     and the discord API.
@@ -176,6 +193,13 @@ class Client(Interactable, CogManager):
         The default message which will be sent when no response is given.
     http: :class:`~core.http.HTTPClient`
         The http client used to communicate with the discord API
+    identify_scheduler: :class:`~core.identify.IdentifyScheduler`
+        Spaces the identifies of the shards and tracks the startup progress
+    supervisor: :class:`~core.health.ShardSupervisor`
+        Restarts shards which stopped or whose connection is a zombie
+    cluster: Optional[:class:`~core.cluster.ClusterClient`]
+        The connection to the other clusters when the client was started
+        by a :class:`~core.cluster.ClusterLauncher`
 
     Parameters
     ----------
@@ -193,6 +217,37 @@ class Client(Interactable, CogManager):
         Custom throttlers must derive from
         :class:`~pincer.objects.app.throttling.ThrottleInterface`.
         |default| :class:`~pincer.objects.app.throttling.DefaultThrottleHandler`
+    http_cache : Optional[:class:`~pincer.core.cache.ResponseCache`]
+        Opt-in cache for read-only REST endpoints such as ``get_guild``,
+        ``get_channel``, ``get_user`` and ``get_role``. Entries are
+        invalidated by the matching gateway events.
+        |default| :data:`None`
+    connection_config : Optional[:class:`~pincer.core.connection.ConnectionConfig`]
+        Settings of the connection pool shared by REST requests, every
+        shard and CDN fetches such as :meth:`~pincer.objects.user.user.User.get_avatar`.
+        |default| ``ConnectionConfig()``
+    rate_limit_state : Optional[:class:`~pincer.core.ratelimit_state.RateLimitState`]
+        Where the REST rate limit counters are kept. Processes which use the
+        same token should share a
+        :class:`~pincer.core.coordinator.SharedRateLimitState`.
+        |default| :class:`~pincer.core.ratelimit_state.LocalRateLimitState`
+    pipeline_config : Optional[:class:`~pincer.core.pipeline.PipelineConfig`]
+        Settings of the pipeline every shard handles its dispatches with,
+        which keeps the events of a guild in order.
+        |default| ``PipelineConfig()``
+    session_store : Optional[:class:`~pincer.core.session.SessionStore`]
+        Saves the gateway sessions, so the shards resume them after a
+        restart instead of identifying again. Use :meth:`shutdown` to stop
+        the client without ending the sessions.
+        |default| :data:`None`
+    recorder : Optional[:class:`~pincer.core.recorder.GatewayRecorder`]
+        Records the traffic every shard receives, to replay it with
+        :class:`~pincer.core.recorder.GatewayReplay`.
+        |default| :data:`None`
+    gateway_info : Optional[:class:`~pincer.core.gateway.GatewayInfo`]
+        Used instead of fetching the gateway info from Discord, such as
+        :attr:`~pincer.core.recorder.GatewayReplay.gateway_info`.
+        |default| :data:`None`
     """  # noqa: E501
 
     def __init__(
@@ -203,6 +258,13 @@ class Client(Interactable, CogManager):
         intents: Intents = None,
         throttler: ThrottleInterface = DefaultThrottleHandler,
         reconnect: bool = True,
+        http_cache: Optional[ResponseCache] = None,
+        connection_config: Optional[ConnectionConfig] = None,
+        rate_limit_state: Optional[RateLimitState] = None,
+        pipeline_config: Optional[PipelineConfig] = None,
+        session_store: Optional[SessionStore] = None,
+        recorder: Optional[GatewayRecorder] = None,
+        gateway_info: Optional[GatewayInfo] = None,
     ):
         def sigint_handler(_signal, _frame):
             _log.info("SIGINT received, shutting down...")
@@ -210,9 +272,7 @@ class Client(Interactable, CogManager):
             # A print statement to make sure the user sees the message
             print("Closing the client loop, this can take a few seconds...")
 
-            create_task(self.http.close())
-            if self.loop.is_running():
-                self.loop.stop()
+            create_task(self.shutdown())
 
         signal.signal(signal.SIGINT, sigint_handler)
 
@@ -228,7 +288,18 @@ class Client(Interactable, CogManager):
 
         self.bot: Optional[User] = None
         self.received_message = received or "Command arrived successfully!"
-        self.http = HTTPClient(token)
+        self.pool = ConnectionPool(connection_config)
+        self.pipeline_config = pipeline_config
+        self.session_store = session_store
+        self.recorder = recorder
+        self.cluster: Optional[ClusterClient] = None
+        self.supervisor = ShardSupervisor()
+        self.http = HTTPClient(
+            token,
+            cache=http_cache,
+            pool=self.pool,
+            rate_limit_state=rate_limit_state,
+        )
         APIObject.bind_client(self)
 
         self.throttler = throttler
@@ -239,7 +310,12 @@ class Client(Interactable, CogManager):
         self.loop = get_event_loop()
         self.event_mgr = EventMgr(self.loop)
 
-        self.gateway: GatewayInfo = self.loop.run_until_complete(get_gateway())
+        self.gateway: GatewayInfo = (
+            gateway_info or self.loop.run_until_complete(get_gateway())
+        )
+        self.identify_scheduler = IdentifyScheduler(
+            self.gateway.session_start_limit
+        )
         self.shards: OrderedDict[int, Gateway] = OrderedDict()
 
         # The guild and channel value is only registered if the Client has the GUILDS
@@ -403,10 +479,13 @@ class Client(Interactable, CogManager):
             if should_pass_gateway(event.call):
                 call_args = (call_args[0], gateway, *call_args[1:])
 
-            ensure_future(event.call(*call_args, **kwargs))
+            # Listeners run detached so they can wait for later events, the
+            # pipeline of the shard counts them to bound their amount.
+            gateway.pipeline.spawn(event.call(*call_args, **kwargs))
 
     def run(self):
         """Start the bot."""
+        self.identify_scheduler.expected = 1
         ensure_future(self.start_shard(0, 1), loop=self.loop)
         self.loop.run_forever()
 
@@ -425,7 +504,14 @@ class Client(Interactable, CogManager):
             The shards to run.
         num_shards: int
             The total amount of shards.
+
+        The shards identify as fast as ``max_concurrency`` allows, the
+        startup progress can be followed through
+        :attr:`identify_scheduler`.
         """
+        shards = list(shards)
+        self.identify_scheduler.expected = len(shards)
+
         for shard in shards:
             ensure_future(self.start_shard(shard, num_shards), loop=self.loop)
 
@@ -442,6 +528,24 @@ class Client(Interactable, CogManager):
         num_shards : int
             The total number of shards.
         """
+        gateway = await self.create_shard(shard, num_shards)
+        self.supervisor.watch(gateway)
+
+    async def create_shard(self, shard: int, num_shards: int) -> Gateway:
+        """|coro|
+        Creates a shard which handles events for this client, without
+        connecting it.
+
+        shard : int
+            The number of the shard to create.
+        num_shards : int
+            The total number of shards.
+
+        Returns
+        -------
+        :class:`~pincer.core.gateway.Gateway`
+            The shard, registered in :attr:`shards`.
+        """
 
         gateway = Gateway(
             self.token,
@@ -449,6 +553,11 @@ class Client(Interactable, CogManager):
             url=self.gateway.url,
             shard=shard,
             num_shards=num_shards,
+            pool=self.pool,
+            pipeline_config=self.pipeline_config,
+            identify_scheduler=self.identify_scheduler,
+            session_store=self.session_store,
+            recorder=self.recorder,
         )
         await gateway.init_session()
 
@@ -460,9 +569,10 @@ class Client(Interactable, CogManager):
                 0: partial(self.event_handler, gateway),
             }
         )
+        gateway.event_filter = self.wants_event
 
         self.shards[gateway.shard] = gateway
-        create_task(gateway.start_loop())
+        return gateway
 
     def get_shard(
         self,
@@ -495,6 +605,35 @@ class Client(Interactable, CogManager):
             num_shards = next(iter(self.shards.values())).num_shards
         return self.shards[calculate_shard_id(guild_id, num_shards)]
 
+    @property
+    def health(self) -> Dict[int, ShardHealth]:
+        """
+        Returns
+        -------
+        Dict[:class:`int`, :class:`~pincer.core.health.ShardHealth`]
+            The connection health of every shard by its id. Shards whose
+            :attr:`~pincer.core.health.ShardHealth.status` isn't
+            ``healthy`` should not be relied on.
+        """
+        return {shard: gateway.health for shard, gateway in self.shards.items()}
+
+    @property
+    def latency(self) -> Optional[float]:
+        """
+        Returns
+        -------
+        Optional[:class:`float`]
+            The average heartbeat latency of the shards in seconds,
+            :data:`None` if no heartbeat has been acknowledged yet.
+        """
+        latencies = [
+            gateway.health.latency
+            for gateway in self.shards.values()
+            if gateway.health.latency is not None
+        ]
+
+        return sum(latencies) / len(latencies) if latencies else None
+
     @property
     def is_closed(self) -> bool:
         """
@@ -505,16 +644,40 @@ class Client(Interactable, CogManager):
         """
         return self.loop.is_running()
 
+    async def shutdown(self):
+        """|coro|
+        Disconnects every shard without ending its session, saving the
+        sessions in the session store, and stops the client.
+        """
+        self.supervisor.close()
+        await gather(*(shard.close() for shard in self.shards.values()))
+        await self.__close_connections()
+
+        if self.recorder:
+            self.recorder.close()
+
+        if self.cluster:
+            await self.cluster.close()
+
+        if self.loop.is_running():
+            self.loop.stop()
+
     def close(self):
         """
         Ensure close of the http client.
         Allow for script execution to continue.
         """
         if hasattr(self, "http"):
-            create_task(self.http.close())
+            create_task(self.__close_connections())
 
         self.loop.stop()
 
+    async def __close_connections(self):
+        # The HTTP client closes its rate limit state, the pool is shared
+        # with the gateways so it is closed separately.
+        await self.http.close()
+        await self.pool.close()
+
     def __del__(self):
         if self.loop.is_running():
             self.loop.stop()
@@ -635,6 +798,31 @@ class Client(Interactable, CogManager):
         except Exception as e:
             await self.execute_error(e, gateway)
 
+    def wants_event(self, name: str) -> bool:
+        """Whether a dispatch has to be handled. Events whose middleware only
+        converts the payload are skipped while no listener, ``wait_for`` or
+        ``loop_for`` is registered for them or for ``on_payload``.
+
+        Parameters
+        ----------
+        name : :class:`str`
+            The name of the dispatch, e.g. ``PRESENCE_UPDATE``.
+
+        Returns
+        -------
+        :class:`bool`
+            :data:`False` if the dispatch can be dropped.
+        """
+        listener = PURE_MIDDLEWARE.get(name.lower())
+
+        if listener is None:
+            return True
+
+        return any(
+            self.get_event_coro(event) or self.event_mgr.is_waiting(event)
+            for event in (listener, "on_payload")
+        )
+
     async def event_handler(self, gateway: Gateway, payload: GatewayDispatch):
         """|coro|
 
@@ -647,6 +835,9 @@ class Client(Interactable, CogManager):
             required data for the client to know what event it is and
             what specifically happened.
         """
+        if not self.wants_event(payload.event_name):
+            return
+
         await self.process_event(payload.event_name.lower(), payload, gateway)
 
     async def payload_event_handler(
@@ -1,17 +1,61 @@
 # Copyright Pincer 2021-Present
 # Full MIT License can be found in `LICENSE` at the project root.
 
+from .cache import CacheEntry, ResponseCache
+from .connection import ConnectionConfig, ConnectionPool
+from .cluster import ClusterClient, ClusterHub, ClusterLauncher
+from .coordinator import RateLimitCoordinator, SharedRateLimitState
 from .dispatch import GatewayDispatch
 from .gateway import Gateway, GatewayInfo
+from .health import ShardHealth, ShardSupervisor
 from .http import HTTPClient
+from .identify import IdentifyScheduler
+from .inflator import Inflator
+from .member_requests import MemberRequests
+from .outbound import OutboundQueue
+from .pipeline import DispatchPipeline, PipelineConfig
+from .ratelimit_state import LocalRateLimitState, RateLimitState
+from .recorder import GatewayRecorder, GatewayReplay, RecordedFrame
 from .ratelimiter import RateLimiter, Bucket
+from .retry import CircuitBreaker, RetryPolicy
+from .scheduler import Priority, PriorityLock
+from .session import FileSessionStore, GatewaySession, SessionStore
 
 
 __all__ = (
     "Bucket",
+    "CacheEntry",
+    "CircuitBreaker",
+    "ClusterClient",
+    "ClusterHub",
+    "ClusterLauncher",
+    "ConnectionConfig",
+    "ConnectionPool",
+    "FileSessionStore",
+    "DispatchPipeline",
     "Gateway",
     "GatewayDispatch",
     "GatewayInfo",
+    "GatewayRecorder",
+    "GatewayReplay",
+    "GatewaySession",
     "HTTPClient",
+    "IdentifyScheduler",
+    "Inflator",
+    "LocalRateLimitState",
+    "MemberRequests",
+    "OutboundQueue",
+    "PipelineConfig",
+    "Priority",
+    "PriorityLock",
+    "RateLimitCoordinator",
+    "RateLimitState",
     "RateLimiter",
+    "RecordedFrame",
+    "ResponseCache",
+    "RetryPolicy",
+    "SessionStore",
+    "ShardHealth",
+    "ShardSupervisor",
+    "SharedRateLimitState",
 )
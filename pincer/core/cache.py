@@ -0,0 +1,289 @@
+# Copyright Pincer 2021-Present
+# Full MIT License can be found in `LICENSE` at the project root.
+
+from __future__ import annotations
+
+import logging
+from collections import OrderedDict
+from dataclasses import dataclass
+from time import monotonic
+from typing import TYPE_CHECKING
+
+from .ratelimiter import get_route
+
+if TYPE_CHECKING:
+    from typing import Dict, Optional, Set, Tuple
+
+    CacheKey = Tuple[str, Tuple[Tuple[str, str], ...]]
+
+_log = logging.getLogger(__name__)
+
+#: Default time to live in seconds of the cached routes. Routes which are not
+#: in the mapping are never cached.
+DEFAULT_TTLS: Dict[str, float] = {
+    "channels/{channel_id}": 60,
+    "guilds/{guild_id}": 60,
+    "guilds/{guild_id}/channels": 60,
+    "guilds/{guild_id}/members/{id}": 60,
+    "guilds/{guild_id}/preview": 300,
+    "guilds/{guild_id}/roles": 60,
+    "guilds/{guild_id}/widget": 300,
+    "guilds/{guild_id}/widget.json": 300,
+    "users/{id}": 300,
+}
+
+
+@dataclass
+class CacheEntry:
+    """A cached response body.
+
+    Attributes
+    ----------
+    body : bytes
+        The raw response body.
+    expires : float
+        Monotonic time after which the entry has to be revalidated.
+    etag : Optional[str]
+        The ``ETag`` of the response, used to revalidate stale entries.
+    """
+
+    body: bytes
+    expires: float
+    etag: Optional[str] = None
+
+    @property
+    def fresh(self) -> bool:
+        """:class:`bool`: Whether the entry can be used without contacting
+        Discord."""
+        return monotonic() < self.expires
+
+
+class ResponseCache:
+    """Bounded LRU cache for read-only REST endpoints.
+
+    The raw response body is stored, so every hit decodes into a new
+    payload which can safely be modified by the caller. Entries are evicted
+    when they expire, when the cache exceeds ``max_size`` bytes, when a
+    non ``GET`` request is sent to the resource, or when the gateway reports
+    an update through :meth:`invalidate`.
+
+    Parameters
+    ----------
+    ttls : Optional[Dict[:class:`str`, :class:`float`]]
+        Time to live in seconds per route template, e.g.
+        ``{"users/{id}": 300}``. |default| ``DEFAULT_TTLS``
+    max_size : :class:`int`
+        Maximum amount of bytes of response bodies to keep.
+        |default| ``16 MiB``
+
+    Attributes
+    ----------
+    size : :class:`int`
+        Amount of bytes currently cached.
+    hits : :class:`int`
+        Amount of requests served from the cache.
+    misses : :class:`int`
+        Amount of cacheable requests that had to be sent to Discord.
+    revalidations : :class:`int`
+        Amount of stale entries which Discord confirmed as not modified.
+    """
+
+    def __init__(
+        self,
+        ttls: Optional[Dict[str, float]] = None,
+        max_size: int = 16 * 1024 * 1024,
+    ):
+        self.ttls: Dict[str, float] = dict(DEFAULT_TTLS if ttls is None else ttls)
+        self.max_size = max_size
+
+        self.size: int = 0
+        self.hits: int = 0
+        self.misses: int = 0
+        self.revalidations: int = 0
+
+        self.__entries: OrderedDict[CacheKey, CacheEntry] = OrderedDict()
+        # Keys per resource and the cached resources below every path, so
+        # invalidating only touches the matching entries.
+        self.__keys: Dict[str, Set[CacheKey]] = {}
+        self.__resources: Dict[str, Set[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    @staticmethod
+    def make_key(route: str, params: Optional[Dict] = None) -> CacheKey:
+        """
+        Parameters
+        ----------
+        route : :class:`str`
+            The Discord REST endpoint.
+        params : Optional[Dict]
+            The query parameters of the request. |default| :data:`None`
+
+        Returns
+        -------
+        Tuple[:class:`str`, Tuple]
+            The key of the request in the cache.
+        """
+        return (
+            route.strip("/"),
+            tuple(sorted((k, str(v)) for k, v in (params or {}).items())),
+        )
+
+    def ttl(self, route: str) -> Optional[float]:
+        """
+        Parameters
+        ----------
+        route : :class:`str`
+            The Discord REST endpoint.
+
+        Returns
+        -------
+        Optional[:class:`float`]
+            The time to live of the route, :data:`None` if it is not
+            cacheable.
+        """
+        return self.ttls.get(get_route(route)[0])
+
+    def get(self, key: CacheKey) -> Optional[CacheEntry]:
+        """
+        Parameters
+        ----------
+        key : Tuple[:class:`str`, Tuple]
+            The key from :meth:`make_key`.
+
+        Returns
+        -------
+        Optional[:class:`~pincer.core.cache.CacheEntry`]
+            The entry, which might be stale. :data:`None` if the key is not
+            cached.
+        """
+        entry = self.__entries.get(key)
+
+        if entry is None:
+            return None
+
+        if entry.fresh:
+            self.__entries.move_to_end(key)
+        elif entry.etag is None:
+            # Without an ETag a stale entry is of no use.
+            self.__remove(key)
+            return None
+
+        return entry
+
+    def set(self, key: CacheKey, body: bytes, etag: Optional[str] = None):
+        """Stores a response body.
+
+        Parameters
+        ----------
+        key : Tuple[:class:`str`, Tuple]
+            The key from :meth:`make_key`.
+        body : :class:`bytes`
+            The raw response body.
+        etag : Optional[:class:`str`]
+            The ``ETag`` header of the response. |default| :data:`None`
+        """
+        ttl = self.ttl(key[0])
+
+        if ttl is None or len(body) > self.max_size:
+            return
+
+        self.__remove(key)
+        self.__entries[key] = CacheEntry(body, monotonic() + ttl, etag)
+        self.size += len(body)
+
+        keys = self.__keys.get(key[0])
+        if keys is None:
+            keys = self.__keys[key[0]] = set()
+            for path in self.__paths(key[0]):
+                self.__resources.setdefault(path, set()).add(key[0])
+        keys.add(key)
+
+        while self.size > self.max_size:
+            self.__remove(next(iter(self.__entries)))
+
+    def refresh(self, key: CacheKey):
+        """Marks a stale entry as fresh after Discord confirmed that it was
+        not modified.
+
+        Parameters
+        ----------
+        key : Tuple[:class:`str`, Tuple]
+            The key from :meth:`make_key`.
+        """
+        entry = self.__entries.get(key)
+
+        if entry is not None:
+            entry.expires = monotonic() + (self.ttl(key[0]) or 0)
+            self.__entries.move_to_end(key)
+            self.revalidations += 1
+
+    def invalidate(self, resource: str, *, parents: bool = False) -> int:
+        """Removes a resource and all its sub resources from the cache.
+
+        Parameters
+        ----------
+        resource : :class:`str`
+            The resource, e.g. ``guilds/123`` also removes
+            ``guilds/123/roles``.
+        parents : :class:`bool`
+            Also remove the resources the given resource is part of. A
+            write to ``guilds/1/members/2/roles/3`` changes
+            ``guilds/1/members/2`` as well. |default| :data:`False`
+
+        Returns
+        -------
+        :class:`int`
+            The amount of removed entries.
+        """
+        resource = resource.split("?", 1)[0].strip("/")
+
+        resources = set(self.__resources.get(resource, ()))
+        if parents:
+            *ancestors, _ = self.__paths(resource)
+            resources.update(path for path in ancestors[1:] if path in self.__keys)
+
+        keys = [key for path in resources for key in self.__keys[path]]
+
+        for key in keys:
+            self.__remove(key)
+
+        if keys:
+            _log.debug("Invalidated %s cached responses of %s", len(keys), resource)
+
+        return len(keys)
+
+    def clear(self):
+        """Removes every entry from the cache."""
+        self.__entries.clear()
+        self.__keys.clear()
+        self.__resources.clear()
+        self.size = 0
+
+    @staticmethod
+    def __paths(resource: str):
+        parts = resource.split("/")
+        return ("/".join(parts[:idx]) for idx in range(1, len(parts) + 1))
+
+    def __remove(self, key: CacheKey):
+        entry = self.__entries.pop(key, None)
+
+        if entry is None:
+            return
+
+        self.size -= len(entry.body)
+
+        keys = self.__keys[key[0]]
+        keys.discard(key)
+
+        if keys:
+            return
+
+        del self.__keys[key[0]]
+        for path in self.__paths(key[0]):
+            resources = self.__resources[path]
+            resources.discard(key[0])
+
+            if not resources:
+                del self.__resources[path]
@@ -0,0 +1,661 @@
+# Copyright Pincer 2021-Present
+# Full MIT License can be found in `LICENSE` at the project root.
+
+"""Runs the shards of a bot in several processes of one machine.
+
+A :class:`ClusterLauncher` splits the shards in contiguous ranges and runs
+every range in a process with its own client and event loop. The launcher
+process runs a :class:`ClusterHub` which spaces the identifies of every
+shard and relays queries between the clusters::
+
+    # bot.py
+    class Bot(Client):
+        @command()
+        async def guilds(self):
+            return f"{await self.cluster.guild_count()} guilds"
+
+    if __name__ == "__main__":
+        ClusterLauncher("token", Bot).run()
+
+The clusters are started with the ``spawn`` method, so the client factory
+must be importable. Messages are exchanged as JSON lines over a Unix
+socket, so this is not available on Windows.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import stat
+import tempfile
+from asyncio import (
+    ensure_future,
+    gather,
+    get_running_loop,
+    open_unix_connection,
+    run,
+    start_unix_server,
+    wait_for,
+)
+from inspect import isawaitable
+from itertools import count
+from multiprocessing import get_context
+from typing import TYPE_CHECKING
+
+from .gateway import GatewayInfo
+from .http import HTTPClient
+from .identify import IdentifyScheduler
+from ..utils.codec import dumpb, loads
+from ..utils.shards import calculate_shard_id
+
+if TYPE_CHECKING:
+    from asyncio import AbstractServer, Future, StreamReader, StreamWriter
+    from asyncio import Task
+    from multiprocessing.process import BaseProcess
+    from typing import Any, Callable, Dict, List, Optional
+
+    from .gateway import SessionStartLimit
+    from ..client import Client
+    from ..objects.guild.guild import Guild
+    from ..utils.snowflake import Snowflake
+
+_log = logging.getLogger(__name__)
+
+#: Seconds a cluster gets to answer a query.
+QUERY_TIMEOUT = 10
+
+
+def _send(writer: StreamWriter, op: str, **kwargs):
+    writer.write(dumpb({"op": op, **kwargs}) + b"\n")
+
+
+class ClusterHub:
+    """Connects the clusters of a bot. Every shard identifies through the
+    hub, so the identifies of all clusters are spaced as Discord requires.
+
+    Parameters
+    ----------
+    path : str
+        Path of the Unix socket to listen on.
+    limit : :class:`~pincer.core.gateway.SessionStartLimit`
+        The session start limit returned by ``gateway/bot``.
+
+    Attributes
+    ----------
+    identify_scheduler : :class:`~pincer.core.identify.IdentifyScheduler`
+        Spaces the identifies of every cluster.
+    clusters : Dict[:class:`int`, List[:class:`int`]]
+        The shards of every connected cluster.
+    """
+
+    def __init__(self, path: str, limit: SessionStartLimit):
+        self.path = path
+        self.identify_scheduler = IdentifyScheduler(limit)
+        self.clusters: Dict[int, List[int]] = {}
+
+        self.__writers: Dict[int, StreamWriter] = {}
+        self.__pending: Dict[int, Future] = {}
+        self.__ids = count()
+        self.__server: Optional[AbstractServer] = None
+
+    async def start(self):
+        """|coro|
+        Starts listening on :attr:`path`. A socket file left behind by a
+        stopped hub is replaced.
+        """
+        if os.path.exists(self.path) and stat.S_ISSOCK(os.stat(self.path).st_mode):
+            os.unlink(self.path)
+
+        self.__server = await start_unix_server(self.__handle, self.path)
+        _log.info("Cluster hub listening on %s", self.path)
+
+    async def close(self):
+        """|coro|
+        Disconnects the clusters, stops listening and removes the socket
+        file.
+        """
+        if self.__server is not None:
+            self.__server.close()
+
+            for writer in self.__writers.values():
+                writer.close()
+
+            await self.__server.wait_closed()
+            self.__server = None
+
+        if os.path.exists(self.path):
+            os.unlink(self.path)
+
+    def broadcast(self, name: str, *args: Any):
+        """Calls a handler in every cluster without waiting for it.
+
+        Parameters
+        ----------
+        name : str
+            The name of the handler.
+        \\*args : Any
+            JSON serializable arguments of the handler.
+        """
+        for writer in self.__writers.values():
+            _send(writer, "call", name=name, args=args)
+
+    async def query(
+        self, name: str, *args: Any, shard: Optional[int] = None
+    ) -> List[Any]:
+        """|coro|
+        Calls a handler in the clusters and collects what it returned.
+
+        Parameters
+        ----------
+        name : str
+            The name of the handler.
+        \\*args : Any
+            JSON serializable arguments of the handler.
+        shard : Optional[int]
+            Only call the cluster which runs this shard.
+            |default| :data:`None`
+
+        Returns
+        -------
+        List[Any]
+            The results by cluster ID. Clusters which didn't answer within
+            :data:`QUERY_TIMEOUT` seconds return :data:`None`.
+        """
+        clusters = sorted(
+            cluster
+            for cluster, shards in self.clusters.items()
+            if shard is None or shard in shards
+        )
+
+        return await gather(*(self.__call(cluster, name, args) for cluster in clusters))
+
+    async def __call(self, cluster: int, name: str, args: List[Any]) -> Any:
+        writer = self.__writers.get(cluster)
+
+        if writer is None:
+            return None
+
+        call_id = next(self.__ids)
+        future = self.__pending[call_id] = get_running_loop().create_future()
+        _send(writer, "call", id=call_id, name=name, args=args)
+
+        try:
+            return await wait_for(future, QUERY_TIMEOUT)
+        except Exception as e:
+            _log.warning("Cluster %s did not answer %s: %r", cluster, name, e)
+            return None
+        finally:
+            self.__pending.pop(call_id, None)
+
+    async def __reply(self, writer: StreamWriter, request_id: int, coro):
+        _send(writer, "reply", id=request_id, result=await coro)
+
+    async def __handle(self, reader: StreamReader, writer: StreamWriter):
+        cluster: Optional[int] = None
+
+        try:
+            while line := await reader.readline():
+                message: Dict[str, Any] = loads(line)
+                op = message["op"]
+
+                # Requests which wait run in tasks, the cluster may answer
+                # a call of the hub in the meantime.
+                if op == "hello":
+                    cluster = message["cluster"]
+                    self.clusters[cluster] = message["shards"]
+                    self.__writers[cluster] = writer
+                    self.identify_scheduler.expected = sum(
+                        map(len, self.clusters.values())
+                    )
+                    _log.info(
+                        "Cluster %s connected with shards %s",
+                        cluster,
+                        message["shards"],
+                    )
+                elif op == "identify":
+                    ensure_future(
+                        self.__reply(
+                            writer,
+                            message["id"],
+                            self.identify_scheduler.acquire(message["shard"]),
+                        )
+                    )
+                elif op == "ready":
+                    self.identify_scheduler.mark_ready(message["shard"])
+                elif op == "query":
+                    ensure_future(
+                        self.__reply(
+                            writer,
+                            message["id"],
+                            self.query(
+                                message["name"],
+                                *message["args"],
+                                shard=message.get("shard"),
+                            ),
+                        )
+                    )
+                elif op == "broadcast":
+                    self.broadcast(message["name"], *message["args"])
+                elif op == "result":
+                    future = self.__pending.get(message["id"])
+
+                    if future is not None and not future.done():
+                        future.set_result(message["result"])
+        except ConnectionError:
+            pass
+        finally:
+            if cluster is not None and self.__writers.get(cluster) is writer:
+                _log.warning("Cluster %s disconnected", cluster)
+                del self.__writers[cluster]
+                del self.clusters[cluster]
+
+            writer.close()
+
+
+class ClusterClient:
+    """The connection of one cluster to the
+    :class:`~pincer.core.cluster.ClusterHub`. Available as ``client.cluster``
+    in a process started by the :class:`~pincer.core.cluster.ClusterLauncher`.
+
+    Parameters
+    ----------
+    path : str
+        Path of the hub's Unix socket.
+    cluster_id : int
+        The ID of this cluster.
+    client : :class:`~pincer.client.Client`
+        The client of this cluster.
+
+    Attributes
+    ----------
+    handlers : Dict[:class:`str`, Callable[..., Any]]
+        The functions other clusters can call by name, those may be
+        coroutine functions and must return something JSON serializable.
+        ``guild_count`` and ``get_guild`` are registered by default.
+    """
+
+    def __init__(self, path: str, cluster_id: int, client: Client):
+        self.path = path
+        self.cluster_id = cluster_id
+        self.client = client
+        self.handlers: Dict[str, Callable[..., Any]] = {
+            "guild_count": self.__guild_count,
+            "get_guild": self.__get_guild,
+        }
+        self.num_shards: int = 1
+
+        self.__writer: Optional[StreamWriter] = None
+        self.__listener: Optional[Task] = None
+        self.__pending: Dict[int, Future] = {}
+        self.__ids = count()
+
+    @property
+    def connected(self) -> bool:
+        """:class:`bool`: Whether the hub is reachable."""
+        return self.__writer is not None
+
+    async def connect(self, shards: List[int], num_shards: int):
+        """|coro|
+        Connects to the hub.
+
+        Parameters
+        ----------
+        shards : List[int]
+            The shards this cluster runs.
+        num_shards : int
+            The amount of shards of every cluster, guilds are routed to the
+            cluster of their shard with it.
+
+        Raises
+        ------
+        :class:`OSError`
+            The hub is not running.
+        """
+        self.num_shards = num_shards
+        reader, self.__writer = await open_unix_connection(self.path)
+        self.__listener = ensure_future(self.__listen(reader))
+        _send(self.__writer, "hello", cluster=self.cluster_id, shards=shards)
+
+    async def request(self, op: str, **kwargs) -> Any:
+        """|coro|
+        Sends a request to the hub and waits for its reply.
+
+        Raises
+        ------
+        :class:`ConnectionError`
+            The hub is not reachable.
+        """
+        if not self.connected:
+            raise ConnectionError("Not connected to the cluster hub")
+
+        request_id = next(self.__ids)
+        future = self.__pending[request_id] = get_running_loop().create_future()
+        _send(self.__writer, op, id=request_id, **kwargs)
+        return await future
+
+    def send(self, op: str, **kwargs):
+        """Sends a message to the hub, if it is reachable."""
+        if self.connected:
+            _send(self.__writer, op, **kwargs)
+
+    async def query(
+        self, name: str, *args: Any, shard: Optional[int] = None
+    ) -> List[Any]:
+        """|coro|
+        Calls a handler in the clusters, including this one.
+
+        Parameters
+        ----------
+        name : str
+            The name of the handler.
+        \\*args : Any
+            JSON serializable arguments of the handler.
+        shard : Optional[int]
+            Only call the cluster which runs this shard.
+            |default| :data:`None`
+
+        Returns
+        -------
+        List[Any]
+            The results by cluster ID, :data:`None` for clusters which
+            didn't answer.
+        """
+        return await self.request("query", name=name, args=args, shard=shard)
+
+    def broadcast(self, name: str, *args: Any):
+        """Calls a handler in every cluster, including this one, without
+        waiting for it.
+
+        Parameters
+        ----------
+        name : str
+            The name of the handler.
+        \\*args : Any
+            JSON serializable arguments of the handler.
+        """
+        self.send("broadcast", name=name, args=args)
+
+    async def guild_count(self) -> int:
+        """|coro|
+        Returns
+        -------
+        int
+            The amount of guilds of every cluster.
+        """
+        return sum(filter(None, await self.query("guild_count")))
+
+    async def get_guild(self, guild_id: Snowflake) -> Optional[Guild]:
+        """|coro|
+        Gets a guild from the cache of the cluster which runs its shard.
+
+        Parameters
+        ----------
+        guild_id : :class:`~pincer.utils.snowflake.Snowflake`
+            The ID of the guild.
+
+        Returns
+        -------
+        Optional[:class:`~pincer.objects.guild.guild.Guild`]
+            The guild, :data:`None` if it is not cached.
+        """
+        from ..objects.guild.guild import Guild
+
+        shard = calculate_shard_id(int(guild_id), self.num_shards)
+        results = await self.query("get_guild", str(guild_id), shard=shard)
+        data = next(filter(None, results), None)
+        return data and Guild.from_dict(data)
+
+    def __guild_count(self) -> int:
+        from ..objects.guild.guild import Guild
+
+        # Unavailable guilds are kept as `None` until their GUILD_CREATE.
+        return len(
+            {
+                guild.id
+                for guild in self.client.guilds.values()
+                if isinstance(guild, Guild)
+            }
+        )
+
+    def __get_guild(self, guild_id: str) -> Optional[Dict[str, Any]]:
+        guild = self.client.guilds.get(int(guild_id))
+        return guild and guild.to_dict()
+
+    async def __call(self, message: Dict[str, Any]):
+        handler = self.handlers.get(message["name"])
+        result = None
+
+        if handler is None:
+            _log.warning("No cluster handler named %s", message["name"])
+        else:
+            try:
+                result = handler(*message["args"])
+
+                if isawaitable(result):
+                    result = await result
+            except Exception:
+                _log.exception("Cluster handler %s failed", message["name"])
+                result = None
+
+        if "id" in message:
+            self.send("result", id=message["id"], result=result)
+
+    async def __listen(self, reader: StreamReader):
+        try:
+            while line := await reader.readline():
+                message: Dict[str, Any] = loads(line)
+
+                if message["op"] == "call":
+                    ensure_future(self.__call(message))
+                    continue
+
+                future = self.__pending.pop(message["id"], None)
+
+                if future is not None and not future.done():
+                    future.set_result(message["result"])
+        finally:
+            if self.__writer is not None:
+                _log.warning("Lost the cluster hub")
+
+            self.__writer = None
+
+            for future in self.__pending.values():
+                if not future.done():
+                    future.set_exception(ConnectionError())
+
+            self.__pending.clear()
+
+    async def close(self):
+        """|coro|
+        Disconnects from the hub.
+        """
+        writer, self.__writer = self.__writer, None
+
+        if self.__listener is not None:
+            self.__listener.cancel()
+
+        if writer is not None:
+            writer.close()
+            await writer.wait_closed()
+
+
+class ClusterIdentifyScheduler(IdentifyScheduler):
+    """Identifies the shards of a cluster through the
+    :class:`~pincer.core.cluster.ClusterHub`. Falls back to spacing the
+    identifies locally while the hub can't be reached.
+
+    Parameters
+    ----------
+    limit : :class:`~pincer.core.gateway.SessionStartLimit`
+        The session start limit returned by ``gateway/bot``.
+    cluster : :class:`~pincer.core.cluster.ClusterClient`
+        The connection to the hub.
+    """
+
+    def __init__(self, limit: SessionStartLimit, cluster: ClusterClient):
+        super().__init__(limit)
+        self.cluster = cluster
+
+    async def acquire(self, shard: int):
+        try:
+            await self.cluster.request("identify", shard=shard)
+        except ConnectionError:
+            return await super().acquire(shard)
+
+        self.identified.add(shard)
+        self.ready.discard(shard)
+
+    def mark_ready(self, shard: int):
+        super().mark_ready(shard)
+        self.cluster.send("ready", shard=shard)
+
+
+def _run_cluster(
+    factory: Callable[[str], Client],
+    token: str,
+    path: str,
+    cluster_id: int,
+    shards: List[int],
+    num_shards: int,
+):
+    client = factory(token)
+    client.cluster = ClusterClient(path, cluster_id, client)
+    client.loop.run_until_complete(client.cluster.connect(shards, num_shards))
+    client.identify_scheduler = ClusterIdentifyScheduler(
+        client.gateway.session_start_limit, client.cluster
+    )
+    client.run_shards(shards, num_shards)
+
+
+class ClusterLauncher:
+    """Runs the shards of a bot in several processes.
+
+    Parameters
+    ----------
+    token : str
+        The token of the bot.
+    factory : Callable[[:class:`str`], :class:`~pincer.client.Client`]
+        Creates the client of a cluster from the token, usually the class
+        of the bot. Must be importable by the cluster processes.
+    clusters : Optional[int]
+        Amount of processes, never more than there are shards.
+        |default| the amount of CPU cores
+    num_shards : Optional[int]
+        The total amount of shards.
+        |default| the amount recommended by Discord
+    path : Optional[str]
+        Path of the hub's Unix socket.
+        |default| a file in the temporary directory
+
+    Attributes
+    ----------
+    processes : Dict[:class:`int`, :class:`multiprocessing.Process`]
+        The processes by cluster ID.
+    hub : Optional[:class:`~pincer.core.cluster.ClusterHub`]
+        The hub of the clusters, once they are started.
+    """
+
+    def __init__(
+        self,
+        token: str,
+        factory: Callable[[str], Client],
+        *,
+        clusters: Optional[int] = None,
+        num_shards: Optional[int] = None,
+        path: Optional[str] = None,
+    ):
+        self.token = token
+        self.factory = factory
+        self.clusters = clusters or os.cpu_count() or 1
+        self.num_shards = num_shards
+        self.path = path or os.path.join(
+            tempfile.gettempdir(), f"pincer-cluster-{os.getpid()}.sock"
+        )
+
+        self.processes: Dict[int, BaseProcess] = {}
+        self.hub: Optional[ClusterHub] = None
+
+    def shard_ranges(self, num_shards: int) -> List[range]:
+        """
+        Parameters
+        ----------
+        num_shards : int
+            The total amount of shards.
+
+        Returns
+        -------
+        List[:class:`range`]
+            The shards of every cluster, the sizes differ by one at most.
+        """
+        clusters = max(1, min(self.clusters, num_shards))
+        size, extra = divmod(num_shards, clusters)
+        ranges = []
+        start = 0
+
+        for cluster in range(clusters):
+            end = start + size + (cluster < extra)
+            ranges.append(range(start, end))
+            start = end
+
+        return ranges
+
+    def run(self):
+        """Starts the clusters and waits until every cluster stopped."""
+        try:
+            run(self.__run())
+        except KeyboardInterrupt:
+            _log.info("Clusters stopped")
+
+    async def __run(self):
+        http = HTTPClient(self.token)
+
+        try:
+            info = GatewayInfo.from_dict(await http.get("gateway/bot"))
+        finally:
+            await http.close()
+
+        num_shards = self.num_shards or info.shards
+        self.hub = ClusterHub(self.path, info.session_start_limit)
+        await self.hub.start()
+
+        context = get_context("spawn")
+
+        try:
+            for cluster, shards in enumerate(self.shard_ranges(num_shards)):
+                process = self.processes[cluster] = context.Process(
+                    target=_run_cluster,
+                    args=(
+                        self.factory,
+                        self.token,
+                        self.path,
+                        cluster,
+                        list(shards),
+                        num_shards,
+                    ),
+                    name=f"pincer-cluster-{cluster}",
+                )
+                process.start()
+                _log.info(
+                    "Started cluster %s with shards %s to %s",
+                    cluster,
+                    shards.start,
+                    shards.stop - 1,
+                )
+
+            loop = get_running_loop()
+            await gather(
+                *(
+                    loop.run_in_executor(None, process.join)
+                    for process in self.processes.values()
+                )
+            )
+        finally:
+            # On an interrupt, the clusters received it as well and are
+            # shutting down.
+            for process in self.processes.values():
+                process.join(10)
+
+                if process.is_alive():
+                    process.terminate()
+
+            await self.hub.close()
@@ -0,0 +1,152 @@
+# Copyright Pincer 2021-Present
+# Full MIT License can be found in `LICENSE` at the project root.
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from aiohttp import ClientSession, TCPConnector
+
+from . import __package__
+
+if TYPE_CHECKING:
+    from typing import Optional
+
+_log = logging.getLogger(__package__)
+
+AIODNS_IMPORT = True
+BROTLI_IMPORT = True
+
+try:
+    from aiohttp import AsyncResolver
+    import aiodns  # noqa: F401
+except (ModuleNotFoundError, ImportError):
+    AIODNS_IMPORT = False
+
+try:
+    import brotli  # noqa: F401
+except (ModuleNotFoundError, ImportError):
+    BROTLI_IMPORT = False
+
+
+@dataclass
+class ConnectionConfig:
+    """Settings of the connection pool shared by the REST client, the
+    gateway shards and CDN fetches.
+
+    Attributes
+    ----------
+    limit : :class:`int`
+        Maximum amount of simultaneous connections, ``0`` for no limit.
+        Every shard keeps one websocket connection open.
+        |default| ``0``
+    limit_per_host : :class:`int`
+        Maximum amount of simultaneous connections to the same host, e.g.
+        ``discord.com``. ``0`` for no limit. |default| ``50``
+    keepalive_timeout : :class:`float`
+        Seconds an idle connection is kept open for reuse. |default| ``60``
+    ttl_dns_cache : Optional[:class:`int`]
+        Seconds a DNS lookup is cached, :data:`None` to cache forever.
+        |default| ``300``
+    use_aiodns : :class:`bool`
+        Resolve hosts with ``aiodns`` instead of a thread pool when it is
+        installed. |default| :data:`True`
+    use_brotli : :class:`bool`
+        Accept Brotli compressed responses when ``Brotli`` is installed.
+        |default| :data:`True`
+    """
+
+    limit: int = 0
+    limit_per_host: int = 50
+    keepalive_timeout: float = 60
+    ttl_dns_cache: Optional[int] = 300
+    use_aiodns: bool = True
+    use_brotli: bool = True
+
+    @property
+    def accept_encoding(self) -> str:
+        """:class:`str`: The value of the ``Accept-Encoding`` header."""
+        return "gzip, deflate" + ", br" * (self.use_brotli and BROTLI_IMPORT)
+
+
+class ConnectionPool:
+    """Owns the :class:`aiohttp.ClientSession` that every connection of a
+    client goes through, so TLS sessions and sockets are reused.
+
+    The session has no authorization headers, those are added per request
+    by the :class:`~pincer.core.http.HTTPClient`. This makes it safe to use
+    for CDN fetches.
+
+    Parameters
+    ----------
+    config : Optional[:class:`~pincer.core.connection.ConnectionConfig`]
+        The pool settings. |default| ``ConnectionConfig()``
+
+    Attributes
+    ----------
+    config : :class:`~pincer.core.connection.ConnectionConfig`
+        The pool settings.
+    """
+
+    def __init__(self, config: Optional[ConnectionConfig] = None):
+        self.config: ConnectionConfig = config or ConnectionConfig()
+        self.__session: Optional[ClientSession] = None
+
+    @property
+    def session(self) -> ClientSession:
+        """:class:`aiohttp.ClientSession`: The shared session, it is created
+        on first use."""
+        if self.__session is None or self.__session.closed:
+            self.__session = self.__create_session()
+
+        return self.__session
+
+    @property
+    def closed(self) -> bool:
+        """:class:`bool`: Whether the pool has no open session."""
+        return self.__session is None or self.__session.closed
+
+    def __create_session(self) -> ClientSession:
+        resolver = None
+        if self.config.use_aiodns and AIODNS_IMPORT:
+            resolver = AsyncResolver()
+
+        connector = TCPConnector(
+            limit=self.config.limit,
+            limit_per_host=self.config.limit_per_host,
+            keepalive_timeout=self.config.keepalive_timeout,
+            ttl_dns_cache=self.config.ttl_dns_cache,
+            resolver=resolver,
+        )
+
+        _log.debug(
+            "Opening connection pool (limit=%s, limit_per_host=%s, aiodns=%s,"
+            " brotli=%s)",
+            self.config.limit,
+            self.config.limit_per_host,
+            resolver is not None,
+            self.config.use_brotli and BROTLI_IMPORT,
+        )
+
+        return ClientSession(
+            connector=connector,
+            headers={"Accept-Encoding": self.config.accept_encoding},
+        )
+
+    async def close(self):
+        """|coro|
+
+        Closes the session and every pooled connection.
+        """
+        if self.__session is not None:
+            await self.__session.close()
+            self.__session = None
+
+    # for with block
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
@@ -0,0 +1,262 @@
+# Copyright Pincer 2021-Present
+# Full MIT License can be found in `LICENSE` at the project root.
+
+"""Shares rate limits between the processes of one machine.
+
+One process runs a :class:`RateLimitCoordinator`, every process which uses
+the token passes a :class:`SharedRateLimitState` to its client. The
+coordinator can also be run on its own with::
+
+    python -m pincer.core.coordinator /tmp/pincer-ratelimit.sock
+
+The requests are exchanged as JSON lines over a Unix socket, so this is not
+available on Windows.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import stat
+import sys
+from asyncio import (
+    Lock,
+    ensure_future,
+    get_running_loop,
+    open_unix_connection,
+    run,
+    start_unix_server,
+)
+from itertools import count
+from time import monotonic
+from typing import TYPE_CHECKING
+
+from .ratelimit_state import LocalRateLimitState
+from ..utils.codec import dumpb, loads
+
+if TYPE_CHECKING:
+    from asyncio import AbstractServer, Future, StreamReader, StreamWriter
+    from asyncio import Task
+    from typing import Any, Dict, Optional, Tuple
+
+_log = logging.getLogger(__name__)
+
+#: Seconds to fall back to the local state after the coordinator could not
+#: be reached.
+RECONNECT_DELAY = 5
+
+
+class RateLimitCoordinator:
+    """Owns the rate limit counters of every connected process. Requests
+    are handled one at a time, which makes every reservation atomic.
+
+    Parameters
+    ----------
+    path : str
+        Path of the Unix socket to listen on.
+
+    Attributes
+    ----------
+    state : :class:`~pincer.core.ratelimit_state.LocalRateLimitState`
+        The counters shared by the connected processes.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.state = LocalRateLimitState()
+        self.__server: Optional[AbstractServer] = None
+
+    async def start(self):
+        """|coro|
+        Starts listening on :attr:`path`. A socket file left behind by a
+        stopped coordinator is replaced.
+        """
+        if os.path.exists(self.path) and stat.S_ISSOCK(os.stat(self.path).st_mode):
+            os.unlink(self.path)
+
+        self.__server = await start_unix_server(self.__handle, self.path)
+        _log.info("Rate limit coordinator listening on %s", self.path)
+
+    async def serve_forever(self):
+        """|coro|
+        Starts the coordinator and handles requests until it is cancelled.
+        """
+        if self.__server is None:
+            await self.start()
+
+        async with self.__server:
+            await self.__server.serve_forever()
+
+    async def close(self):
+        """|coro|
+        Stops listening and removes the socket file.
+        """
+        if self.__server is not None:
+            self.__server.close()
+            await self.__server.wait_closed()
+            self.__server = None
+
+        if os.path.exists(self.path):
+            os.unlink(self.path)
+
+    async def __handle(self, reader: StreamReader, writer: StreamWriter):
+        try:
+            while line := await reader.readline():
+                message: Dict[str, Any] = loads(line)
+                op = message["op"]
+
+                if op == "reserve":
+                    wait, scope = await self.state.reserve(
+                        message["key"], message["global"]
+                    )
+                    writer.write(
+                        dumpb({"id": message["id"], "wait": wait, "scope": scope})
+                        + b"\n"
+                    )
+                elif op == "update":
+                    self.state.update(*message["args"])
+                elif op == "pause":
+                    self.state.pause(*message["args"])
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+
+class SharedRateLimitState(LocalRateLimitState):
+    """Reserves requests through a
+    :class:`~pincer.core.coordinator.RateLimitCoordinator`.
+
+    The buckets of responses received by this process are kept locally as
+    well, those are used for wait estimations and while the coordinator
+    can't be reached.
+
+    Parameters
+    ----------
+    path : str
+        Path of the coordinator's Unix socket.
+    """
+
+    def __init__(self, path: str):
+        super().__init__()
+        self.path = path
+
+        self.__writer: Optional[StreamWriter] = None
+        self.__listener: Optional[Task] = None
+        self.__pending: Dict[int, Future] = {}
+        self.__ids = count()
+        self.__retry_at: float = 0
+        self.__connect_lock = Lock()
+
+    @property
+    def connected(self) -> bool:
+        """:class:`bool`: Whether the coordinator is reachable."""
+        return self.__writer is not None
+
+    async def connect(self):
+        """|coro|
+        Connects to the coordinator. This is done on the first reservation
+        if it wasn't called before.
+
+        Raises
+        ------
+        :class:`OSError`
+            The coordinator is not running.
+        """
+        reader, self.__writer = await open_unix_connection(self.path)
+        self.__listener = ensure_future(self.__listen(reader))
+        _log.info("Connected to the rate limit coordinator at %s", self.path)
+
+    async def __listen(self, reader: StreamReader):
+        try:
+            while line := await reader.readline():
+                message: Dict[str, Any] = loads(line)
+                future = self.__pending.pop(message["id"], None)
+
+                if future is not None and not future.done():
+                    future.set_result((message["wait"], message["scope"]))
+        finally:
+            if self.__writer is not None:
+                _log.warning(
+                    "Lost the rate limit coordinator, using local rate limits."
+                )
+
+            self.__writer = None
+            self.__retry_at = monotonic() + RECONNECT_DELAY
+
+            for future in self.__pending.values():
+                if not future.done():
+                    future.set_exception(ConnectionError())
+
+            self.__pending.clear()
+
+    def __send(self, op: str, **kwargs):
+        self.__writer.write(dumpb({"op": op, **kwargs}) + b"\n")
+
+    async def reserve(
+        self, key: Optional[str], global_limit: Optional[int]
+    ) -> Tuple[float, Optional[str]]:
+        if not self.connected and monotonic() >= self.__retry_at:
+            async with self.__connect_lock:
+                if not self.connected and monotonic() >= self.__retry_at:
+                    try:
+                        await self.connect()
+                    except OSError as e:
+                        _log.warning(
+                            "Could not reach the rate limit coordinator at" " %s: %s",
+                            self.path,
+                            e,
+                        )
+                        self.__retry_at = monotonic() + RECONNECT_DELAY
+
+        if not self.connected:
+            return await super().reserve(key, global_limit)
+
+        request_id = next(self.__ids)
+        future = self.__pending[request_id] = get_running_loop().create_future()
+        self.__send("reserve", id=request_id, key=key, **{"global": global_limit})
+
+        try:
+            wait, scope = await future
+        except ConnectionError:
+            return await super().reserve(key, global_limit)
+
+        bucket = self.buckets.get(key)
+        if not wait and bucket:
+            bucket.remaining -= 1
+
+        return wait, scope
+
+    def update(
+        self,
+        key: str,
+        limit: int,
+        remaining: int,
+        reset: float,
+        reset_after: float,
+    ):
+        super().update(key, limit, remaining, reset, reset_after)
+
+        if self.connected:
+            self.__send("update", args=[key, limit, remaining, reset, reset_after])
+
+    def pause(self, key: Optional[str], retry_after: float):
+        super().pause(key, retry_after)
+
+        if self.connected:
+            self.__send("pause", args=[key, retry_after])
+
+    async def close(self):
+        writer, self.__writer = self.__writer, None
+
+        if self.__listener is not None:
+            self.__listener.cancel()
+
+        if writer is not None:
+            writer.close()
+            await writer.wait_closed()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    run(RateLimitCoordinator(sys.argv[1]).serve_forever())
@@ -4,11 +4,18 @@
 
 from __future__ import annotations
 
-from json import dumps, loads
+import re
 from typing import TYPE_CHECKING
 
+from ..utils.codec import dumps, loads
+
 if TYPE_CHECKING:
-    from typing import Any, Dict, Optional, Union
+    from typing import Any, Dict, Optional, Tuple, Union
+
+# Discord sends the envelope of a dispatch before its data, which lets the
+# event name and sequence be read without decoding the data.
+_ENVELOPE = re.compile(rb'\{"t":"([A-Z_]+)","s":(\d+),"op":0,')
+_ENVELOPE_STR = re.compile(_ENVELOPE.pattern.decode())
 
 
 class GatewayDispatch:
@@ -45,14 +52,15 @@ class GatewayDispatch:
         )
 
     @classmethod
-    def from_string(cls, payload: str) -> GatewayDispatch:
+    def from_string(cls, payload: Union[str, bytes]) -> GatewayDispatch:
         """Parses a given payload from a string format
         and returns a GatewayDispatch.
 
         Parameters
         ----------
-        payload : :class:`str`
-            The payload to parse.
+        payload : Union[:class:`str`, :class:`bytes`]
+            The payload to parse. Decompressed payloads are passed as
+            :class:`bytes` and decoded without an intermediate string.
 
         Returns
         -------
@@ -66,3 +74,27 @@ class GatewayDispatch:
             payload.get("s"),
             payload.get("t"),
         )
+
+
+def peek_dispatch(payload: Union[str, bytes]) -> Optional[Tuple[str, int]]:
+    """Reads the event name and sequence of a dispatch without decoding
+    it.
+
+    Parameters
+    ----------
+    payload : Union[:class:`str`, :class:`bytes`]
+        The payload as received from the gateway.
+
+    Returns
+    -------
+    Optional[Tuple[:class:`str`, :class:`int`]]
+        The event name and sequence number, :data:`None` if the payload
+        isn't a dispatch or its envelope isn't in the expected order.
+    """
+    pattern = _ENVELOPE if isinstance(payload, bytes) else _ENVELOPE_STR
+
+    if match := pattern.match(payload):
+        name, seq = match.groups()
+        return (name.decode() if isinstance(name, bytes) else name), int(seq)
+
+    return None
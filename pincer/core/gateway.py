@@ -6,13 +6,13 @@ from __future__ import annotations
 
 from asyncio import create_task, Task, ensure_future, sleep
 from dataclasses import dataclass
+from functools import partial
 from datetime import datetime
 from itertools import repeat, count, chain
 import logging
 from platform import system
 from random import random
-from typing import TYPE_CHECKING, Any, Dict, Callable, Optional
-from zlib import decompressobj
+from typing import TYPE_CHECKING, Dict, Callable, Optional, Set, Union
 
 from aiohttp import (
     ClientSession,
@@ -24,7 +24,15 @@ from aiohttp import (
 from . import __package__
 from ..utils.api_object import APIObject
 from .._config import GatewayConfig
-from ..core.dispatch import GatewayDispatch
+from ..core.dispatch import GatewayDispatch, peek_dispatch
+from .health import SESSION_CLOSE_CODES, ShardHealth
+from .inflator import Inflator
+from .member_requests import MemberRequests
+from .outbound import OutboundQueue
+from .pipeline import DispatchPipeline, dispatch_key
+from .recorder import BINARY, CONNECT, TEXT
+from .retry import RetryPolicy
+from .session import GatewaySession
 from ..exceptions import (
     InvalidTokenError,
     GatewayConnectionError,
@@ -34,14 +42,16 @@ from ..exceptions import (
 
 if TYPE_CHECKING:
     from ..objects.app.intents import Intents
+    from .connection import ConnectionPool
+    from .identify import IdentifyScheduler
+    from .pipeline import PipelineConfig
+    from .recorder import GatewayRecorder
+    from .session import SessionStore
 
     Handler = Callable[[GatewayDispatch], None]
 
 _log = logging.getLogger(__package__)
 
-ZLIB_SUFFIX = b"\x00\x00\xff\xff"
-inflator = decompressobj()
-
 
 @dataclass
 class SessionStartLimit(APIObject):
@@ -88,7 +98,22 @@ class Gateway:
         Number used to route traffic to the current. This should usually be the total
         number of shards that will be run. More information at
         `<https://discord.com/developers/docs/topics/gateway#sharding>`_.
-    """
+    pool : Optional[:class:`~pincer.core.connection.ConnectionPool`]
+        The connection pool to open the websocket with. A private session is
+        used if omitted. |default| :data:`None`
+    pipeline_config : Optional[:class:`~pincer.core.pipeline.PipelineConfig`]
+        Settings of the pipeline which handles the dispatches of this shard.
+        |default| ``PipelineConfig()``
+    identify_scheduler : Optional[:class:`~pincer.core.identify.IdentifyScheduler`]
+        Spaces the identifies of the shards of the bot. The shard identifies
+        right away if omitted. |default| :data:`None`
+    session_store : Optional[:class:`~pincer.core.session.SessionStore`]
+        Saves the session so the shard resumes it after a restart.
+        |default| :data:`None`
+    recorder : Optional[:class:`~pincer.core.recorder.GatewayRecorder`]
+        Records the received frames to replay them later.
+        |default| :data:`None`
+    """  # noqa: E501
 
     def __init__(
         self,
@@ -98,6 +123,11 @@ class Gateway:
         url: str,
         shard: int,
         num_shards: int,
+        pool: Optional[ConnectionPool] = None,
+        pipeline_config: Optional[PipelineConfig] = None,
+        identify_scheduler: Optional[IdentifyScheduler] = None,
+        session_store: Optional[SessionStore] = None,
+        recorder: Optional[GatewayRecorder] = None,
     ) -> None:
         self.token = token
         self.intents = intents
@@ -114,9 +144,9 @@ class Gateway:
             11: self.handle_heartbeat,
         }
 
-        # 4000 and 4009 are not included. The client will reconnect when receiving
-        # either. Code 4000 is also used for internal disconnects that will lead to a
-        # reconnect.
+        # 4000, 4007 and 4009 are not included. The client will reconnect when
+        # receiving any of them, after 4007 and 4009 with a new session. Code 4000
+        # is also used for internal disconnects that will lead to a reconnect.
         self.__close_codes: Dict[int, GatewayError] = {
             4001: GatewayError("Invalid opcode was sent"),
             4002: GatewayError("Invalid payload was sent."),
@@ -125,9 +155,6 @@ class Gateway:
             4005: GatewayError(
                 "Authentication was sent after client already authenticated"
             ),
-            4007: GatewayError(
-                "Invalid sequence sent when starting new session"
-            ),
             4008: GatewayError("Client was rate limited"),
             4010: GatewayError("Invalid shard"),
             4011: GatewayError("Sharding required"),
@@ -136,15 +163,39 @@ class Gateway:
             4014: GatewayError("Disallowed intents"),
         }
 
-        # ClientSession to be used for this Dispatcher
+        # ClientSession to be used for this Dispatcher. Sessions of a shared
+        # pool are closed by their owner.
+        self.__pool: Optional[ConnectionPool] = pool
         self.__session: Optional[ClientSession] = None
 
         # This type `_WSRequestContextManager` isn't exposed by aiohttp.
         # `ClientWebSocketResponse` is a parent class.
         self.__socket: Optional[ClientWebSocketResponse] = None
 
-        # Buffer used to store information in transport compression.
-        self.__buffer = bytearray()
+        # Decompresses the messages of this shard, transport compression
+        # keeps a zlib context per connection.
+        self.inflator = Inflator(GatewayConfig.compression)
+
+        # Handles the dispatches of this shard in order per guild, reading
+        # from the websocket waits while it is full.
+        self.pipeline = DispatchPipeline(pipeline_config)
+        self.identify_scheduler = identify_scheduler
+
+        # Commands sent to Discord, limited per connection.
+        self.outbound = OutboundQueue(self.__write)
+
+        # Guild member requests waiting for their chunks.
+        self.member_requests = MemberRequests()
+
+        # Latency and connection state, used by the shard supervisor.
+        self.health = ShardHealth()
+        self.reconnect_policy = RetryPolicy(base_delay=1, max_delay=60)
+
+        # Decides by the event name whether a dispatch is handled, others
+        # are dropped before their data is decoded. Set by the client.
+        self.event_filter: Optional[Callable[[str], bool]] = None
+        self.session_store = session_store
+        self.recorder = recorder
 
         # The gateway can be disconnected from Discord. This variable stores if the
         # gateway should send a hello or reconnect.
@@ -153,6 +204,10 @@ class Gateway:
         # The sequence number for the last received payload. This is used reconnecting.
         self.__sequence_number: int = 0
 
+        # Sequence numbers of the dispatches the pipeline hasn't handled yet,
+        # the saved session resumes from before the oldest one.
+        self.__unhandled: Set[int] = set()
+
         # The heartbeat task
         self.__heartbeat_task: Optional[Task] = None
 
@@ -172,19 +227,36 @@ class Gateway:
         # middleware. This is used reconnecting.
         self.__session_id: Optional[str] = None
 
+        # Resumes connect to the url received with the session.
+        self.__resume_url: Optional[str] = None
+
+        # Set by `close` so the event loop doesn't reconnect.
+        self.__closing: bool = False
+
     def __del__(self):
         """Delete method ensures all connections are closed"""
-        if self.__socket:
+        if self.__socket and not self.__socket.closed:
             create_task(self.__socket.close())
-        if self.__session:
+        if self.__session and not self.__pool:
             create_task(self.__session.close())
 
+        self.pipeline.close()
+
     async def init_session(self):
         """|coro|
         Crates the ClientSession. ALWAYS run this function right after initializing
-        a Gateway.
+        a Gateway. A session saved in the session store is resumed.
         """
-        self.__session = ClientSession()
+        self.__session = self.__pool.session if self.__pool else ClientSession()
+
+        if self.session_store and (
+            saved := self.session_store.load(self.shard_key)
+        ):
+            _log.info("%s Resuming the saved session", self.shard_key)
+            self.__session_id = saved.session_id
+            self.__sequence_number = saved.seq
+            self.__resume_url = saved.resume_url
+            self.__should_resume = True
 
     def append_handlers(self, handlers: Dict[int, Handler]):
         """The Client that uses the handler can append their own methods. The gateway
@@ -192,67 +264,169 @@ class Gateway:
         """
         self.__dispatch_handlers = {**self.__dispatch_handlers, **handlers}
 
-    def set_session_id(self, _id: str):
+    def set_session_id(self, _id: str, resume_url: Optional[str] = None):
         """Session id is private for consistency"""
         self.__session_id = _id
+        self.__resume_url = resume_url
+        self.checkpoint()
+
+        # The session id is set by the READY event.
+        if self.identify_scheduler:
+            self.identify_scheduler.mark_ready(self.shard)
+
+    @property
+    def handled_seq(self) -> int:
+        """:class:`int`: The sequence number up to which every dispatch has
+        been handled, which is saved with the session. Discord replays the
+        dispatches after it on resume."""
+        if self.__unhandled:
+            return min(self.__unhandled) - 1
+
+        return self.__sequence_number
+
+    def checkpoint(self):
+        """Saves the session in the session store, if any. This is done on
+        ``READY``, every heartbeat and :meth:`close`."""
+        if not self.session_store or not self.__session_id:
+            return
 
-    def decompress_msg(self, msg: bytes) -> Optional[str]:
-        if GatewayConfig.compression == "zlib-payload":
-            return inflator.decompress(msg)
+        try:
+            self.session_store.save(
+                self.shard_key,
+                GatewaySession(
+                    self.__session_id,
+                    self.handled_seq,
+                    self.__resume_url,
+                ),
+            )
+        except OSError as e:
+            _log.warning("%s Could not save the session: %s", self.shard_key, e)
+
+    def reset_session(self):
+        """Ends the session, the shard identifies on its next connection.
+        The session is removed from the session store as well, so it isn't
+        resumed after the process restarted either."""
+        self.__session_id = None
+        self.__resume_url = None
+        self.__sequence_number = 0
+        self.__unhandled.clear()
+        self.__should_resume = False
+
+        if not self.session_store:
+            return
 
-        if GatewayConfig.compression == "zlib-stream":
-            self.__buffer.extend(msg)
+        try:
+            self.session_store.delete(self.shard_key)
+        except OSError as e:
+            _log.warning(
+                "%s Could not remove the session: %s", self.shard_key, e
+            )
+
+    async def close(self):
+        """|coro|
+        Disconnects without ending the session. The session is saved, so
+        the shard can resume it after the process restarted. Queued
+        dispatches are dropped, the saved session resumes from before
+        them so Discord sends them again.
+        """
+        self.__closing = True
 
-            if len(self.__buffer) < 4 or self.__buffer[-4:] != ZLIB_SUFFIX:
-                return None
+        if self.__heartbeat_task:
+            self.stop_heartbeat()
 
-            msg = inflator.decompress(msg)
-            self.__buffer = bytearray()
-            return msg
+        self.checkpoint()
 
-        return None
+        if self.__socket and not self.__socket.closed:
+            # Discord ends the session on close code 1000 and 1001.
+            await self.__socket.close(code=4000)
+
+        self.outbound.close()
+        self.pipeline.close()
+
+    def decompress_msg(self, msg: bytes) -> Optional[bytes]:
+        """Decompresses a binary message of this shard.
+
+        Parameters
+        ----------
+        msg : bytes
+            The data of the websocket message.
+
+        Returns
+        -------
+        Optional[bytes]
+            The payload, :data:`None` if a ``zlib-stream`` message is not
+            complete yet.
+        """
+        return self.inflator.decompress(msg)
 
     async def start_loop(self):
         """|coro|
         Instantiate the dispatcher, this will create a connection to the
         Discord websocket API on behalf of the client whose token has
-        been passed.
+        been passed. The shard reconnects until :meth:`close` is called or
+        Discord closes the connection with an error.
         """
+        while not self.__closing:
+            await self.__connect()
+
+            _log.debug("%s Starting event loop...", self.shard_key)
+            await self.event_loop()
+
+    async def __connect(self):
+        if self.__socket and not self.__socket.closed:
+            await self.__socket.close()
+
         for _try in count():
             try:
+                url = (self.__should_resume and self.__resume_url) or self.url
                 self.__socket = await self.__session.ws_connect(
-                    GatewayConfig.make_uri(self.url)
+                    GatewayConfig.make_uri(url)
                 )
-                break
+                self.inflator.reset()
+                self.outbound.reset()
+                self.health.record_connect()
+
+                if self.recorder:
+                    # Replays reset the zlib context here as well.
+                    self.recorder.record(self, CONNECT)
+
+                return
             except ClientConnectorError as e:
                 if _try > GatewayConfig.MAX_RETRIES:
                     raise GatewayConnectionError from e
 
+                delay = self.reconnect_policy.backoff(_try + 1)
                 _log.warning(
                     "%s Could not open websocket with Discord."
-                    " Retrying in 15 seconds...",
+                    " Retrying in %.1f seconds...",
                     self.shard_key,
+                    delay,
                 )
-                await sleep(15)
-
-        _log.debug("%s Starting event loop...", self.shard_key)
-        await self.event_loop()
+                await sleep(delay)
 
     async def event_loop(self):
         """|coro|
         Handles receiving messages and decompressing them if needed
         """
         async for msg in self.__socket:
-            if msg.type == WSMsgType.TEXT:
-                await self.handle_data(msg.data)
-            elif msg.type == WSMsgType.BINARY:
-                # Message from transport compression that isn't complete returns None
-                data = self.decompress_msg(msg.data)
-                if data:
-                    await self.handle_data(data)
+            if msg.type in (WSMsgType.TEXT, WSMsgType.BINARY):
+                binary = msg.type == WSMsgType.BINARY
+
+                if self.recorder:
+                    self.recorder.record(
+                        self, BINARY if binary else TEXT, msg.data
+                    )
+
+                await self.handle_frame(msg.data, binary)
             elif msg.type == WSMsgType.ERROR:
+                self.health.record_disconnect(None)
                 raise GatewayError from self.__socket.exception()
 
+        self.health.record_disconnect(self.__socket.close_code)
+
+        if self.__closing:
+            return
+
         # The loop is broken when the gateway stops receiving messages.
         # The "error" op codes are in `self.__close_codes`. The rest of the
         # close codes are unknown issues (such as an unintended disconnect) so the
@@ -262,25 +436,73 @@ class Gateway:
         if err:
             raise err
 
+        if self.__socket.close_code in SESSION_CLOSE_CODES:
+            _log.info(
+                "%s The session can't be resumed (close code %s),"
+                " identifying again.",
+                self.shard_key,
+                self.__socket.close_code,
+            )
+            self.reset_session()
+            return
+
         _log.debug(
             "%s Disconnected from Gateway due without any errors. Reconnecting.",
             self.shard_key,
         )
-        # ensure_future prevents a stack overflow
-        ensure_future(self.start_loop())
 
-    async def handle_data(self, data: Dict[Any]):
+    async def handle_frame(self, data: Union[str, bytes], binary: bool):
+        """|coro|
+        Handles a websocket message as it was received.
+
+        Parameters
+        ----------
+        data : Union[:class:`str`, :class:`bytes`]
+            The data of the message.
+        binary : :class:`bool`
+            Whether it is a binary message, which is decompressed first.
+        """
+        if binary:
+            # Message from transport compression that isn't complete returns None
+            data = self.decompress_msg(data)
+
+            if not data:
+                return
+
+        await self.handle_data(data)
+
+    async def reconnect(self):
+        """|coro|
+        Closes the connection without ending the session, the shard
+        reconnects and resumes.
+        """
+        if not self.__socket or self.__socket.closed:
+            return
+
+        self.__should_resume = True
+
+        if self.__heartbeat_task:
+            self.stop_heartbeat()
+
+        await self.__socket.close(code=4000)
+
+    async def handle_data(self, data: Union[str, bytes]):
         """|coro|
         Method is run when a payload is received from the gateway.
         The message is expected to already have been decompressed.
-        Handling the opcode is forked to the background, so they aren't blocking.
+        Dispatches are queued in :attr:`pipeline`, other opcodes are forked
+        to the background so they aren't blocked by a busy pipeline.
         """
-        payload = GatewayDispatch.from_string(data)
+        if self.event_filter and (peeked := peek_dispatch(data)):
+            name, seq = peeked
 
-        # Op code -1 is activated on all payloads
-        op_negative_one = self.__dispatch_handlers.get(-1)
-        if op_negative_one:
-            ensure_future(op_negative_one(payload))
+            if not self.event_filter(name):
+                self.__sequence_number = seq
+                self.health.record_received(True)
+                return
+
+        payload = GatewayDispatch.from_string(data)
+        self.health.record_received(payload.op == 0)
 
         _log.debug(
             "%s %s GatewayDispatch with opcode %s received",
@@ -304,8 +526,43 @@ class Gateway:
                 f"Opcode {payload.op} does not have a handler"
             )
 
+        # Op code -1 is activated on all payloads
+        op_negative_one = self.__dispatch_handlers.get(-1)
+
+        if payload.op == 0:
+            if payload.event_name in ("READY", "RESUMED"):
+                self.outbound.open()
+
+            if payload.seq is not None:
+                self.__unhandled.add(payload.seq)
+
+            await self.pipeline.put(
+                dispatch_key(payload),
+                partial(
+                    self.__handle_dispatch, op_negative_one, handler, payload
+                ),
+            )
+            return
+
+        if op_negative_one:
+            ensure_future(op_negative_one(payload))
+
         ensure_future(handler(payload))
 
+    async def __handle_dispatch(
+        self,
+        op_negative_one: Optional[Handler],
+        handler: Handler,
+        payload: GatewayDispatch,
+    ):
+        try:
+            if op_negative_one:
+                await op_negative_one(payload)
+
+            await handler(payload)
+        finally:
+            self.__unhandled.discard(payload.seq)
+
     async def handle_heartbeat_req(self, payload: GatewayDispatch):
         """|coro|
         Opcode 1 - Instantly send a heartbeat.
@@ -338,6 +595,9 @@ class Gateway:
             "reconnect" if payload.data else "relog",
         )
 
+        if not payload.data:
+            self.reset_session()
+
         self.__should_resume = payload.data
         self.stop_heartbeat()
         await self.__socket.close()
@@ -352,45 +612,48 @@ class Gateway:
 
         Successful reconnects are handled in the `resumed` middleware.
         """
+        self.__heartbeat_interval = payload.data["heartbeat_interval"]
+        self.health.heartbeat_interval = self.__heartbeat_interval / 1000
+
         if self.__should_resume:
             _log.debug("%s Resuming connection with Discord", self.shard_key)
 
             await self.send(
-                str(
-                    GatewayDispatch(
-                        6,
-                        {
-                            "token": self.token,
-                            "session_id": self.__session_id,
-                            "seq": self.__sequence_number,
-                        },
-                    )
-                )
-            )
-            return
-
-        await self.send(
-            str(
                 GatewayDispatch(
-                    2,
+                    6,
                     {
                         "token": self.token,
-                        "intents": self.intents,
-                        "properties": {
-                            "$os": system(),
-                            "$browser": __package__,
-                            "$device": __package__,
-                        },
-                        "compress": GatewayConfig.compressed(),
-                        "shard": self.shard_key,
+                        "session_id": self.__session_id,
+                        "seq": self.__sequence_number,
                     },
                 )
             )
-        )
-        self.__heartbeat_interval = payload.data["heartbeat_interval"]
+            return
 
+        # Heartbeats are sent while the shard waits for its turn to identify.
         self.start_heartbeat()
 
+        if self.identify_scheduler:
+            await self.identify_scheduler.acquire(self.shard)
+
+        await self.send(
+            GatewayDispatch(
+                2,
+                {
+                    "token": self.token,
+                    "intents": self.intents,
+                    "properties": {
+                        "$os": system(),
+                        "$browser": __package__,
+                        "$device": __package__,
+                    },
+                    # Transport compression replaces payload compression.
+                    "compress": GatewayConfig.compression == "zlib-payload",
+                    "shard": self.shard_key,
+                },
+            )
+        )
+
     async def handle_heartbeat(self, payload: GatewayDispatch):
         """|coro|
         Opcode 11 - Heartbeat
@@ -398,10 +661,34 @@ class Gateway:
         be very mad)
         """
         self.__has_received_ack = True
+        self.health.record_ack()
 
-    async def send(self, payload: str):
+    async def send(self, payload: Union[str, GatewayDispatch]):
         """|coro|
-        Send a string object to the payload. Most of this method is just logging,
+        Sends a command through :attr:`outbound`, which keeps the connection
+        within Discord's command rate limit. Heartbeats, identifies and
+        resumes are sent ahead of other commands and queued presence and
+        voice state updates are replaced by newer ones, which requires the
+        payload to be passed as a
+        :class:`~pincer.core.dispatch.GatewayDispatch`.
+        """
+        op = key = None
+
+        if isinstance(payload, GatewayDispatch):
+            op = payload.op
+
+            if op == 3:
+                key = "presence"
+            elif op == 4 and isinstance(payload.data, dict):
+                key = ("voice_state", payload.data.get("guild_id"))
+
+            payload = str(payload)
+
+        await self.outbound.send(payload, op, key)
+
+    async def __write(self, payload: str):
+        """|coro|
+        Writes a payload to the socket. Most of this method is just logging,
         the last line is the only one that matters for functionality.
         """
         safe_payload = payload.replace(self.token, "%s..." % self.token[:10])
@@ -413,7 +700,7 @@ class Gateway:
 
         _log.debug("%s Sending payload: %s", self.shard_key, safe_payload)
 
-        if self.__socket.closed:
+        if self.__socket is None or self.__socket.closed:
             _log.debug(
                 "%s Socket is closing. Payload not sent.", self.shard_key
             )
@@ -481,7 +768,7 @@ class Gateway:
                 return
 
             self.__has_received_ack = False
-            await self.send(
-                str(GatewayDispatch(1, data=self.__sequence_number))
-            )
+            self.health.record_heartbeat()
+            await self.send(GatewayDispatch(1, data=self.__sequence_number))
             _log.debug("%s sent heartbeat", self.shard_key)
+            self.checkpoint()
@@ -0,0 +1,258 @@
+# Copyright Pincer 2021-Present
+# Full MIT License can be found in `LICENSE` at the project root.
+
+from __future__ import annotations
+
+import logging
+from asyncio import ensure_future, sleep
+from collections import deque
+from math import ceil
+from time import monotonic
+from typing import TYPE_CHECKING
+
+from . import __package__
+from .retry import RetryPolicy
+
+if TYPE_CHECKING:
+    from asyncio import Task
+    from typing import Deque, Dict, Optional
+
+    from .gateway import Gateway
+
+_log = logging.getLogger(__package__)
+
+#: Close codes caused by the configuration of the bot, restarting the shard
+#: would fail again.
+FATAL_CLOSE_CODES = frozenset({4004, 4010, 4011, 4012, 4013, 4014})
+
+#: Close codes after which the session can't be resumed, an invalid sequence
+#: and a timed out session. The shard ends the session and identifies again.
+SESSION_CLOSE_CODES = frozenset({4007, 4009})
+
+
+class ShardHealth:
+    """Tracks the connection of one shard.
+
+    Parameters
+    ----------
+    samples : :class:`int`
+        Amount of heartbeat latencies the percentiles are computed over.
+        |default| ``64``
+    degraded_latency : :class:`float`
+        95th percentile latency in seconds above which the shard is
+        degraded. |default| ``1``
+
+    Attributes
+    ----------
+    connected : :class:`bool`
+        Whether the websocket is open.
+    reconnects : :class:`int`
+        Amount of times the websocket has been opened again.
+    restarts : :class:`int`
+        Amount of times the supervisor restarted the shard.
+    heartbeat_interval : Optional[:class:`float`]
+        Seconds between heartbeats as requested by Discord.
+    close_code : Optional[:class:`int`]
+        The close code of the last connection.
+    """
+
+    def __init__(self, samples: int = 64, degraded_latency: float = 1):
+        self.degraded_latency = degraded_latency
+
+        self.connected: bool = False
+        self.reconnects: int = 0
+        self.restarts: int = 0
+        self.heartbeat_interval: Optional[float] = None
+        self.close_code: Optional[int] = None
+
+        self.__latencies: Deque[float] = deque(maxlen=samples)
+        self.__connected_once: bool = False
+        self.__heartbeat_sent: Optional[float] = None
+        self.__last_received: Optional[float] = None
+        self.__last_dispatch: Optional[float] = None
+
+    @property
+    def latency(self) -> Optional[float]:
+        """Optional[:class:`float`]: Round trip time in seconds of the last
+        acknowledged heartbeat."""
+        return self.__latencies[-1] if self.__latencies else None
+
+    def percentile(self, q: float) -> Optional[float]:
+        """
+        Parameters
+        ----------
+        q : :class:`float`
+            The percentile, between ``0`` and ``100``.
+
+        Returns
+        -------
+        Optional[:class:`float`]
+            The heartbeat latency in seconds of the recent samples,
+            :data:`None` if no heartbeat has been acknowledged yet.
+        """
+        if not self.__latencies:
+            return None
+
+        samples = sorted(self.__latencies)
+        return samples[max(0, ceil(q / 100 * len(samples)) - 1)]
+
+    @property
+    def since_last_dispatch(self) -> Optional[float]:
+        """Optional[:class:`float`]: Seconds since the last dispatch was
+        received."""
+        if self.__last_dispatch is None:
+            return None
+
+        return monotonic() - self.__last_dispatch
+
+    @property
+    def is_zombie(self) -> bool:
+        """:class:`bool`: Whether the connection is open but nothing, not
+        even a heartbeat acknowledgement, was received for two heartbeat
+        intervals."""
+        if not self.connected or not self.heartbeat_interval:
+            return False
+
+        return monotonic() - self.__last_received > 2 * self.heartbeat_interval
+
+    @property
+    def status(self) -> str:
+        """:class:`str`: ``down`` when disconnected, ``degraded`` when the
+        connection is a zombie or slow, ``healthy`` otherwise."""
+        if not self.connected:
+            return "down"
+
+        if self.is_zombie or (self.percentile(95) or 0) > self.degraded_latency:
+            return "degraded"
+
+        return "healthy"
+
+    def record_connect(self):
+        """Records that the websocket has been opened."""
+        if self.__connected_once:
+            self.reconnects += 1
+
+        self.__connected_once = True
+        self.connected = True
+        self.close_code = None
+        self.__heartbeat_sent = None
+        self.__last_received = monotonic()
+
+    def record_disconnect(self, close_code: Optional[int]):
+        """Records that the websocket has been closed."""
+        self.connected = False
+        self.close_code = close_code
+
+    def record_received(self, dispatch: bool):
+        """Records a received payload, ``dispatch`` for opcode 0."""
+        self.__last_received = monotonic()
+
+        if dispatch:
+            self.__last_dispatch = self.__last_received
+
+    def record_heartbeat(self):
+        """Records that a heartbeat has been sent."""
+        self.__heartbeat_sent = monotonic()
+
+    def record_ack(self):
+        """Records a heartbeat acknowledgement."""
+        if self.__heartbeat_sent is not None:
+            self.__latencies.append(monotonic() - self.__heartbeat_sent)
+            self.__heartbeat_sent = None
+
+
+class ShardSupervisor:
+    """Keeps the shards of a client running.
+
+    A shard which stopped because of an error is restarted with exponential
+    backoff and jitter, unless Discord closed it because of the bot's
+    configuration. A shard whose connection is a zombie is reconnected.
+
+    Parameters
+    ----------
+    policy : Optional[:class:`~pincer.core.retry.RetryPolicy`]
+        The backoff between restarts of a shard.
+        |default| ``RetryPolicy(base_delay=1, max_delay=60)``
+    interval : :class:`float`
+        Seconds between two checks for zombie connections. |default| ``10``
+
+    Attributes
+    ----------
+    shards : Dict[:class:`int`, :class:`~pincer.core.gateway.Gateway`]
+        The supervised shards by their id.
+    """
+
+    def __init__(self, policy: Optional[RetryPolicy] = None, interval: float = 10):
+        self.policy = policy or RetryPolicy(base_delay=1, max_delay=60)
+        self.interval = interval
+
+        self.shards: Dict[int, Gateway] = {}
+        self.__tasks: Dict[int, Task] = {}
+        self.__monitor: Optional[Task] = None
+
+    def watch(self, gateway: Gateway):
+        """Starts a shard and keeps it running.
+
+        Parameters
+        ----------
+        gateway : :class:`~pincer.core.gateway.Gateway`
+            The shard, its session must have been initialized.
+        """
+        self.shards[gateway.shard] = gateway
+        self.__tasks[gateway.shard] = ensure_future(self.__run(gateway))
+
+        if self.__monitor is None:
+            self.__monitor = ensure_future(self.__check_loop())
+
+    def close(self):
+        """Stops supervising, the shards should be closed separately."""
+        for task in (*self.__tasks.values(), self.__monitor):
+            if task is not None:
+                task.cancel()
+
+        self.__tasks.clear()
+        self.__monitor = None
+
+    async def __run(self, gateway: Gateway):
+        failures = 0
+
+        while True:
+            started = monotonic()
+
+            try:
+                # Only returns once the shard has been closed.
+                return await gateway.start_loop()
+            except Exception as e:
+                if gateway.health.close_code in FATAL_CLOSE_CODES:
+                    _log.error("%s Shard stopped: %r", gateway.shard_key, e)
+                    raise
+
+                # A shard which ran for a while starts over with short delays.
+                if monotonic() - started > self.policy.max_delay:
+                    failures = 0
+
+                failures += 1
+                gateway.health.restarts += 1
+                delay = self.policy.backoff(failures)
+
+                _log.warning(
+                    "%s Shard stopped: %r. Restarting in %.1f seconds...",
+                    gateway.shard_key,
+                    e,
+                    delay,
+                )
+                await sleep(delay)
+
+    async def __check_loop(self):
+        while True:
+            await sleep(self.interval)
+
+            for gateway in self.shards.values():
+                if gateway.health.is_zombie:
+                    _log.warning(
+                        "%s Nothing received for two heartbeat intervals,"
+                        " reconnecting.",
+                        gateway.shard_key,
+                    )
+                    gateway.health.restarts += 1
+                    ensure_future(gateway.reconnect())
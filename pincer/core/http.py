@@ -3,16 +3,23 @@
 from __future__ import annotations
 
 import logging
-from asyncio import sleep
-from json import dumps
+from asyncio import ensure_future, shield, sleep
+from copy import copy
+from functools import partial
+from itertools import count
+from time import monotonic
 from typing import Protocol, TYPE_CHECKING
 
-from aiohttp import ClientSession, ClientResponse
+from aiohttp import ClientConnectionError, ClientResponse
 
 # I'm open for ideas on how to get __version__ without doing this
 import pincer
 from . import __package__
-from .ratelimiter import RateLimiter
+from .cache import ResponseCache
+from .connection import ConnectionPool
+from .ratelimiter import RateLimiter, get_route
+from .retry import CircuitBreaker, RetryPolicy
+from .scheduler import Priority
 from .._config import GatewayConfig
 from ..exceptions import (
     NotFoundError,
@@ -24,20 +31,61 @@ from ..exceptions import (
     RateLimitError,
     ServerError,
     HTTPError,
+    CircuitOpenError,
+    DeadlineExceededError,
 )
+from ..utils.codec import dumpb, loads
 from ..utils.conversion import remove_none
 
 if TYPE_CHECKING:
-    from typing import Any, Dict, Optional, Union
+    from asyncio import Future
+    from typing import Any, Dict, Optional, Tuple, Union
 
     from aiohttp.client import _RequestContextManager
     from aiohttp.payload import Payload
     from aiohttp.typedefs import StrOrURL
 
+    from .cache import CacheKey
+    from .ratelimit_state import RateLimitState
+
 
 _log = logging.getLogger(__package__)
 
 
+def _render(data: Any) -> str:
+    """Renders a request or response body for the debug log."""
+    if isinstance(data, (bytes, bytearray)):
+        return data.decode(errors="replace")
+
+    return str(data)
+
+
+class _Retry(Exception):
+    """Raised by ``HTTPClient.__handle_response`` when a request failed but
+    can be sent again.
+
+    Parameters
+    ----------
+    error : :class:`~pincer.exceptions.HTTPError`
+        The error to raise when no retry is left.
+    delay : Optional[:class:`float`]
+        Seconds Discord asked to wait, :data:`None` to back off.
+    rate_limited : :class:`bool`
+        Whether the rate limiter already delays the next attempt.
+    """
+
+    def __init__(
+        self,
+        error: HTTPError,
+        delay: Optional[float] = None,
+        rate_limited: bool = False,
+    ):
+        super().__init__(error)
+        self.error = error
+        self.delay = delay
+        self.rate_limited = rate_limited
+
+
 class HttpCallable(Protocol):
     """Aiohttp HTTP method."""
 
@@ -70,7 +118,22 @@ class HTTPClient:
         The discord API version.
         See `<https://discord.com/developers/docs/reference#api-versioning>`_.
     ttl:
-        Max amount of attempts after error code 5xx
+        Max amount of attempts after error code 5xx, ignored if ``retry``
+        is passed.
+    global_limit:
+        Max amount of requests per second across all routes.
+        See `<https://discord.com/developers/docs/topics/rate-limits#global-rate-limit>`_.
+    cache:
+        Opt-in cache for read-only endpoints.
+    pool:
+        Connection pool to share with the gateway and CDN fetches. A
+        private pool is created and closed with the client if omitted.
+    retry:
+        Backoff, time budget and circuit breaker settings of retries.
+    rate_limit_state:
+        Where the rate limit counters are kept, processes which share a
+        token can share them with a
+        :class:`~pincer.core.coordinator.SharedRateLimitState`.
 
     Attributes
     ----------
@@ -79,19 +142,51 @@ class HTTPClient:
         "Base url for all HTTP requests"
     max_tts: :class:`int`
         Max amount of attempts after error code 5xx
+    retry: :class:`~pincer.core.retry.RetryPolicy`
+        The retry settings.
+    cache: Optional[:class:`~pincer.core.cache.ResponseCache`]
+        The cache for read-only endpoints, :data:`None` if disabled.
+    pool: :class:`~pincer.core.connection.ConnectionPool`
+        The connection pool requests are sent through.
+    get_requests: :class:`int`
+        Amount of GET requests that have been sent.
+    get_coalesced: :class:`int`
+        Amount of GET requests that shared the response of an identical
+        request which was already in flight.
     """
 
-    def __init__(self, token: str, *, version: int = None, ttl: int = 5):
+    def __init__(
+        self,
+        token: str,
+        *,
+        version: int = None,
+        ttl: int = 5,
+        global_limit: int = 50,
+        cache: Optional[ResponseCache] = None,
+        pool: Optional[ConnectionPool] = None,
+        retry: Optional[RetryPolicy] = None,
+        rate_limit_state: Optional[RateLimitState] = None,
+    ):
         version = version or GatewayConfig.version
         self.url: str = f"https://discord.com/api/v{version}"
-        self.max_ttl: int = ttl
-
-        headers: Dict[str, str] = {
+        self.retry: RetryPolicy = retry or RetryPolicy(max_attempts=ttl)
+        self.max_ttl: int = self.retry.max_attempts
+        self.cache: Optional[ResponseCache] = cache
+        self.pool: ConnectionPool = pool or ConnectionPool()
+        self.__owns_pool: bool = pool is None
+
+        # The pool can be shared with CDN fetches, so the authorization is
+        # added per request instead of being a session default.
+        self.__headers: Dict[str, str] = {
             "Authorization": f"Bot {token}",
             "User-Agent": f"DiscordBot (https://github.com/Pincer-org/Pincer, {pincer.__version__})",  # noqa: E501
         }
-        self.__rate_limiter = RateLimiter()
-        self.__session: ClientSession = ClientSession(headers=headers)
+        self.__rate_limiter = RateLimiter(global_limit, rate_limit_state)
+        self.__in_flight: Dict[Tuple[str, Tuple], Future] = {}
+        self.__breakers: Dict[str, CircuitBreaker] = {}
+
+        self.get_requests: int = 0
+        self.get_coalesced: int = 0
 
         self.__http_exceptions: Dict[int, HTTPError] = {
             304: NotModifiedError(),
@@ -100,7 +195,6 @@ class HTTPClient:
             403: ForbiddenError(),
             404: NotFoundError(),
             405: MethodNotAllowedError(),
-            429: RateLimitError(),
         }
 
     # for with block
@@ -113,9 +207,14 @@ class HTTPClient:
     async def close(self):
         """|coro|
 
-        Closes the aiohttp session
+        Closes the rate limit state, e.g. the connection to a rate limit
+        coordinator, and the aiohttp session, unless the connection pool was
+        passed in and is shared with other clients.
         """
-        await self.__session.close()
+        await self.__rate_limiter.state.close()
+
+        if self.__owns_pool:
+            await self.pool.close()
 
     async def __send(
         self,
@@ -125,12 +224,17 @@ class HTTPClient:
         content_type: str = "application/json",
         data: Optional[Union[Dict, str, Payload]] = None,
         headers: Optional[Dict[str, Any]] = None,
-        _ttl: Optional[int] = None,
         params: Optional[Dict] = None,
+        priority: Optional[Priority] = None,
+        deadline: Optional[float] = None,
     ) -> Optional[Dict]:
         """
         Send an api request to the Discord REST API.
 
+        Failed requests are retried according to :attr:`retry`. Server
+        errors are retried with an exponential backoff and rate limited
+        requests wait in line with the other requests of their bucket.
+
         Parameters
         ----------
 
@@ -155,60 +259,174 @@ class HTTPClient:
             The query parameters to add to the request.
             |default| :data:`None`
 
-        _ttl: Optional[:class:`int`]
-            Private param used for recursively setting the retry amount.
-            (Eg set to 1 for 1 max retry)
+        priority: Optional[:class:`~pincer.core.scheduler.Priority`]
+            The priority class of the request. Interaction callbacks default
+            to ``Priority.INTERACTION``, everything else to ``Priority.USER``.
+            |default| :data:`None`
+
+        deadline: Optional[:class:`float`]
+            Amount of seconds in which the request must be sent.
             |default| :data:`None`
-        """
-        ttl = _ttl or self.max_ttl
 
-        if ttl == 0:
-            logging.error(
-                # TODO: print better method name
-                f"{method.__name__.upper()} {endpoint} has reached the "
-                f"maximum retry count of {self.max_ttl}."
+        Raises
+        ------
+        :class:`~pincer.exceptions.DeadlineExceededError`
+            The request could not be sent within ``deadline`` seconds.
+        :class:`~pincer.exceptions.CircuitOpenError`
+            The route keeps failing, the request has not been sent.
+        :class:`~pincer.exceptions.ServerError`
+            The request still failed after the last retry.
+        """
+        if priority is None:
+            priority = (
+                Priority.INTERACTION
+                if endpoint.lstrip("/").startswith("interactions/")
+                else Priority.USER
             )
 
-            raise ServerError(f"Maximum amount of retries for `{endpoint}`.")
+        cache_key = None
+
+        if self.cache is not None:
+            if method.__name__ != "get":
+                self.cache.invalidate(endpoint, parents=True)
+
+            elif self.cache.ttl(endpoint) is not None:
+                cache_key = self.cache.make_key(endpoint, params)
+                entry = self.cache.get(cache_key)
+
+                if entry is not None and entry.fresh:
+                    self.cache.hits += 1
+                    return loads(entry.body)
+
+                self.cache.misses += 1
+
+                if entry is not None:
+                    headers = {"If-None-Match": entry.etag, **(headers or {})}
 
         if isinstance(data, dict):
-            data = dumps(data)
+            data = dumpb(data)
+
+        if _log.isEnabledFor(logging.DEBUG):
+            _log.debug(
+                "%s %s | %s", method.__name__.upper(), endpoint, _render(data)
+            )
 
-        # TODO: print better method name
-        # TODO: Adjust to work non-json types
-        _log.debug(f"{method.__name__.upper()} {endpoint} | {data}")
+        route = get_route(endpoint)[0]
+        breaker = self.__breakers.get(route)
 
-        await self.__rate_limiter.wait_until_not_ratelimited(endpoint, method)
+        if breaker is None:
+            breaker = self.__breakers[route] = CircuitBreaker(
+                self.retry.failure_threshold, self.retry.recovery_time
+            )
+
+        start = monotonic()
+        expires = None if deadline is None else start + deadline
+        budget = (
+            None if self.retry.budget is None else start + self.retry.budget
+        )
 
         url = f"{self.url}/{endpoint}"
-        async with method(
-            url,
-            data=data,
-            headers={
-                "Content-Type": content_type,
-                **(remove_none(headers) or {}),
-            },
-            params=remove_none(params),
-        ) as res:
-            return await self.__handle_response(
-                res, method, endpoint, content_type, data, ttl
+        headers = {
+            "Content-Type": content_type,
+            **self.__headers,
+            **(remove_none(headers) or {}),
+        }
+        params = remove_none(params)
+
+        for attempt in count(1):
+            if not breaker.allow():
+                raise CircuitOpenError(
+                    f"`{route}` keeps failing, {method.__name__.upper()} "
+                    f"{endpoint} has not been sent."
+                )
+
+            # An open breaker only lets the probe through.
+            probe = breaker.is_open
+
+            try:
+                await self.__rate_limiter.wait_until_not_ratelimited(
+                    endpoint,
+                    method,
+                    priority,
+                    None if expires is None else expires - monotonic(),
+                )
+
+                async with method(
+                    url, data=data, headers=headers, params=params
+                ) as res:
+                    return await self.__handle_response(
+                        res, method, endpoint, breaker, cache_key
+                    )
+            except _Retry as retry:
+                error, delay = retry.error, retry.delay
+                rate_limited = retry.rate_limited
+            except ClientConnectionError as e:
+                breaker.record_failure()
+                error, delay, rate_limited = ServerError(str(e)), None, False
+                error.__cause__ = e
+            finally:
+                # A probe which ended without a verdict, e.g. because it was
+                # cancelled or failed unexpectedly, is given up. Otherwise
+                # the breaker would never let a request through again.
+                if probe:
+                    breaker.release()
+
+            if attempt >= self.retry.max_attempts:
+                _log.error(
+                    "%s %s has reached the maximum amount of %s attempts.",
+                    method.__name__.upper(),
+                    endpoint,
+                    self.retry.max_attempts,
+                )
+                raise error
+
+            if delay is None:
+                delay = self.retry.backoff(attempt)
+
+            resume = monotonic() + delay
+
+            if budget is not None and resume > budget:
+                _log.error(
+                    "%s %s can not be retried within its budget of %ss.",
+                    method.__name__.upper(),
+                    endpoint,
+                    self.retry.budget,
+                )
+                raise error
+
+            if expires is not None and resume > expires:
+                raise DeadlineExceededError(
+                    f"{method.__name__.upper()} {endpoint} can not be retried"
+                    f" within {deadline}s."
+                ) from error
+
+            if rate_limited:
+                # The rate limiter pauses every sender in the scope, this
+                # request waits in line with them.
+                continue
+
+            _log.warning(
+                "%s %s failed with %r, attempt %s of %s. Retrying in %.2fs.",
+                method.__name__.upper(),
+                endpoint,
+                error,
+                attempt,
+                self.retry.max_attempts,
+                delay,
             )
+            await sleep(delay)
 
     async def __handle_response(
         self,
         res: ClientResponse,
         method: HttpCallable,
         endpoint: str,
-        content_type: str,
-        data: Optional[str],
-        _ttl: int,
+        breaker: CircuitBreaker,
+        cache_key: Optional[CacheKey] = None,
     ) -> Optional[Dict]:
         """
         Handle responses from the discord API.
 
-        Side effects:
-            If a 5xx error code is returned it will retry the request.
-
         Parameters
         ----------
 
@@ -221,21 +439,48 @@ class HTTPClient:
         endpoint: :class:`str`
             The endpoint to which the request was sent.
 
-        content_type: :class:`str`
-            The request's content type.
+        breaker: :class:`~pincer.core.retry.CircuitBreaker`
+            The circuit breaker of the route, it records whether Discord
+            handled the request.
 
-        data: Optional[:class:`str`]
-            The data which was added to the request.
+        cache_key: Optional[Tuple[:class:`str`, Tuple]]
+            The key of the request in the response cache, :data:`None` if
+            the response must not be cached.
 
-        _ttl: :class:`int`
-            Private param used for recursively setting the retry amount.
-            (Eg set to 1 for 1 max retry)
+        Raises
+        ------
+        :class:`~pincer.core.http._Retry`
+            The request failed but can be sent again.
         """
-        _log.debug(f"Received response for {endpoint} | {await res.text()}")
+        # The body is read and decoded exactly once, logging only renders
+        # it when debug output is enabled.
+        body = await res.read()
+
+        if _log.isEnabledFor(logging.DEBUG):
+            _log.debug("Received response for %s | %s", endpoint, _render(body))
 
         self.__rate_limiter.save_response_bucket(endpoint, method, res.headers)
 
-        if res.ok:
+        if res.status >= 500:
+            breaker.record_failure()
+
+            retry_after = res.headers.get("Retry-After")
+            raise _Retry(
+                ServerError(f"{res.status} {res.reason}"),
+                None if retry_after is None else float(retry_after),
+            )
+
+        breaker.record_success()
+
+        # aiohttp counts a 304 as ok, the cached body is still valid.
+        if res.status == 304 and cache_key is not None:
+            entry = self.cache.get(cache_key)
+
+            if entry is not None:
+                self.cache.refresh(cache_key)
+                return loads(entry.body)
+
+        if res.ok and res.status != 304:
             if res.status == 204:
                 _log.debug("Request has been sent successfully. ")
                 return
@@ -245,53 +490,116 @@ class HTTPClient:
                 "Returning json response."
             )
 
-            return await res.json()
+            if cache_key is not None:
+                self.cache.set(cache_key, body, res.headers.get("ETag"))
 
-        exception = self.__http_exceptions.get(res.status)
+            return loads(body) if body else None
 
-        if exception:
-            if isinstance(exception, RateLimitError):
-                timeout = (await res.json()).get("retry_after", 40)
+        if res.status == 429:
+            payload = loads(body) if body else {}
+            timeout = payload.get("retry_after") or float(
+                res.headers.get("Retry-After", 40)
+            )
 
-                _log.exception(
-                    f"RateLimitError: {res.reason}."
-                    f" The scope is {res.headers.get('X-RateLimit-Scope')}."
-                    f" Retrying in {timeout} seconds"
-                )
-                await sleep(timeout)
-                return await self.__send(
-                    method, endpoint, content_type=content_type, data=data
-                )
+            scope = res.headers.get("X-RateLimit-Scope")
+            if payload.get("global") or res.headers.get("X-RateLimit-Global"):
+                scope = "global"
+
+            _log.warning(
+                f"RateLimitError: {res.reason}."
+                f" The scope is {scope}."
+                f" Retrying in {timeout} seconds"
+            )
 
-            _log.error(
-                f"An http exception occurred while trying to send "
-                f"a request to {endpoint}. ({res.status}, {res.reason})"
+            self.__rate_limiter.save_rate_limit(
+                endpoint, method, timeout, scope
             )
+            raise _Retry(RateLimitError(res.reason), timeout, True)
+
+        _log.error(
+            f"An http exception occurred while trying to send "
+            f"a request to {endpoint}. ({res.status}, {res.reason})"
+        )
+
+        exception = self.__http_exceptions.get(res.status)
 
+        if exception:
             exception.__init__(res.reason)
             raise exception
 
-        # status code is guaranteed to be 5xx
-        retry_in = 1 + (self.max_ttl - _ttl) * 2
+        raise HTTPError(f"{res.status} {res.reason}")
+
+    def invalidate(self, resource: str):
+        """Removes a resource and its sub resources from the response cache.
+        This does nothing when the cache is disabled.
+
+        Parameters
+        ----------
+        resource : :class:`str`
+            The resource that has been updated, e.g. ``guilds/123``.
+        """
+        if self.cache is not None:
+            self.cache.invalidate(resource)
 
-        _log.debug(
-            "Server side error occurred with status code "
-            f"{res.status}. Retrying in {retry_in}s."
+    def queue_depth(
+        self, route: Optional[str] = None, method: str = "GET"
+    ) -> int:
+        """Amount of requests waiting for a rate limit.
+
+        Parameters
+        ----------
+        route : Optional[:class:`str`]
+            Only count the requests waiting for the bucket of this route.
+            |default| :data:`None`
+        method : :class:`str`
+            The HTTP method used on the route. |default| ``GET``
+
+        Returns
+        -------
+        :class:`int`
+            The amount of requests waiting to be sent.
+        """
+        if route is None:
+            return self.__rate_limiter.queue_depth()
+
+        return self.__rate_limiter.queue_depth(
+            route, getattr(self.pool.session, method.lower())
         )
 
-        await sleep(retry_in)
+    def estimated_wait(
+        self,
+        route: str,
+        method: str = "GET",
+        priority: Priority = Priority.USER,
+    ) -> float:
+        """Estimates how long a new request would wait before being sent.
+        Handlers can use this to shed load.
 
-        # try sending it again
-        return await self.__send(
-            method,
-            endpoint,
-            content_type=content_type,
-            _ttl=_ttl - 1,
-            data=data,
+        Parameters
+        ----------
+        route : :class:`str`
+            The Discord REST endpoint.
+        method : :class:`str`
+            The HTTP method used on the route. |default| ``GET``
+        priority : :class:`~pincer.core.scheduler.Priority`
+            The priority class of the request. |default| ``Priority.USER``
+
+        Returns
+        -------
+        :class:`float`
+            The estimated wait in seconds.
+        """
+        return self.__rate_limiter.estimate_wait(
+            route, getattr(self.pool.session, method.lower()), priority
         )
 
     async def delete(
-        self, route: str, headers: Optional[Dict[str, Any]] = None
+        self,
+        route: str,
+        headers: Optional[Dict[str, Any]] = None,
+        *,
+        priority: Optional[Priority] = None,
+        deadline: Optional[float] = None,
     ) -> Optional[Dict]:
         """|coro|
 
@@ -304,16 +612,34 @@ class HTTPClient:
         headers: Optional[Dict[:class:`str`, Any]]
             The request headers.
             |default| :data:`None`
+        priority: Optional[:class:`~pincer.core.scheduler.Priority`]
+            The priority class of the request.
+            |default| :data:`None`
+        deadline: Optional[:class:`float`]
+            Amount of seconds in which the request must be sent, it fails
+            with :class:`~pincer.exceptions.DeadlineExceededError` otherwise.
+            |default| :data:`None`
 
         Returns
         -------
         Optional[:class:`Dict`]
             The response from discord.
         """
-        return await self.__send(self.__session.delete, route, headers=headers)
+        return await self.__send(
+            self.pool.session.delete,
+            route,
+            headers=headers,
+            priority=priority,
+            deadline=deadline,
+        )
 
     async def get(
-        self, route: str, params: Optional[Dict] = None
+        self,
+        route: str,
+        params: Optional[Dict] = None,
+        *,
+        priority: Optional[Priority] = None,
+        deadline: Optional[float] = None,
     ) -> Optional[Dict]:
         """|coro|
 
@@ -326,13 +652,58 @@ class HTTPClient:
         params: Optional[:class:`Dict`]
             The query parameters to add to the request.
             |default| :data:`None`
+        priority: Optional[:class:`~pincer.core.scheduler.Priority`]
+            The priority class of the request.
+            |default| :data:`None`
+        deadline: Optional[:class:`float`]
+            Amount of seconds in which the request must be sent, it fails
+            with :class:`~pincer.exceptions.DeadlineExceededError` otherwise.
+            |default| :data:`None`
+
+        Concurrent requests to the same route with the same parameters and
+        priority are coalesced, every caller shares the response of the
+        first request. Requests with a deadline are always sent on their
+        own.
 
         Returns
         -------
         Optional[:class:`Dict`]
             The response from discord.
         """
-        return await self.__send(self.__session.get, route, params=params)
+        params = remove_none(params) or {}
+        send = partial(
+            self.__send,
+            self.pool.session.get,
+            route,
+            params=params,
+            priority=priority,
+            deadline=deadline,
+        )
+
+        # The request of another caller would fail or wait for this one.
+        if deadline is not None:
+            self.get_requests += 1
+            return await send()
+
+        key = (
+            route,
+            tuple(sorted((k, str(v)) for k, v in params.items())),
+            priority,
+        )
+        request = self.__in_flight.get(key)
+
+        if request is not None:
+            self.get_coalesced += 1
+            # Every waiter gets its own top level container, as some
+            # constructors update the payload in place.
+            return copy(await shield(request))
+
+        self.get_requests += 1
+        request = self.__in_flight[key] = ensure_future(send())
+        request.add_done_callback(lambda _: self.__in_flight.pop(key, None))
+
+        # A cancelled caller must not cancel the request for the others.
+        return await shield(request)
 
     async def head(self, route: str) -> Optional[Dict]:
         """|coro|
@@ -349,7 +720,7 @@ class HTTPClient:
         Optional[:class:`Dict`]
             The response from discord.
         """
-        return await self.__send(self.__session.head, route)
+        return await self.__send(self.pool.session.head, route)
 
     async def options(self, route: str) -> Optional[Dict]:
         """|coro|
@@ -366,7 +737,7 @@ class HTTPClient:
         Optional[:class:`Dict`]
             The response from discord.
         """
-        return await self.__send(self.__session.options, route)
+        return await self.__send(self.pool.session.options, route)
 
     async def patch(
         self,
@@ -374,6 +745,9 @@ class HTTPClient:
         data: Optional[Dict] = None,
         content_type: str = "application/json",
         headers: Optional[Dict[str, Any]] = None,
+        *,
+        priority: Optional[Priority] = None,
+        deadline: Optional[float] = None,
     ) -> Optional[Dict]:
         """|coro|
 
@@ -390,6 +764,13 @@ class HTTPClient:
             |default| ``application/json``
         headers: Optional[Dict[:class:`str`, Any]]
             The request headers.
+        priority: Optional[:class:`~pincer.core.scheduler.Priority`]
+            The priority class of the request.
+            |default| :data:`None`
+        deadline: Optional[:class:`float`]
+            Amount of seconds in which the request must be sent, it fails
+            with :class:`~pincer.exceptions.DeadlineExceededError` otherwise.
+            |default| :data:`None`
 
         Returns
         -------
@@ -397,11 +778,13 @@ class HTTPClient:
             JSON response from the discord API.
         """
         return await self.__send(
-            self.__session.patch,
+            self.pool.session.patch,
             route,
             content_type=content_type,
             data=data,
             headers=headers,
+            priority=priority,
+            deadline=deadline,
         )
 
     async def post(
@@ -410,6 +793,9 @@ class HTTPClient:
         data: Optional[Dict] = None,
         content_type: str = "application/json",
         headers: Optional[Dict[str, Any]] = None,
+        *,
+        priority: Optional[Priority] = None,
+        deadline: Optional[float] = None,
     ) -> Optional[Dict]:
         """|coro|
 
@@ -425,6 +811,13 @@ class HTTPClient:
             Body content type. |default| ``application/json``
         headers: Optional[Dict[:class:`str`, Any]]
             The request headers.
+        priority: Optional[:class:`~pincer.core.scheduler.Priority`]
+            The priority class of the request.
+            |default| :data:`None`
+        deadline: Optional[:class:`float`]
+            Amount of seconds in which the request must be sent, it fails
+            with :class:`~pincer.exceptions.DeadlineExceededError` otherwise.
+            |default| :data:`None`
 
         Returns
         -------
@@ -432,11 +825,13 @@ class HTTPClient:
             JSON response from the discord API.
         """
         return await self.__send(
-            self.__session.post,
+            self.pool.session.post,
             route,
             content_type=content_type,
             data=data,
             headers=headers,
+            priority=priority,
+            deadline=deadline,
         )
 
     async def put(
@@ -445,6 +840,9 @@ class HTTPClient:
         data: Optional[Dict] = None,
         content_type: str = "application/json",
         headers: Optional[Dict[str, Any]] = None,
+        *,
+        priority: Optional[Priority] = None,
+        deadline: Optional[float] = None,
     ) -> Optional[Dict]:
         """|coro|
 
@@ -460,6 +858,13 @@ class HTTPClient:
             Body content type. |default| ``application/json``
         headers: Optional[Dict[:class:`str`, Any]]
             The request headers.
+        priority: Optional[:class:`~pincer.core.scheduler.Priority`]
+            The priority class of the request.
+            |default| :data:`None`
+        deadline: Optional[:class:`float`]
+            Amount of seconds in which the request must be sent, it fails
+            with :class:`~pincer.exceptions.DeadlineExceededError` otherwise.
+            |default| :data:`None`
 
         Returns
         -------
@@ -467,9 +872,11 @@ class HTTPClient:
             JSON response from the discord API.
         """
         return await self.__send(
-            self.__session.put,
+            self.pool.session.put,
             route,
             content_type=content_type,
             data=data,
             headers=headers,
+            priority=priority,
+            deadline=deadline,
         )
@@ -0,0 +1,144 @@
+# Copyright Pincer 2021-Present
+# Full MIT License can be found in `LICENSE` at the project root.
+
+from __future__ import annotations
+
+import logging
+from asyncio import Lock, sleep
+from time import monotonic
+from typing import TYPE_CHECKING
+
+from . import __package__
+
+if TYPE_CHECKING:
+    from typing import Dict, Optional, Set
+
+    from .gateway import SessionStartLimit
+
+_log = logging.getLogger(__package__)
+
+#: Seconds Discord requires between two identifies of the same bucket.
+IDENTIFY_DELAY = 5
+
+
+class IdentifyScheduler:
+    """Spaces the identifies of the shards of a bot.
+
+    Shards are grouped in ``max_concurrency`` buckets by
+    ``shard_id % max_concurrency``. One shard of every bucket can identify
+    at the same time, the next shard of a bucket waits 5 seconds. When the
+    daily session starts run out, identifying waits until they are reset.
+    Resumes don't count towards these limits and are not scheduled.
+
+    Parameters
+    ----------
+    limit : :class:`~pincer.core.gateway.SessionStartLimit`
+        The session start limit returned by ``gateway/bot``.
+
+    Attributes
+    ----------
+    max_concurrency : :class:`int`
+        Amount of shards which can identify at the same time.
+    total : :class:`int`
+        Session starts allowed per reset.
+    remaining : :class:`int`
+        Session starts left before the reset.
+    expected : :class:`int`
+        Amount of shards the bot is started with.
+    identified : Set[:class:`int`]
+        Shards which have sent an identify.
+    ready : Set[:class:`int`]
+        Shards which have received their ``READY`` event.
+    """
+
+    def __init__(self, limit: SessionStartLimit):
+        self.max_concurrency: int = max(1, limit.max_concurrency)
+        self.total: int = limit.total
+        self.remaining: int = limit.remaining
+        self.expected: int = 0
+        self.identified: Set[int] = set()
+        self.ready: Set[int] = set()
+
+        # ``reset_after`` is in milliseconds.
+        self.__reset_at: float = monotonic() + limit.reset_after / 1000
+        self.__last: Dict[int, float] = {}
+        self.__locks: Dict[int, Lock] = {}
+        self.__started_at: Optional[float] = None
+
+    @property
+    def progress(self) -> float:
+        """:class:`float`: Share of the expected shards which are ready,
+        between ``0`` and ``1``."""
+        if not self.expected:
+            return 0
+
+        return min(1.0, len(self.ready) / self.expected)
+
+    @property
+    def estimated_duration(self) -> float:
+        """:class:`float`: Seconds the identifies of :attr:`expected` shards
+        take when the session starts don't run out."""
+        rounds = -(-self.expected // self.max_concurrency)
+        return max(0, rounds - 1) * IDENTIFY_DELAY
+
+    async def acquire(self, shard: int):
+        """|coro|
+        Waits until the shard may identify and counts the session start.
+
+        Parameters
+        ----------
+        shard : :class:`int`
+            The ID of the shard which is going to identify.
+        """
+        key = shard % self.max_concurrency
+        lock = self.__locks.setdefault(key, Lock())
+
+        async with lock:
+            if (wait := self.__last.get(key, 0) + IDENTIFY_DELAY - monotonic()) > 0:
+                await sleep(wait)
+
+            if self.remaining <= 0:
+                if (wait := self.__reset_at - monotonic()) > 0:
+                    _log.warning(
+                        "No session starts left, shard %s waits %.0f seconds"
+                        " for the reset.",
+                        shard,
+                        wait,
+                    )
+                    await sleep(wait)
+
+                # Discord resets the session starts once a day.
+                self.remaining = self.total
+                self.__reset_at = monotonic() + 86400
+
+            self.remaining -= 1
+            self.__last[key] = monotonic()
+
+        if self.__started_at is None:
+            self.__started_at = monotonic()
+
+        self.identified.add(shard)
+        self.ready.discard(shard)
+
+        _log.debug(
+            "Shard %s identifying, %s session starts left.",
+            shard,
+            self.remaining,
+        )
+
+    def mark_ready(self, shard: int):
+        """Records that a shard received its ``READY`` event.
+
+        Parameters
+        ----------
+        shard : :class:`int`
+            The ID of the shard.
+        """
+        self.ready.add(shard)
+
+        if self.expected and len(self.ready) == self.expected:
+            _log.info(
+                "All %s shards are ready after %.1f seconds.",
+                self.expected,
+                monotonic() - (self.__started_at or monotonic()),
+            )
@@ -0,0 +1,126 @@
+# Copyright Pincer 2021-Present
+# Full MIT License can be found in `LICENSE` at the project root.
+
+"""
+Decompression of the gateway's binary messages.
+
+Only the input side reuses memory: frames of a split message are collected
+in a preallocated buffer. CPython's :mod:`zlib` can't inflate into a buffer
+of the caller, so every message is decompressed into a new :class:`bytes`
+object. It is passed to the JSON codec as is, without decoding it to a
+string first.
+"""
+
+from __future__ import annotations
+
+from time import process_time
+from typing import TYPE_CHECKING
+from zlib import decompress, decompressobj
+
+if TYPE_CHECKING:
+    from typing import Optional
+
+ZLIB_SUFFIX = b"\x00\x00\xff\xff"
+
+
+class Inflator:
+    """Decompresses the binary messages of one gateway connection.
+
+    With ``zlib-stream`` every message continues the zlib context of the
+    previous ones, so each shard needs its own context which is reset when
+    it reconnects. A message can be split over several frames, the frames
+    are collected in a buffer which keeps its memory between messages. The
+    output is a new :class:`bytes` object per message, which the JSON codec
+    decodes without an intermediate string.
+
+    Parameters
+    ----------
+    compression : Optional[str]
+        ``zlib-stream``, ``zlib-payload`` or :data:`None`.
+
+    Attributes
+    ----------
+    bytes_in : int
+        Amount of compressed bytes received.
+    bytes_out : int
+        Amount of bytes after decompression.
+    cpu_time : float
+        CPU seconds spent decompressing.
+    """
+
+    def __init__(self, compression: Optional[str]):
+        self.compression = compression
+
+        self.bytes_in: int = 0
+        self.bytes_out: int = 0
+        self.cpu_time: float = 0
+
+        # Frames of a split message, only the first ``__length`` bytes are
+        # in use so the allocation is kept between messages.
+        self.__buffer = bytearray()
+        self.__length: int = 0
+        self.__context = decompressobj()
+
+    @property
+    def ratio(self) -> float:
+        """:class:`float`: Amount of decompressed bytes per received
+        byte."""
+        return self.bytes_out / self.bytes_in if self.bytes_in else 0
+
+    def reset(self):
+        """Starts a new zlib context, this must be called for every new
+        connection."""
+        self.__length = 0
+        self.__context = decompressobj()
+
+    def decompress(self, msg: bytes) -> Optional[bytes]:
+        """
+        Parameters
+        ----------
+        msg : bytes
+            The data of a binary websocket message.
+
+        Returns
+        -------
+        Optional[bytes]
+            The decompressed payload, :data:`None` if the message is not
+            complete yet.
+        """
+        self.bytes_in += len(msg)
+        start = process_time()
+
+        if self.compression == "zlib-stream":
+            data = self.__decompress_stream(msg)
+        elif self.compression == "zlib-payload":
+            data = decompress(msg)
+        else:
+            data = msg
+
+        self.cpu_time += process_time() - start
+
+        if data is not None:
+            self.bytes_out += len(data)
+
+        return data
+
+    def __decompress_stream(self, msg: bytes) -> Optional[bytes]:
+        if not self.__length and msg[-4:] == ZLIB_SUFFIX:
+            # Messages usually fit in one frame, those skip the buffer.
+            return self.__context.decompress(msg)
+
+        end = self.__length + len(msg)
+
+        if end > len(self.__buffer):
+            self.__buffer.extend(bytes(end - len(self.__buffer)))
+
+        # Assigning a slice of the same size never reallocates the buffer.
+        self.__buffer[self.__length : end] = msg
+        self.__length = end
+
+        if end < 4 or self.__buffer[end - 4 : end] != ZLIB_SUFFIX:
+            return None
+
+        self.__length = 0
+
+        with memoryview(self.__buffer)[:end] as view:
+            return self.__context.decompress(view)
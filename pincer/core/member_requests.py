@@ -0,0 +1,72 @@
+# Copyright Pincer 2021-Present
+# Full MIT License can be found in `LICENSE` at the project root.
+
+from __future__ import annotations
+
+from asyncio import Queue
+from itertools import count
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Dict, Tuple
+
+    from ..objects.events.guild import GuildMembersChunkEvent
+
+
+class MemberRequests:
+    """Routes the ``GUILD_MEMBERS_CHUNK`` events of one shard to the
+    guild member requests which are waiting for them, by their nonce.
+    Several requests can be in flight at the same time.
+    """
+
+    def __init__(self):
+        self.__pending: Dict[str, Queue] = {}
+        self.__ids = count()
+
+    @property
+    def pending(self) -> int:
+        """:class:`int`: Amount of requests waiting for chunks."""
+        return len(self.__pending)
+
+    def open(self) -> Tuple[str, Queue]:
+        """
+        Returns
+        -------
+        Tuple[:class:`str`, :class:`asyncio.Queue`]
+            The nonce to send the request with and the queue which receives
+            its chunks. The request must be closed with :meth:`close`.
+        """
+        nonce = f"pincer-{next(self.__ids)}"
+        queue = self.__pending[nonce] = Queue()
+        return nonce, queue
+
+    def close(self, nonce: str):
+        """Stops routing chunks to a request.
+
+        Parameters
+        ----------
+        nonce : :class:`str`
+            The nonce returned by :meth:`open`.
+        """
+        self.__pending.pop(nonce, None)
+
+    def feed(self, chunk: GuildMembersChunkEvent) -> bool:
+        """Hands a chunk to the request it belongs to.
+
+        Parameters
+        ----------
+        chunk : :class:`~pincer.objects.events.guild.GuildMembersChunkEvent`
+            The received chunk.
+
+        Returns
+        -------
+        :class:`bool`
+            Whether a request was waiting for the chunk.
+        """
+        queue = self.__pending.get(chunk.nonce)
+
+        if queue is None:
+            return False
+
+        queue.put_nowait(chunk)
+        return True
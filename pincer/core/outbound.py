@@ -0,0 +1,210 @@
+# Copyright Pincer 2021-Present
+# Full MIT License can be found in `LICENSE` at the project root.
+
+from __future__ import annotations
+
+import logging
+from asyncio import Event, ensure_future, get_running_loop, sleep
+from collections import deque
+from dataclasses import dataclass
+from time import monotonic
+from typing import TYPE_CHECKING
+
+from . import __package__
+
+if TYPE_CHECKING:
+    from asyncio import Future, Task
+    from typing import (
+        Awaitable,
+        Callable,
+        Deque,
+        Dict,
+        Hashable,
+        List,
+        Optional,
+    )
+
+_log = logging.getLogger(__package__)
+
+#: Heartbeat, identify and resume are sent ahead of other commands.
+PRIORITY_OPS = frozenset({1, 2, 6})
+
+
+@dataclass
+class _Command:
+    payload: str
+    futures: List[Future]
+    key: Optional[Hashable]
+
+
+class OutboundQueue:
+    """Sends the commands of one gateway connection within Discord's limit
+    of 120 commands per 60 seconds.
+
+    Commands are sent in order once the connection is ready. Heartbeats,
+    identifies and resumes skip the queue and may use ``reserved`` slots
+    other commands leave free, so they are never stuck behind bulk
+    commands. A command with a ``key`` replaces a queued command with the
+    same key, which is used for presence and voice state updates that
+    supersede each other.
+
+    Parameters
+    ----------
+    write : Callable[[:class:`str`], Awaitable[None]]
+        Writes a payload to the websocket.
+    limit : :class:`int`
+        Amount of commands per ``per`` seconds. |default| ``120``
+    per : :class:`float`
+        The length of the window in seconds. |default| ``60``
+    reserved : :class:`int`
+        Slots of the window only heartbeats, identifies and resumes may
+        use. |default| ``5``
+
+    Attributes
+    ----------
+    sent : :class:`int`
+        Amount of commands which have been written.
+    coalesced : :class:`int`
+        Amount of commands which were replaced before they were sent.
+    """
+
+    def __init__(
+        self,
+        write: Callable[[str], Awaitable[None]],
+        limit: int = 120,
+        per: float = 60,
+        reserved: int = 5,
+    ):
+        self.limit = limit
+        self.per = per
+        self.reserved = reserved
+
+        self.sent: int = 0
+        self.coalesced: int = 0
+
+        self.__write = write
+        # Send times of the current window, oldest first.
+        self.__window: Deque[float] = deque()
+        self.__queue: Deque[_Command] = deque()
+        self.__keyed: Dict[Hashable, _Command] = {}
+        self.__ready = Event()
+        self.__drainer: Optional[Task] = None
+
+    @property
+    def depth(self) -> int:
+        """:class:`int`: Amount of commands waiting to be sent."""
+        return len(self.__queue)
+
+    def reset(self):
+        """Starts a new connection, queued commands wait until :meth:`open`
+        is called."""
+        self.__window.clear()
+        self.__ready.clear()
+
+    def open(self):
+        """Lets queued commands be sent, called once the connection is
+        ready or resumed."""
+        self.__ready.set()
+
+    def close(self):
+        """Stops sending and fails the queued commands."""
+        if self.__drainer is not None:
+            self.__drainer.cancel()
+            self.__drainer = None
+
+        for command in self.__queue:
+            for future in command.futures:
+                if not future.done():
+                    future.set_exception(ConnectionError("Gateway closed"))
+
+        self.__queue.clear()
+        self.__keyed.clear()
+
+    async def send(
+        self, payload: str, op: Optional[int], key: Optional[Hashable] = None
+    ):
+        """|coro|
+        Sends a command, waits until it has been written.
+
+        Parameters
+        ----------
+        payload : :class:`str`
+            The serialized command.
+        op : Optional[:class:`int`]
+            The opcode of the command, :data:`None` if it is unknown.
+        key : Optional[Hashable]
+            Queued commands with the same key are replaced by this one.
+            |default| :data:`None`
+        """
+        if op in PRIORITY_OPS:
+            while wait := self.__wait_time(self.limit):
+                await sleep(wait)
+
+            await self.__send(payload)
+            return
+
+        future = get_running_loop().create_future()
+
+        if key is not None and (queued := self.__keyed.get(key)):
+            # The queued command keeps its place, only the newest payload
+            # is sent.
+            queued.payload = payload
+            queued.futures.append(future)
+            self.coalesced += 1
+        else:
+            command = _Command(payload, [future], key)
+            self.__queue.append(command)
+
+            if key is not None:
+                self.__keyed[key] = command
+
+        if self.__drainer is None:
+            self.__drainer = ensure_future(self.__drain())
+
+        await future
+
+    def __wait_time(self, capacity: int) -> float:
+        now = monotonic()
+
+        while self.__window and now - self.__window[0] >= self.per:
+            self.__window.popleft()
+
+        if len(self.__window) < capacity:
+            return 0
+
+        # The window has room once enough of the oldest sends expired.
+        return self.__window[len(self.__window) - capacity] + self.per - now
+
+    async def __send(self, payload: str):
+        self.__window.append(monotonic())
+        self.sent += 1
+        await self.__write(payload)
+
+    async def __drain(self):
+        try:
+            while self.__queue:
+                await self.__ready.wait()
+
+                if wait := self.__wait_time(self.limit - self.reserved):
+                    _log.debug("Gateway command limit reached, waiting %.1fs", wait)
+                    await sleep(wait)
+                    continue
+
+                command = self.__queue.popleft()
+
+                if command.key is not None:
+                    del self.__keyed[command.key]
+
+                try:
+                    await self.__send(command.payload)
+                except Exception as e:
+                    for future in command.futures:
+                        if not future.done():
+                            future.set_exception(e)
+                    continue
+
+                for future in command.futures:
+                    if not future.done():
+                        future.set_result(None)
+        finally:
+            self.__drainer = None
@@ -0,0 +1,243 @@
+# Copyright Pincer 2021-Present
+# Full MIT License can be found in `LICENSE` at the project root.
+
+from __future__ import annotations
+
+import logging
+from asyncio import Event, Queue, ensure_future
+from collections import deque
+from dataclasses import dataclass
+from time import monotonic
+from typing import TYPE_CHECKING
+
+from . import __package__
+
+if TYPE_CHECKING:
+    from asyncio import Task
+    from typing import (
+        Any,
+        Awaitable,
+        Callable,
+        Deque,
+        Hashable,
+        List,
+        Optional,
+        Set,
+    )
+
+    from .dispatch import GatewayDispatch
+
+_log = logging.getLogger(__package__)
+
+
+@dataclass
+class PipelineConfig:
+    """Settings of the dispatch pipeline of every shard.
+
+    Attributes
+    ----------
+    workers : :class:`int`
+        Amount of dispatches a shard handles at the same time.
+        |default| ``4``
+    max_size : :class:`int`
+        Amount of dispatches that can be queued before the shard stops
+        reading from the websocket. |default| ``1024``
+    max_listeners : Optional[:class:`int`]
+        Amount of event listeners that can run at the same time, further
+        listeners wait until a running one finished. :data:`None` for no
+        limit. |default| ``1024``
+    max_waiting_listeners : :class:`int`
+        Amount of listeners that can wait for a running one to finish
+        before the workers stop handling dispatches. The workers only wait
+        once this is reached, so listeners waiting for later events don't
+        block the pipeline below it. |default| ``1024``
+    """
+
+    workers: int = 4
+    max_size: int = 1024
+    max_listeners: Optional[int] = 1024
+    max_waiting_listeners: int = 1024
+
+
+def dispatch_key(payload: GatewayDispatch) -> Optional[Hashable]:
+    """
+    Parameters
+    ----------
+    payload : :class:`~pincer.core.dispatch.GatewayDispatch`
+        A dispatch (opcode 0).
+
+    Returns
+    -------
+    Optional[Hashable]
+        The guild, or the channel outside of guilds, the dispatch is about.
+        Dispatches with the same key are handled in the order they were
+        received.
+    """
+    data = payload.data
+
+    if not isinstance(data, dict):
+        return None
+
+    name = payload.event_name or ""
+
+    if name.startswith("GUILD_") and "guild_id" not in data:
+        # GUILD_CREATE, GUILD_UPDATE and GUILD_DELETE are the guild itself.
+        return data.get("id")
+
+    return data.get("guild_id") or data.get("channel_id")
+
+
+class DispatchPipeline:
+    """Handles the dispatches of one shard with a fixed amount of workers.
+
+    Every key is assigned to one worker, so the dispatches of a guild are
+    handled in order while other guilds are handled concurrently. When the
+    queue of a worker is full, :meth:`put` waits, which stops the shard
+    from reading more messages until the workers catch up.
+
+    Parameters
+    ----------
+    config : Optional[:class:`~pincer.core.pipeline.PipelineConfig`]
+        The pipeline settings. |default| ``PipelineConfig()``
+
+    Attributes
+    ----------
+    config : :class:`~pincer.core.pipeline.PipelineConfig`
+        The pipeline settings.
+    processed : :class:`int`
+        Amount of dispatches which have been handled.
+    lag : :class:`float`
+        Seconds the last dispatch waited in the queue.
+    max_lag : :class:`float`
+        The longest time in seconds a dispatch waited in the queue.
+    """
+
+    def __init__(self, config: Optional[PipelineConfig] = None):
+        self.config: PipelineConfig = config or PipelineConfig()
+
+        self.processed: int = 0
+        self.lag: float = 0
+        self.max_lag: float = 0
+
+        self.__queues: List[Queue] = []
+        self.__workers: List[Task] = []
+        self.__listeners: Set[Task] = set()
+        self.__waiting: Deque[Awaitable[Any]] = deque()
+        self.__listener_room = Event()
+        self.__listener_room.set()
+
+    @property
+    def depth(self) -> int:
+        """:class:`int`: Amount of dispatches waiting to be handled."""
+        return sum(queue.qsize() for queue in self.__queues)
+
+    @property
+    def running_listeners(self) -> int:
+        """:class:`int`: Amount of event listeners that are running."""
+        return len(self.__listeners)
+
+    @property
+    def waiting_listeners(self) -> int:
+        """:class:`int`: Amount of event listeners waiting for a running one
+        to finish."""
+        return len(self.__waiting)
+
+    def start(self):
+        """Starts the workers, this is done on the first :meth:`put`."""
+        if self.__workers:
+            return
+
+        size = max(1, self.config.max_size // self.config.workers)
+        self.__queues = [Queue(size) for _ in range(self.config.workers)]
+        self.__workers = [ensure_future(self.__work(queue)) for queue in self.__queues]
+
+    async def put(self, key: Optional[Hashable], job: Callable[[], Awaitable[Any]]):
+        """|coro|
+        Queues a job, waits while the queue of its worker is full.
+
+        Parameters
+        ----------
+        key : Optional[Hashable]
+            Jobs with the same key are run in the order they were put.
+        job : Callable[[], Awaitable[Any]]
+            Creates the coroutine to run.
+        """
+        self.start()
+        queue = self.__queues[hash(key) % len(self.__queues)]
+        await queue.put((monotonic(), job))
+
+    def spawn(self, coro: Awaitable[Any]):
+        """Runs an event listener in the background. While
+        ``max_listeners`` are running it waits for one of them to finish,
+        without a task of its own.
+
+        Parameters
+        ----------
+        coro : Awaitable[Any]
+            The listener call.
+        """
+        limit = self.config.max_listeners
+
+        if limit is None or len(self.__listeners) < limit:
+            self.__run_listener(coro)
+            return
+
+        self.__waiting.append(coro)
+
+        if len(self.__waiting) >= self.config.max_waiting_listeners:
+            self.__listener_room.clear()
+
+    def __run_listener(self, coro: Awaitable[Any]):
+        task = ensure_future(coro)
+        self.__listeners.add(task)
+        task.add_done_callback(self.__listener_done)
+
+    def __listener_done(self, task: Task):
+        self.__listeners.discard(task)
+
+        if self.__waiting:
+            self.__run_listener(self.__waiting.popleft())
+
+        if len(self.__waiting) < self.config.max_waiting_listeners:
+            self.__listener_room.set()
+
+    async def join(self):
+        """|coro|
+        Waits until every queued dispatch has been handled.
+        """
+        for queue in self.__queues:
+            await queue.join()
+
+    def close(self):
+        """Stops the workers, queued dispatches and waiting listeners are
+        dropped."""
+        for worker in self.__workers:
+            worker.cancel()
+
+        for coro in self.__waiting:
+            if close := getattr(coro, "close", None):
+                close()
+
+        self.__workers.clear()
+        self.__queues.clear()
+        self.__waiting.clear()
+        self.__listener_room.set()
+
+    async def __work(self, queue: Queue):
+        while True:
+            queued_at, job = await queue.get()
+
+            self.lag = monotonic() - queued_at
+            self.max_lag = max(self.max_lag, self.lag)
+
+            try:
+                await job()
+            except Exception:
+                _log.exception("Handling a dispatch failed")
+            finally:
+                self.processed += 1
+                queue.task_done()
+
+            # Too many listeners are waiting, their dispatches wait in the
+            # queue instead.
+            await self.__listener_room.wait()
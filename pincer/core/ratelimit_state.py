@@ -0,0 +1,226 @@
+# Copyright Pincer 2021-Present
+# Full MIT License can be found in `LICENSE` at the project root.
+
+from __future__ import annotations
+
+import logging
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from time import time
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Dict, Optional, Tuple
+
+_log = logging.getLogger(__name__)
+
+
+@dataclass
+class Bucket:
+    """Represents a rate limit bucket
+
+    Attributes
+    ----------
+    limit : int
+        The number of requests that can be made.
+    remaining : int
+        The number of remaining requests that can be made.
+    reset : float
+        Epoch time at which rate limit resets.
+    reset_after : float
+        Total time in seconds until rate limit resets.
+    time_cached : float
+        Time since epoch when this bucket was last saved.
+    """
+
+    limit: int
+    remaining: int
+    reset: float
+    reset_after: float
+    time_cached: float
+
+    @property
+    def resets_in(self) -> float:
+        """:class:`float`: Seconds left until the bucket resets, based on
+        the local clock to avoid issues with clock skew."""
+        return max(0.0, self.time_cached + self.reset_after - time())
+
+
+class RateLimitState(ABC):
+    """The counters behind a :class:`~pincer.core.ratelimiter.RateLimiter`.
+
+    The rate limiter orders the senders of one process, the state decides
+    whether a request may be sent. Processes which share a state share the
+    bucket and global limits of their token.
+
+    Attributes
+    ----------
+    buckets : Dict[str, :class:`~pincer.core.ratelimit_state.Bucket`]
+        The buckets as known to this process, used to estimate waits.
+    global_reset : float
+        Epoch time until which every request is paused after a global 429.
+    """
+
+    def __init__(self) -> None:
+        self.buckets: Dict[str, Bucket] = {}
+        self.global_reset: float = 0
+
+    @abstractmethod
+    async def reserve(
+        self, key: Optional[str], global_limit: Optional[int]
+    ) -> Tuple[float, Optional[str]]:
+        """|coro|
+        Atomically takes one request from a bucket and the global limit.
+
+        Parameters
+        ----------
+        key : Optional[str]
+            The bucket key, :data:`None` to only count the global limit.
+        global_limit : Optional[int]
+            The global limit per second, :data:`None` for routes which are
+            exempt from it.
+
+        Returns
+        -------
+        Tuple[:class:`float`, Optional[:class:`str`]]
+            ``(0, None)`` when the request has been reserved. Otherwise the
+            seconds to wait before trying again and ``"bucket"`` or
+            ``"global"`` for the limit that has been hit, nothing has been
+            reserved then.
+        """
+
+    @abstractmethod
+    def update(
+        self,
+        key: str,
+        limit: int,
+        remaining: int,
+        reset: float,
+        reset_after: float,
+    ):
+        """Saves the rate limit headers of a response.
+
+        Parameters
+        ----------
+        key : str
+            The bucket key.
+        limit : int
+            ``X-RateLimit-Limit``
+        remaining : int
+            ``X-RateLimit-Remaining``
+        reset : float
+            ``X-RateLimit-Reset``
+        reset_after : float
+            ``X-RateLimit-Reset-After``
+        """
+
+    @abstractmethod
+    def pause(self, key: Optional[str], retry_after: float):
+        """Pauses a bucket, or every request, after a 429 response.
+
+        Parameters
+        ----------
+        key : Optional[str]
+            The bucket key, :data:`None` for a global rate limit.
+        retry_after : float
+            Seconds to wait before a new request can be made.
+        """
+
+    async def close(self):
+        """|coro|
+        Releases the resources of the state.
+        """
+
+
+class LocalRateLimitState(RateLimitState):
+    """Keeps the rate limit counters in memory of this process, the
+    default state.
+    """
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.__global_window: float = 0
+        self.__global_count: int = 0
+
+    async def reserve(
+        self, key: Optional[str], global_limit: Optional[int]
+    ) -> Tuple[float, Optional[str]]:
+        now = time()
+        bucket = self.buckets.get(key)
+
+        if bucket:
+            if bucket.remaining <= 0 and (wait := bucket.resets_in):
+                return wait, "bucket"
+
+            if bucket.resets_in == 0:
+                # The window has passed, a new one starts with this request.
+                # The next response will correct the estimation.
+                bucket.remaining = bucket.limit
+                bucket.time_cached = now
+
+        if global_limit is not None:
+            if self.global_reset > now:
+                return self.global_reset - now, "global"
+
+            if now - self.__global_window >= 1:
+                self.__global_window = now
+                self.__global_count = 0
+
+            if self.__global_count >= global_limit:
+                return self.__global_window + 1 - now, "global"
+
+            self.__global_count += 1
+
+        if bucket:
+            bucket.remaining -= 1
+
+        return 0, None
+
+    def update(
+        self,
+        key: str,
+        limit: int,
+        remaining: int,
+        reset: float,
+        reset_after: float,
+    ):
+        bucket = self.buckets.get(key)
+
+        if bucket is None:
+            _log.debug("Rate limit bucket detected: %s.", key)
+            bucket = self.buckets[key] = Bucket(
+                limit=0,
+                remaining=remaining,
+                reset=0,
+                reset_after=0,
+                time_cached=0,
+            )
+        elif bucket.reset == reset:
+            # Responses of concurrent requests can come back out of order,
+            # the lowest count is the most recent within the same window.
+            # Requests that are still in flight have already been subtracted
+            # locally.
+            remaining = min(remaining, bucket.remaining)
+
+        # The bucket is updated in place as queued senders hold a reference.
+        bucket.limit = limit
+        bucket.remaining = remaining
+        bucket.reset = reset
+        bucket.reset_after = reset_after
+        bucket.time_cached = time()
+
+    def pause(self, key: Optional[str], retry_after: float):
+        if key is None:
+            self.global_reset = max(self.global_reset, time() + retry_after)
+            return
+
+        bucket = self.buckets.get(key)
+
+        if bucket is None:
+            bucket = self.buckets[key] = Bucket(
+                limit=1, remaining=0, reset=0, reset_after=0, time_cached=0
+            )
+
+        bucket.remaining = 0
+        bucket.reset_after = retry_after
+        bucket.time_cached = time()
@@ -3,61 +3,145 @@
 
 from __future__ import annotations
 
-from asyncio import sleep
-from dataclasses import dataclass
+from asyncio import TimeoutError, sleep, wait_for
 import logging
 from time import time
 from typing import TYPE_CHECKING
 
+from .ratelimit_state import Bucket, LocalRateLimitState
+from .scheduler import Priority, PriorityLock
+from ..exceptions import DeadlineExceededError
+
 if TYPE_CHECKING:
-    from typing import Dict, Tuple
+    from typing import Dict, Optional, Tuple
     from .http import HttpCallable
+    from .ratelimit_state import RateLimitState
 
 _log = logging.getLogger(__name__)
 
+# Discord scopes rate limits per route on these top level resources. Two
+# requests to the same route template with a different major parameter never
+# share a bucket.
+MAJOR_PARAMETERS = ("channels", "guilds", "webhooks", "interactions")
 
-@dataclass
-class Bucket:
-    """Represents a rate limit bucket
+# Interaction callbacks are not bound to the global rate limit.
+GLOBAL_EXEMPT_ROUTES = ("interactions/",)
 
-    Attributes
+
+def get_route(endpoint: str) -> Tuple[str, str]:
+    """Splits an endpoint in its route template and major parameter.
+
+    Snowflakes, webhook/interaction tokens and reaction emojis are replaced
+    by placeholders so every message, user or emoji of a route resolves to
+    the same bucket.
+
+    Parameters
     ----------
-    limit : int
-        The number of requests that can be made.
-    remaining : int
-        The number of remaining requests that can be made.
-    reset : float
-        Epoch time at which rate limit resets.
-    reset_after : float
-        Total time in seconds until rate limit resets.
-    time_cached : float
-        Time since epoch when this bucket was last saved.
+    endpoint : str
+        The endpoint, e.g. ``channels/123/messages/456``
+
+    Returns
+    -------
+    Tuple[:class:`str`, :class:`str`]
+        The route template (``channels/{channel_id}/messages/{id}``) and the
+        major parameter (``123``), the later is an empty string for routes
+        without a major parameter.
     """
+    parts = endpoint.split("?", 1)[0].strip("/").split("/")
+    major = ""
 
-    limit: int
-    remaining: int
-    reset: float
-    reset_after: float
-    time_cached: float
+    for idx, part in enumerate(parts):
+        previous = parts[idx - 1] if idx else ""
+
+        if part.isdigit():
+            if idx == 1 and previous in MAJOR_PARAMETERS:
+                major = part
+                parts[idx] = "{%s_id}" % previous[:-1]
+            else:
+                parts[idx] = "{id}"
+        elif idx == 2 and parts[0] in ("webhooks", "interactions"):
+            # Tokens are part of the major parameter for these routes.
+            major = f"{major}/{part}"
+            parts[idx] = "{token}"
+        elif previous == "reactions" and part != "@me":
+            parts[idx] = "{emoji}"
+
+    return "/".join(parts), major
 
 
 class RateLimiter:
     """Prevents ``user`` rate limits
+
+    Requests are grouped by route template and major parameter, as described
+    in `<https://discord.com/developers/docs/topics/rate-limits>`_. Each
+    bucket has its own queue, ordered by priority and then FIFO. The
+    remaining amount of requests is decremented before the request is sent
+    so concurrent senders don't all pass the check at the same time.
+
+    All buckets are put behind the global rate limit. When Discord reports
+    a ``global`` rate limit every sender is paused, for ``user`` and
+    ``shared`` rate limits every sender of the bucket is paused.
+
+    The counters live in a :class:`~pincer.core.ratelimit_state.RateLimitState`.
+    Processes that use the same token can share them through a
+    :class:`~pincer.core.coordinator.SharedRateLimitState`.
+
+    Parameters
+    ----------
+    global_limit : int
+        Amount of requests that can be made per second across all routes.
+        |default| ``50``
+    state : Optional[:class:`~pincer.core.ratelimit_state.RateLimitState`]
+        Where the rate limit counters are kept.
+        |default| :class:`~pincer.core.ratelimit_state.LocalRateLimitState`
+
     Attributes
     ----------
-    bucket_map : Dict[Tuple[str, :class:`~pincer.core.http.HttpCallable`], str]
-        Maps endpoints and methods to a rate limit bucket
-    buckets : Dict[str, :class:`~pincer.core.ratelimiter.Bucket`]
-        Dictionary of buckets
+    bucket_map : Dict[Tuple[str, str], str]
+        Maps methods and route templates to a rate limit bucket
+    global_limit : int
+        Amount of requests that can be made per second across all routes.
+    state : :class:`~pincer.core.ratelimit_state.RateLimitState`
+        Where the rate limit counters are kept.
     """
 
-    def __init__(self) -> None:
-        self.bucket_map: Dict[Tuple[str, HttpCallable], str] = {}
-        self.buckets: Dict[str, Bucket] = {}
+    def __init__(
+        self, global_limit: int = 50, state: Optional[RateLimitState] = None
+    ) -> None:
+        self.bucket_map: Dict[Tuple[str, str], str] = {}
+        self.global_limit = global_limit
+        self.state: RateLimitState = state or LocalRateLimitState()
+        self.__queues: Dict[str, PriorityLock] = {}
+        self.__global_queue = PriorityLock()
 
-    def save_response_bucket(
-        self, endpoint: str, method: HttpCallable, header: Dict
-    ):
+    @property
+    def buckets(self) -> Dict[str, Bucket]:
+        """Dict[str, :class:`~pincer.core.ratelimit_state.Bucket`]:
+        Dictionary of buckets, keyed by bucket hash and major parameter"""
+        return self.state.buckets
+
+    def get_bucket_key(self, endpoint: str, method: HttpCallable) -> str:
+        """
+        Parameters
+        ----------
+        endpoint : str
+            The endpoint
+        method : :class:`~pincer.core.http.HttpCallable`
+            The method used on the endpoint (E.g. ``Get``, ``Post``, ``Patch``)
+
+        Returns
+        -------
+        :class:`str`
+            The key of the bucket the request belongs to. Routes of which the
+            bucket hash is not known yet are keyed by method and route.
+        """
+        route, major = get_route(endpoint)
+        method_name = method.__name__.upper()
+
+        bucket_id = self.bucket_map.get((method_name, route), f"{method_name} {route}")
+        return f"{bucket_id}:{major}"
+
+    def save_response_bucket(self, endpoint: str, method: HttpCallable, header: Dict):
         """
         Parameters
         ----------
@@ -73,28 +157,157 @@ class RateLimiter:
         if not bucket_id:
             return
 
-        self.bucket_map[endpoint, method] = bucket_id
+        route, major = get_route(endpoint)
+        self.bucket_map[method.__name__.upper(), route] = bucket_id
 
-        self.buckets[bucket_id] = Bucket(
-            limit=int(header["X-RateLimit-Limit"]),
-            remaining=int(header["X-RateLimit-Remaining"]),
-            reset=float(header["X-RateLimit-Reset"]),
-            reset_after=float(header["X-RateLimit-Reset-After"]),
-            time_cached=time(),
+        self.state.update(
+            f"{bucket_id}:{major}",
+            int(header["X-RateLimit-Limit"]),
+            int(header["X-RateLimit-Remaining"]),
+            float(header["X-RateLimit-Reset"]),
+            float(header["X-RateLimit-Reset-After"]),
         )
 
-        _log.info(
-            "Rate limit bucket detected: %s - %r.",
-            bucket_id,
-            self.buckets[bucket_id],
+    def save_rate_limit(
+        self,
+        endpoint: str,
+        method: HttpCallable,
+        retry_after: float,
+        scope: Optional[str] = None,
+    ):
+        """Pauses the senders affected by a 429 response.
+
+        Parameters
+        ----------
+        endpoint : str
+            The endpoint
+        method : :class:`~pincer.core.http.HttpCallable`
+            The method used on the endpoint (E.g. ``Get``, ``Post``, ``Patch``)
+        retry_after : float
+            Seconds to wait before a new request can be made.
+        scope : Optional[str]
+            The ``X-RateLimit-Scope`` of the response. ``global`` pauses all
+            requests, other scopes pause the bucket of the endpoint.
+            |default| :data:`None`
+        """
+        if scope == "global":
+            _log.warning(
+                "Global rate limit reached. Pausing all requests for %ss.",
+                retry_after,
+            )
+            self.state.pause(None, retry_after)
+            return
+
+        self.state.pause(self.get_bucket_key(endpoint, method), retry_after)
+
+    def queue_depth(
+        self,
+        endpoint: Optional[str] = None,
+        method: Optional[HttpCallable] = None,
+    ) -> int:
+        """
+        Parameters
+        ----------
+        endpoint : Optional[str]
+            Only count the requests waiting for the bucket of this endpoint.
+            |default| :data:`None`
+        method : Optional[:class:`~pincer.core.http.HttpCallable`]
+            The method used on the endpoint, required with ``endpoint``.
+            |default| :data:`None`
+
+        Returns
+        -------
+        :class:`int`
+            The amount of requests waiting to be sent.
+        """
+        if endpoint is not None:
+            queue = self.__queues.get(self.get_bucket_key(endpoint, method))
+            return queue.waiting(Priority.BACKGROUND) if queue else 0
+
+        return sum(
+            queue.waiting(Priority.BACKGROUND) for queue in self.__queues.values()
         )
 
+    def estimate_wait(
+        self,
+        endpoint: str,
+        method: HttpCallable,
+        priority: Priority = Priority.USER,
+    ) -> float:
+        """
+        Parameters
+        ----------
+        endpoint : str
+            The endpoint
+        method : :class:`~pincer.core.http.HttpCallable`
+            The method used on the endpoint (E.g. ``Get``, ``Post``, ``Patch``)
+        priority : :class:`~pincer.core.scheduler.Priority`
+            The priority class of the request. |default| ``Priority.USER``
+
+        Returns
+        -------
+        :class:`float`
+            Estimated amount of seconds a new request would wait before
+            being sent. Requests of other processes sharing the state are
+            not taken into account.
+        """
+        wait = max(0.0, self.state.global_reset - time())
+
+        if not endpoint.lstrip("/").startswith(GLOBAL_EXEMPT_ROUTES):
+            ahead = self.__global_queue.waiting(priority)
+            wait = max(wait, ahead / self.global_limit)
+
+        key = self.get_bucket_key(endpoint, method)
+        bucket = self.buckets.get(key)
+
+        if bucket is None:
+            return wait
+
+        queue = self.__queues.get(key)
+        ahead = queue.waiting(priority) if queue else 0
+
+        if ahead >= bucket.remaining:
+            windows = (ahead - bucket.remaining) // max(bucket.limit, 1)
+            wait = max(wait, bucket.resets_in + windows * bucket.reset_after)
+
+        return wait
+
+    async def wait_for_global(
+        self,
+        priority: Priority = Priority.USER,
+        expires: Optional[float] = None,
+    ):
+        """|coro|
+        Waits until a request can be made without exceeding the global rate
+        limit. The request is counted against the global limit once this
+        returns.
+
+        Parameters
+        ----------
+        priority : :class:`~pincer.core.scheduler.Priority`
+            The priority class of the request. |default| ``Priority.USER``
+        expires : Optional[float]
+            Epoch time after which the request can not be sent anymore.
+            |default| :data:`None`
+
+        Raises
+        ------
+        :class:`~pincer.exceptions.DeadlineExceededError`
+            The request can not be sent before ``expires``.
+        """
+        await self.__reserve(None, priority, expires)
+
     async def wait_until_not_ratelimited(
-        self, endpoint: str, method: HttpCallable
+        self,
+        endpoint: str,
+        method: HttpCallable,
+        priority: Priority = Priority.USER,
+        deadline: Optional[float] = None,
     ):
         """|coro|
         Waits until the response no longer needs to be blocked to prevent a
-        429 response because of ``user`` rate limits.
+        429 response because of ``user`` rate limits. The request is counted
+        against the bucket once this returns.
 
         Parameters
         ----------
@@ -102,24 +315,104 @@ class RateLimiter:
             The endpoint
         method : :class:`~pincer.core.http.HttpCallable`
             The method used on the endpoint (E.g. ``Get``, ``Post``, ``Patch``)
+        priority : :class:`~pincer.core.scheduler.Priority`
+            The priority class of the request. Requests with a higher
+            priority skip ahead in the bucket and global queues.
+            |default| ``Priority.USER``
+        deadline : Optional[float]
+            Amount of seconds in which the request must be sent.
+            |default| :data:`None`
+
+        Raises
+        ------
+        :class:`~pincer.exceptions.DeadlineExceededError`
+            The request can not be sent within ``deadline`` seconds. This is
+            raised as soon as it is known, the request is dropped from the
+            queues.
         """
-        bucket_id = self.bucket_map.get((endpoint, method))
+        expires = None
 
-        if not bucket_id:
-            return
+        if deadline is not None:
+            expires = time() + deadline
+            estimation = self.estimate_wait(endpoint, method, priority)
 
-        bucket = self.buckets[bucket_id]
-        cur_time = time()
+            if estimation > deadline:
+                raise DeadlineExceededError(
+                    f"`{endpoint}` can not be sent within {deadline}s, "
+                    f"estimated wait is {estimation:.2f}s."
+                )
 
-        if bucket.remaining == 0:
-            sleep_time = cur_time - bucket.time_cached + bucket.reset_after
+        key = self.get_bucket_key(endpoint, method)
 
-            _log.info(
-                "Waiting for %ss until rate limit for bucket %s is over.",
-                sleep_time,
-                bucket_id,
-            )
+        queue = self.__queues.get(key)
+        if queue is None:
+            queue = self.__queues[key] = PriorityLock()
+
+        await _acquire(queue, priority, expires)
+
+        try:
+            if endpoint.lstrip("/").startswith(GLOBAL_EXEMPT_ROUTES):
+                while wait := (await self.state.reserve(key, None))[0]:
+                    await self.__wait_for_bucket(key, wait, expires)
+            else:
+                while wait := await self.__reserve(key, priority, expires):
+                    await self.__wait_for_bucket(key, wait, expires)
+        finally:
+            queue.release()
+
+            if not queue.locked() and self.__queues.get(key) is queue:
+                # Don't keep a queue around for every channel and guild.
+                del self.__queues[key]
+
+    async def __reserve(
+        self, key: Optional[str], priority: Priority, expires: Optional[float]
+    ) -> float:
+        """Reserves a request in the global queue. Returns the seconds until
+        the bucket has room again if it is exhausted, without holding the
+        global queue while waiting for it."""
+        await _acquire(self.__global_queue, priority, expires)
+
+        try:
+            while True:
+                wait, scope = await self.state.reserve(key, self.global_limit)
+
+                if scope != "global":
+                    return wait
+
+                await _sleep(wait, expires)
+        finally:
+            self.__global_queue.release()
 
-            await sleep(sleep_time)
+    @staticmethod
+    async def __wait_for_bucket(key: str, sleep_time: float, expires: Optional[float]):
+        _log.info(
+            "Waiting for %ss until rate limit for bucket %s is over.",
+            sleep_time,
+            key,
+        )
+
+        await _sleep(sleep_time, expires)
+
+        _log.info("Bucket %s rate limit ended.", key)
+
+
+async def _acquire(queue: PriorityLock, priority: Priority, expires: Optional[float]):
+    if expires is None:
+        return await queue.acquire(priority)
+
+    try:
+        await wait_for(queue.acquire(priority), expires - time())
+    except TimeoutError:
+        raise DeadlineExceededError(
+            "Request deadline passed while waiting in the queue."
+        )
+
+
+async def _sleep(seconds: float, expires: Optional[float]):
+    if expires is not None and time() + seconds > expires:
+        raise DeadlineExceededError(
+            f"Request deadline would pass while waiting {seconds:.2f}s "
+            "for the rate limit."
+        )
 
-            _log.info("Message sent. Bucket %s rate limit ended.", bucket_id)
+    await sleep(seconds)
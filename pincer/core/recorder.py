@@ -0,0 +1,266 @@
+# Copyright Pincer 2021-Present
+# Full MIT License can be found in `LICENSE` at the project root.
+
+"""Records gateway traffic and replays it into a client without a network.
+
+Recordings hold the frames as they were received, before decompression, so
+a replay goes through the same decompression and parsing as live traffic::
+
+    client = Client("token", recorder=GatewayRecorder("traffic.pgr"))
+    client.run()
+
+    # Later, offline:
+    replay = GatewayReplay("traffic.pgr", speed=None)
+    client = Client("token", gateway_info=replay.gateway_info)
+    client.loop.run_until_complete(replay.run(client))
+    print(f"{replay.rate:.0f} frames per second")
+"""
+
+from __future__ import annotations
+
+import logging
+from asyncio import get_running_loop, sleep
+from struct import Struct
+from time import monotonic
+from typing import TYPE_CHECKING, NamedTuple
+
+from . import __package__
+
+if TYPE_CHECKING:
+    from typing import BinaryIO, Dict, Iterator, Optional, Union
+
+    from .gateway import Gateway, GatewayInfo
+    from ..client import Client
+
+_log = logging.getLogger(__package__)
+
+MAGIC = b"PGR\x01"
+
+#: Seconds since the recording started, kind, shard, amount of shards and
+#: the length of the data which follows.
+_HEADER = Struct("<dBHHI")
+
+TEXT, BINARY, CONNECT = range(3)
+
+
+class RecordedFrame(NamedTuple):
+    """A frame of a recording.
+
+    Attributes
+    ----------
+    time : :class:`float`
+        Seconds since the recording started.
+    kind : :class:`int`
+        ``TEXT`` or ``BINARY`` for websocket messages, ``CONNECT`` when the
+        shard opened a new connection.
+    shard : :class:`int`
+        The ID of the shard which received the frame.
+    num_shards : :class:`int`
+        The amount of shards of the recorded bot.
+    data : :class:`bytes`
+        The frame as it was received.
+    """
+
+    time: float
+    kind: int
+    shard: int
+    num_shards: int
+    data: bytes
+
+
+class GatewayRecorder:
+    """Appends the frames received by the shards of a client to a file.
+
+    Parameters
+    ----------
+    path : :class:`str`
+        The file to append to, it is created if it doesn't exist.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.frames: int = 0
+
+        self.__file: Optional[BinaryIO] = None
+        self.__start: float = 0
+
+    def record(self, gateway: Gateway, kind: int, data: Union[str, bytes] = b""):
+        """Appends a frame.
+
+        Parameters
+        ----------
+        gateway : :class:`~pincer.core.gateway.Gateway`
+            The shard which received the frame.
+        kind : :class:`int`
+            ``TEXT``, ``BINARY`` or ``CONNECT``.
+        data : Union[:class:`str`, :class:`bytes`]
+            The frame as it was received. |default| ``b""``
+        """
+        if self.__file is None:
+            self.__file = open(self.path, "ab")
+            self.__start = monotonic()
+
+            if not self.__file.tell():
+                self.__file.write(MAGIC)
+
+        if isinstance(data, str):
+            data = data.encode()
+
+        self.__file.write(
+            _HEADER.pack(
+                monotonic() - self.__start,
+                kind,
+                gateway.shard,
+                gateway.num_shards,
+                len(data),
+            )
+        )
+        self.__file.write(data)
+        self.frames += 1
+
+    def close(self):
+        """Flushes and closes the file."""
+        if self.__file is not None:
+            self.__file.close()
+            self.__file = None
+
+
+def read_recording(path: str) -> Iterator[RecordedFrame]:
+    """
+    Parameters
+    ----------
+    path : :class:`str`
+        A file written by :class:`~pincer.core.recorder.GatewayRecorder`.
+
+    Yields
+    ------
+    :class:`~pincer.core.recorder.RecordedFrame`
+        The frames in the order they were received. A recording which was
+        appended to several times starts its time over for every session.
+
+    Raises
+    ------
+    ValueError
+        The file is not a recording.
+    """
+    with open(path, "rb") as file:
+        if file.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"{path} is not a gateway recording.")
+
+        while header := file.read(_HEADER.size):
+            if len(header) < _HEADER.size:
+                # The recording was interrupted while writing.
+                return
+
+            time, kind, shard, num_shards, length = _HEADER.unpack(header)
+            data = file.read(length)
+
+            if len(data) < length:
+                return
+
+            yield RecordedFrame(time, kind, shard, num_shards, data)
+
+
+class GatewayReplay:
+    """Feeds a recording into a client as if it was received from Discord.
+
+    Commands the client sends in response, like heartbeats, are dropped as
+    there is no connection.
+
+    Parameters
+    ----------
+    path : :class:`str`
+        The recording.
+    speed : Optional[:class:`float`]
+        Multiplier of the recorded timing, :data:`None` to replay as fast
+        as possible. |default| ``1``
+
+    Attributes
+    ----------
+    frames : :class:`int`
+        Amount of frames which have been replayed.
+    duration : :class:`float`
+        Seconds the last replay took, including waiting for the dispatch
+        pipelines to finish.
+    """
+
+    def __init__(self, path: str, speed: Optional[float] = 1):
+        self.path = path
+        self.speed = speed
+
+        self.frames: int = 0
+        self.duration: float = 0
+
+    @property
+    def rate(self) -> float:
+        """:class:`float`: Frames handled per second by the last replay."""
+        return self.frames / self.duration if self.duration else 0
+
+    @property
+    def gateway_info(self) -> GatewayInfo:
+        """:class:`~pincer.core.gateway.GatewayInfo`: Gateway info matching
+        the recording, to create a client without fetching it."""
+        # The gateway module imports the frame kinds from this one.
+        from .gateway import GatewayInfo
+
+        num_shards = next((frame.num_shards for frame in read_recording(self.path)), 1)
+
+        return GatewayInfo.from_dict(
+            {
+                "url": "wss://replay.invalid",
+                "shards": num_shards,
+                "session_start_limit": {
+                    "total": 1000,
+                    "remaining": 1000,
+                    "reset_after": 0,
+                    "max_concurrency": 1,
+                },
+            }
+        )
+
+    async def run(self, client: Client):
+        """|coro|
+        Replays the recording. The client's shards are created without
+        connecting, those are closed once every dispatch has been handled.
+
+        Parameters
+        ----------
+        client : :class:`~pincer.client.Client`
+            The client to feed.
+        """
+        loop = get_running_loop()
+        shards: Dict[int, Gateway] = {}
+        self.frames = 0
+        start = loop.time()
+
+        try:
+            for frame in read_recording(self.path):
+                if self.speed is not None:
+                    wait = start + frame.time / self.speed - loop.time()
+
+                    if wait > 0:
+                        await sleep(wait)
+
+                gateway = shards.get(frame.shard)
+
+                if gateway is None:
+                    gateway = shards[frame.shard] = await client.create_shard(
+                        frame.shard, frame.num_shards
+                    )
+
+                if frame.kind == CONNECT:
+                    gateway.inflator.reset()
+                else:
+                    await gateway.handle_frame(frame.data, frame.kind == BINARY)
+
+                self.frames += 1
+
+            for gateway in shards.values():
+                await gateway.pipeline.join()
+        finally:
+            self.duration = loop.time() - start
+
+            for gateway in shards.values():
+                await gateway.close()
+
+        _log.info("Replayed %s frames in %.2f seconds", self.frames, self.duration)
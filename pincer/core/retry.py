@@ -0,0 +1,143 @@
+# Copyright Pincer 2021-Present
+# Full MIT License can be found in `LICENSE` at the project root.
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from random import uniform
+from time import monotonic
+from typing import TYPE_CHECKING
+
+from . import __package__
+
+if TYPE_CHECKING:
+    from typing import Optional
+
+_log = logging.getLogger(__package__)
+
+
+@dataclass
+class RetryPolicy:
+    """Decides how often and how long a failed request is retried.
+
+    Attributes
+    ----------
+    max_attempts : :class:`int`
+        Maximum amount of times a request is sent, including rate limited
+        attempts. |default| ``5``
+    base_delay : :class:`float`
+        Delay in seconds before the first retry, it doubles with every
+        attempt. |default| ``0.5``
+    max_delay : :class:`float`
+        Upper bound of a single backoff delay in seconds. |default| ``30``
+    budget : Optional[:class:`float`]
+        Total amount of seconds a request may spend on retries before it
+        fails, :data:`None` for no limit. |default| ``60``
+    jitter : :class:`bool`
+        Randomize the backoff delay so retries of concurrent requests
+        don't arrive at the same time. |default| :data:`True`
+    failure_threshold : :class:`int`
+        Amount of consecutive server errors on a route which open its
+        circuit breaker. |default| ``5``
+    recovery_time : :class:`float`
+        Seconds an open circuit breaker fails requests before a probe
+        request is let through. |default| ``30``
+    """
+
+    max_attempts: int = 5
+    base_delay: float = 0.5
+    max_delay: float = 30
+    budget: Optional[float] = 60
+    jitter: bool = True
+    failure_threshold: int = 5
+    recovery_time: float = 30
+
+    def backoff(self, attempt: int) -> float:
+        """
+        Parameters
+        ----------
+        attempt : :class:`int`
+            The amount of attempts which have failed so far.
+
+        Returns
+        -------
+        :class:`float`
+            Seconds to wait before the next attempt.
+        """
+        delay = min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+        return uniform(0, delay) if self.jitter else delay
+
+
+class CircuitBreaker:
+    """Tracks the server errors of a route. Once ``threshold`` consecutive
+    requests failed, the breaker opens and requests fail without being sent
+    until ``recovery_time`` has passed. Then a single probe request is let
+    through, which closes the breaker again if it succeeds.
+
+    Parameters
+    ----------
+    threshold : :class:`int`
+        Amount of consecutive failures which open the breaker.
+    recovery_time : :class:`float`
+        Seconds the breaker stays open.
+    """
+
+    def __init__(self, threshold: int, recovery_time: float):
+        self.threshold = threshold
+        self.recovery_time = recovery_time
+
+        self.failures: int = 0
+        self.__opened_at: Optional[float] = None
+        self.__probing: bool = False
+
+    @property
+    def is_open(self) -> bool:
+        """:class:`bool`: Whether requests currently fail fast."""
+        return self.__opened_at is not None
+
+    def allow(self) -> bool:
+        """
+        Returns
+        -------
+        :class:`bool`
+            Whether a request may be sent. Claims the probe if the breaker
+            has been open for ``recovery_time`` seconds.
+        """
+        if self.__opened_at is None:
+            return True
+
+        if self.__probing or (monotonic() - self.__opened_at < self.recovery_time):
+            return False
+
+        self.__probing = True
+        return True
+
+    def record_success(self):
+        """Closes the breaker."""
+        if self.__opened_at is not None:
+            _log.info("Circuit breaker closed after a successful probe.")
+
+        self.failures = 0
+        self.__opened_at = None
+        self.__probing = False
+
+    def record_failure(self):
+        """Counts a failure, opening the breaker on ``threshold`` consecutive
+        failures or a failed probe."""
+        self.failures += 1
+
+        if self.__probing or self.failures >= self.threshold:
+            if not self.__probing:
+                _log.warning(
+                    "Circuit breaker opened after %s consecutive failures.",
+                    self.failures,
+                )
+
+            self.__opened_at = monotonic()
+            self.__probing = False
+
+    def release(self):
+        """Gives up a claimed probe without a verdict, e.g. when the probe
+        request was cancelled or failed unexpectedly."""
+        self.__probing = False
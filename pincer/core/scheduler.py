@@ -0,0 +1,109 @@
+# Copyright Pincer 2021-Present
+# Full MIT License can be found in `LICENSE` at the project root.
+
+from __future__ import annotations
+
+from asyncio import CancelledError, get_running_loop
+from enum import IntEnum
+from heapq import heapify, heappop, heappush
+from itertools import count
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from asyncio import Future
+    from typing import List, Tuple
+
+
+class Priority(IntEnum):
+    """The priority class of an outbound request. Requests with a lower
+    value are sent first when they wait for the same rate limit.
+
+    Attributes
+    ----------
+    INTERACTION:
+        Interaction callbacks and followups, these have a hard deadline.
+    USER:
+        User facing sends, the default for every request.
+    BACKGROUND:
+        Bulk work which can wait, e.g. mass role assignment.
+    """
+
+    INTERACTION = 0
+    USER = 1
+    BACKGROUND = 2
+
+
+class PriorityLock:
+    """A lock which is handed to the waiter with the lowest priority value
+    first. Waiters with the same priority are served in FIFO order.
+    """
+
+    def __init__(self) -> None:
+        self.__waiters: List[Tuple[int, int, Future]] = []
+        self.__counter = count()
+        self.__locked: bool = False
+
+    def __len__(self) -> int:
+        return len(self.__waiters)
+
+    def locked(self) -> bool:
+        """Returns whether the lock is currently held."""
+        return self.__locked
+
+    def waiting(self, priority: Priority = Priority.USER) -> int:
+        """
+        Parameters
+        ----------
+        priority : :class:`~pincer.core.scheduler.Priority`
+            The priority class of a new waiter. |default| ``Priority.USER``
+
+        Returns
+        -------
+        :class:`int`
+            The amount of waiters that would be served before a new waiter
+            with this priority, including the current holder.
+        """
+        return self.__locked + sum(waiter[0] <= priority for waiter in self.__waiters)
+
+    async def acquire(self, priority: Priority = Priority.USER):
+        """|coro|
+        Waits until the lock is handed to this waiter.
+
+        Parameters
+        ----------
+        priority : :class:`~pincer.core.scheduler.Priority`
+            The priority class of the waiter. |default| ``Priority.USER``
+        """
+        if not self.__locked and not self.__waiters:
+            self.__locked = True
+            return
+
+        waiter = (
+            priority,
+            next(self.__counter),
+            get_running_loop().create_future(),
+        )
+        heappush(self.__waiters, waiter)
+
+        try:
+            await waiter[2]
+        except CancelledError:
+            if waiter[2].done() and not waiter[2].cancelled():
+                # The lock was handed over right before the cancellation.
+                self.release()
+            else:
+                self.__waiters.remove(waiter)
+                heapify(self.__waiters)
+            raise
+
+    def release(self):
+        """Hands the lock to the next waiter, or unlocks it if there is
+        none."""
+        while self.__waiters:
+            *_, future = heappop(self.__waiters)
+
+            if not future.done():
+                future.set_result(None)
+                return
+
+        self.__locked = False
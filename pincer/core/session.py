@@ -0,0 +1,162 @@
+# Copyright Pincer 2021-Present
+# Full MIT License can be found in `LICENSE` at the project root.
+
+from __future__ import annotations
+
+import logging
+import os
+from abc import ABC, abstractmethod
+from dataclasses import asdict, dataclass, field
+from time import time
+from typing import TYPE_CHECKING
+
+from . import __package__
+from ..utils.codec import dumps, loads
+
+if TYPE_CHECKING:
+    from typing import List, Optional
+
+_log = logging.getLogger(__package__)
+
+
+@dataclass
+class GatewaySession:
+    """What a shard needs to resume its session.
+
+    Attributes
+    ----------
+    session_id : :class:`str`
+        The session id of the ``READY`` event.
+    seq : :class:`int`
+        The last sequence number the shard received.
+    resume_url : Optional[:class:`str`]
+        The ``resume_gateway_url`` of the ``READY`` event.
+    saved_at : :class:`float`
+        Epoch time at which the session was saved.
+    """
+
+    session_id: str
+    seq: int
+    resume_url: Optional[str] = None
+    saved_at: float = field(default_factory=time)
+
+
+class SessionStore(ABC):
+    """Keeps the sessions of shards so they can resume after the process
+    restarts instead of identifying again.
+
+    Parameters
+    ----------
+    max_age : :class:`float`
+        Seconds after which a saved session is not resumed anymore, Discord
+        invalidates sessions which have been disconnected for too long.
+        |default| ``300``
+    """
+
+    def __init__(self, max_age: float = 300):
+        self.max_age = max_age
+
+    def load(self, shard_key: List[int]) -> Optional[GatewaySession]:
+        """
+        Parameters
+        ----------
+        shard_key : List[:class:`int`]
+            The shard id and the amount of shards.
+
+        Returns
+        -------
+        Optional[:class:`~pincer.core.session.GatewaySession`]
+            The saved session, :data:`None` if there is none which is recent
+            enough to be resumed.
+        """
+        session = self.get(shard_key)
+
+        if session is None or time() - session.saved_at > self.max_age:
+            return None
+
+        return session
+
+    @abstractmethod
+    def get(self, shard_key: List[int]) -> Optional[GatewaySession]:
+        """
+        Parameters
+        ----------
+        shard_key : List[:class:`int`]
+            The shard id and the amount of shards.
+
+        Returns
+        -------
+        Optional[:class:`~pincer.core.session.GatewaySession`]
+            The saved session regardless of its age.
+        """
+
+    @abstractmethod
+    def save(self, shard_key: List[int], session: GatewaySession):
+        """Saves the session of a shard, replacing the previous one.
+
+        Parameters
+        ----------
+        shard_key : List[:class:`int`]
+            The shard id and the amount of shards.
+        session : :class:`~pincer.core.session.GatewaySession`
+            The session to save.
+        """
+
+    @abstractmethod
+    def delete(self, shard_key: List[int]):
+        """Removes the session of a shard, which can't be resumed anymore.
+
+        Parameters
+        ----------
+        shard_key : List[:class:`int`]
+            The shard id and the amount of shards.
+        """
+
+
+class FileSessionStore(SessionStore):
+    """Saves every shard's session in its own JSON file.
+
+    Parameters
+    ----------
+    directory : :class:`str`
+        The directory to save the sessions in, it is created if it doesn't
+        exist.
+    max_age : :class:`float`
+        Seconds after which a saved session is not resumed anymore.
+        |default| ``300``
+    """
+
+    def __init__(self, directory: str, max_age: float = 300):
+        super().__init__(max_age)
+        self.directory = directory
+
+    def __path(self, shard_key: List[int]) -> str:
+        shard, num_shards = shard_key
+        return os.path.join(self.directory, f"{shard}-{num_shards}.json")
+
+    def get(self, shard_key: List[int]) -> Optional[GatewaySession]:
+        try:
+            with open(self.__path(shard_key), "rb") as file:
+                return GatewaySession(**loads(file.read()))
+        except FileNotFoundError:
+            return None
+        except (ValueError, TypeError) as e:
+            _log.warning("%s Ignoring the unreadable saved session: %s", shard_key, e)
+            return None
+
+    def save(self, shard_key: List[int], session: GatewaySession):
+        os.makedirs(self.directory, exist_ok=True)
+        path = self.__path(shard_key)
+
+        # Replacing the file is atomic, a crash while writing leaves the
+        # previous session intact.
+        with open(f"{path}.tmp", "w") as file:
+            file.write(dumps(asdict(session)))
+
+        os.replace(f"{path}.tmp", path)
+
+    def delete(self, shard_key: List[int]):
+        try:
+            os.remove(self.__path(shard_key))
+        except FileNotFoundError:
+            pass
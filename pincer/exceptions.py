@@ -308,9 +308,21 @@ class RateLimitError(HTTPError):
     """Error code 429."""
 
 
+class DeadlineExceededError(HTTPError):
+    """Exception raised when a request can not be sent before its deadline
+    because of rate limits, or when the next retry would be sent after it.
+    """
+
+
 class GatewayError(HTTPError):
     """Error code 502."""
 
 
 class ServerError(HTTPError):
     """Error code 5xx."""
+
+
+class CircuitOpenError(ServerError):
+    """Exception raised without sending the request when its route failed
+    repeatedly and the circuit breaker of the route is open.
+    """
@@ -37,6 +37,9 @@ async def channel_delete_middleware(
 
     channel = Channel.from_dict(payload.data)
 
+    self.http.invalidate(f"channels/{channel.id}")
+    self.http.invalidate(f"guilds/{channel.guild_id}/channels")
+
     guild = self.guilds.get(channel.guild_id)
     if guild:
         guild.channels = [c for c in guild.channels if c.id != channel.id]
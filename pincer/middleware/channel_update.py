@@ -39,6 +39,9 @@ async def channel_update_middleware(
     channel = Channel.from_dict(payload.data)
     guild = self.guilds.get(channel.guild_id)
 
+    self.http.invalidate(f"channels/{channel.id}")
+    self.http.invalidate(f"guilds/{channel.guild_id}/channels")
+
     if guild:
         guild.channels = replace(
             lambda _channel: _channel.id == channel.id,
@@ -38,6 +38,7 @@ async def guild_delete_middleware(
     guild = UnavailableGuild.from_dict(payload.data)
 
     self.guilds.pop(guild.id, None)
+    self.http.invalidate(f"guilds/{guild.id}")
 
     for channel in self.guild.channels:
         self.channels.pop(channel.id, None)
@@ -39,7 +39,10 @@ async def guild_member_add_middleware(
         ``on_guild_member_add`` and a ``GuildMemberAddEvent``
     """
 
-    return ("on_guild_member_add", GuildMemberAddEvent.from_dict(payload.data))
+    event = GuildMemberAddEvent.from_dict(payload.data)
+    self.http.invalidate(f"guilds/{event.guild_id}/members")
+
+    return ("on_guild_member_add", event)
 
 
 def export() -> Coro:
@@ -38,10 +38,10 @@ async def guild_member_remove_middleware(
         ``on_guild_member_remove`` and a ``GuildMemberRemoveEvent``
     """
 
-    return (
-        "on_guild_member_remove",
-        GuildMemberRemoveEvent.from_dict(payload.data),
-    )
+    event = GuildMemberRemoveEvent.from_dict(payload.data)
+    self.http.invalidate(f"guilds/{event.guild_id}/members")
+
+    return ("on_guild_member_remove", event)
 
 
 def export() -> Coro:
@@ -39,10 +39,10 @@ async def guild_member_update_middleware(
         ``on_guild_member_update`` and a ``GuildMemberUpdateEvent``
     """
 
-    return (
-        "on_guild_member_update",
-        GuildMemberUpdateEvent.from_dict(payload.data),
-    )
+    event = GuildMemberUpdateEvent.from_dict(payload.data)
+    self.http.invalidate(f"guilds/{event.guild_id}/members/{event.user.id}")
+
+    return ("on_guild_member_update", event)
 
 
 def export() -> Coro:
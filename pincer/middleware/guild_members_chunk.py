@@ -39,10 +39,12 @@ async def guild_member_chunk_middleware(
         ``on_guild_member_chunk`` and a ``GuildMembersChunkEvent``
     """  # noqa: E501
 
-    return (
-        "on_guild_member_chunk",
-        GuildMembersChunkEvent.from_dict(payload.data),
-    )
+    event = GuildMembersChunkEvent.from_dict(payload.data)
+
+    # Chunks of `Guild.request_members` are routed to the request as well.
+    gateway.member_requests.feed(event)
+
+    return ("on_guild_member_chunk", event)
 
 
 def export() -> Coro:
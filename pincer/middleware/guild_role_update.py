@@ -38,6 +38,7 @@ async def guild_role_update_middleware(
 
     event = GuildRoleUpdateEvent.from_dict(payload.data)
     guild = self.guilds.get(event.guild_id)
+    self.http.invalidate(f"guilds/{event.guild_id}/roles")
 
     if guild:
         guild.roles = [
@@ -37,6 +37,7 @@ async def guild_update_middleware(
 
     guild = Guild.from_dict(payload.data)
     self.guilds[guild.id] = guild
+    self.http.invalidate(f"guilds/{guild.id}")
 
     for channel in guild.channels:
         self.channels[channel.id] = channel
@@ -12,6 +12,7 @@ from typing import TYPE_CHECKING
 from ..commands import ChatCommandHandler
 from ..exceptions import InvalidPayload
 from ..objects.user.user import User
+from ..utils.snowflake import Snowflake
 
 if TYPE_CHECKING:
     from typing import Tuple
@@ -41,7 +42,9 @@ async def on_ready_middleware(
         ``on_ready``
     """
 
-    gateway.set_session_id(payload.data.get("session_id"))
+    gateway.set_session_id(
+        payload.data.get("session_id"), payload.data.get("resume_gateway_url")
+    )
 
     user = payload.data.get("user")
     guilds = payload.data.get("guilds")
@@ -53,7 +56,11 @@ async def on_ready_middleware(
         )
 
     self.bot = User.from_dict(user)
-    self.guilds = dict(map(lambda i: (i["id"], None), guilds))
+
+    # Every shard sends its own guilds, which are kept as `None` until their
+    # GUILD_CREATE arrives.
+    for guild in guilds:
+        self.guilds.setdefault(Snowflake(guild["id"]), None)
 
     await ChatCommandHandler(self).initialize()
     return ("on_ready",)
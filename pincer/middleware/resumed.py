@@ -10,6 +10,9 @@ from __future__ import annotations
 import logging
 from typing import TYPE_CHECKING
 
+from ..commands import ChatCommandHandler
+from ..objects.user.user import User
+
 if TYPE_CHECKING:
     from typing import Tuple
     from ..utils.types import Coro
@@ -25,7 +28,10 @@ async def on_resumed(
 ) -> Tuple[str]:
     """|coro|
 
-    Middleware for the ``on_resumed`` event.
+    Middleware for the ``on_resumed`` event. A session which was saved
+    before the process restarted is resumed without ``READY``, the bot
+    user is fetched and the commands are registered instead, after which
+    ``on_ready`` is called.
 
     Parameters
     ----------
@@ -37,7 +43,7 @@ async def on_resumed(
     Returns
     -------
     Tuple[:class:`str`]
-        ``on_ready``
+        ``on_resumed``, or ``on_ready`` on the first resume of the process.
     """
 
     _log.debug(
@@ -46,6 +52,19 @@ async def on_resumed(
     )
     gateway.start_heartbeat()
 
+    if gateway.identify_scheduler:
+        gateway.identify_scheduler.mark_ready(gateway.shard)
+
+    if self.bot is None:
+        _log.debug(
+            "%s Resumed a saved session, fetching the bot user.",
+            gateway.shard_key,
+        )
+        self.bot = User.from_dict(await self.http.get("users/@me"))
+
+        await ChatCommandHandler(self).initialize()
+        return ("on_ready",)
+
     return ("on_resumed",)
 
 
@@ -35,7 +35,10 @@ async def user_update_middleware(
     Tuple[:class:`str`, :class:`~pincer.objects.user.user.User`]
         ``on_user_update`` and a ``User``
     """
-    return ("on_user_update", User.from_dict(payload.data))
+    user = User.from_dict(payload.data)
+    self.http.invalidate(f"users/{user.id}")
+
+    return ("on_user_update", user)
 
 
 def export() -> Coro:
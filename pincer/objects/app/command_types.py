@@ -3,7 +3,10 @@
 
 from enum import IntEnum
 
+from ...utils.types import TYPE_REGISTRY
 
+
+@TYPE_REGISTRY.register
 class AppCommandType(IntEnum):
     """
     Defines the different types of application commands.
@@ -28,6 +31,7 @@ class AppCommandType(IntEnum):
     MESSAGE = 3
 
 
+@TYPE_REGISTRY.register
 class AppCommandOptionType(IntEnum):
     """
     Represents a parameter type.
@@ -5,7 +5,10 @@ from __future__ import annotations
 
 from enum import IntFlag
 
+from ...utils.types import TYPE_REGISTRY
 
+
+@TYPE_REGISTRY.register
 class Intents(IntFlag):
     """Discord client intents.
 
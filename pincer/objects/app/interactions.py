@@ -16,6 +16,7 @@ from ..message.context import MessageContext
 from ..message.message import Message
 from ..message.user_message import UserMessage
 from ..user import User
+from ...core.scheduler import Priority
 from ...exceptions import (
     InteractionDoesNotExist,
     UseFollowup,
@@ -425,6 +426,7 @@ class Interaction(APIObject, ChannelProperty, GuildProperty):
             f"webhooks/{self._client.bot.id}/{self.token}/messages/@original",
             data,
             content_type=content_type,
+            priority=Priority.INTERACTION,
         )
         self.__post_sent(message)
         return UserMessage.from_dict(resp)
@@ -501,6 +503,7 @@ class Interaction(APIObject, ChannelProperty, GuildProperty):
             f"webhooks/{self._client.bot.id}/{self.token}",
             data,
             content_type=content_type,
+            priority=Priority.INTERACTION,
         )
         msg = UserMessage.from_dict(resp)
         self.__post_followup_sent(msg, message)
@@ -532,6 +535,7 @@ class Interaction(APIObject, ChannelProperty, GuildProperty):
             f"webhooks/{self._client.bot.id}/{self.token}/messages/{message_id}",
             data,
             content_type=content_type,
+            priority=Priority.INTERACTION,
         )
         msg = UserMessage.from_dict(resp)
         self.__post_followup_sent(msg, message)
@@ -7,7 +7,7 @@ from dataclasses import dataclass
 from enum import IntEnum
 from typing import TYPE_CHECKING
 
-from ...utils.api_object import APIObject, GuildProperty
+from ...utils.api_object import APIObject, GuildProperty, slotted
 from ...utils.types import MISSING, APINullable
 
 if TYPE_CHECKING:
@@ -258,6 +258,7 @@ class ClientStatus(APIObject):
     web: APINullable[str] = MISSING
 
 
+@slotted
 @dataclass(repr=False)
 class PresenceUpdateEvent(APIObject, GuildProperty):
     """This event is sent when a user's presence or info,
@@ -12,7 +12,7 @@ from .invite import Invite, InviteTargetType
 from ..message.user_message import UserMessage
 from ..._config import GatewayConfig
 from ...utils.api_data import APIDataGen
-from ...utils.api_object import APIObject, GuildProperty
+from ...utils.api_object import APIObject, GuildProperty, slotted
 from ...utils.convert_message import convert_message
 from ...utils.types import MISSING
 
@@ -81,6 +81,7 @@ class ChannelType(IntEnum):
     GUILD_STAGE_VOICE = 13
 
 
+@slotted
 @dataclass(repr=False)
 class Channel(APIObject, GuildProperty):  # noqa E501
     """Represents a Discord Channel Mention object
@@ -742,6 +743,8 @@ class Channel(APIObject, GuildProperty):  # noqa E501
 class TextChannel(Channel):
     """A subclass of ``Channel`` for text channels with all the same attributes."""
 
+    __slots__ = ()
+
     @overload
     async def edit(
         self,
@@ -847,6 +850,8 @@ class TextChannel(Channel):
 class VoiceChannel(Channel):
     """A subclass of ``Channel`` for voice channels with all the same attributes."""
 
+    __slots__ = ()
+
     @overload
     async def edit(
         self,
@@ -880,16 +885,22 @@ class VoiceChannel(Channel):
 class GroupDMChannel(Channel):
     """A subclass of ``Channel`` for Group DMs"""
 
+    __slots__ = ()
+
 
 class CategoryChannel(Channel):
     """A subclass of ``Channel`` for categories channels
     with all the same attributes.
     """
 
+    __slots__ = ()
+
 
 class NewsChannel(Channel):
     """A subclass of ``Channel`` for news channels with all the same attributes."""
 
+    __slots__ = ()
+
     @overload
     async def edit(
         self,
@@ -924,6 +935,8 @@ class NewsChannel(Channel):
 class Thread(Channel):
     """A subclass of ``Channel`` for threads with all the same attributes."""
 
+    __slots__ = ()
+
     async def start(
         self,
         name: Optional[str] = None,
@@ -1122,10 +1135,14 @@ class Thread(Channel):
 class PublicThread(Thread):
     """A subclass of ``Thread`` for public threads with all the same attributes."""
 
+    __slots__ = ()
+
 
 class PrivateThread(Thread):
     """A subclass of ``Thread`` for private threads with all the same attributes."""
 
+    __slots__ = ()
+
 
 @dataclass(repr=False)
 class ThreadsResponse(APIObject):
@@ -5,7 +5,10 @@ from __future__ import annotations
 
 from enum import Enum
 
+from ...utils.types import TYPE_REGISTRY
 
+
+@TYPE_REGISTRY.register
 class GuildFeature(Enum):
     """Represents Guild Features strings.
 
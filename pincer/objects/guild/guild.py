@@ -3,6 +3,7 @@
 
 from __future__ import annotations
 
+from asyncio import TimeoutError, wait_for
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import IntEnum
@@ -14,6 +15,8 @@ from .channel import Channel, Thread
 from .scheduled_events import ScheduledEvent, GuildScheduledEventUser
 from ..message.emoji import Emoji
 from ..message.file import File
+from ...core.dispatch import GatewayDispatch
+from ...exceptions import TimeoutError as PincerTimeoutError
 from ...exceptions import UnavailableGuildError
 from ...utils import remove_none
 from ...utils.api_data import APIDataGen
@@ -34,7 +37,17 @@ from ..voice.region import VoiceRegion
 from ..message.sticker import Sticker
 
 if TYPE_CHECKING:
-    from typing import Any, Dict, List, Optional, Tuple, Union, Generator
+    from typing import (
+        Any,
+        AsyncIterator,
+        Dict,
+        Generator,
+        Iterable,
+        List,
+        Optional,
+        Tuple,
+        Union,
+    )
 
     from ..events.presence import PresenceUpdateEvent
     from .channel import ChannelType
@@ -681,6 +694,144 @@ class Guild(APIObject):
             ),
         )
 
+    async def request_members(
+        self,
+        query: Optional[str] = None,
+        *,
+        user_ids: Optional[Iterable[Snowflake]] = None,
+        limit: int = 0,
+        presences: bool = False,
+        timeout: Optional[float] = 30,
+    ) -> AsyncIterator[GuildMember]:
+        """Requests guild members through the gateway, which sends them in
+        chunks of up to 1000 members. This needs one gateway command where
+        the REST API needs a request per member or per page.
+
+        This is an async iterator, use it with ``async for`` instead of
+        awaiting it:
+
+        .. code-block:: python
+
+            async for member in guild.request_members("Nel"):
+                print(member.username)
+
+        Without ``query`` and ``user_ids`` all members are requested, which
+        requires the ``GUILD_MEMBERS`` intent. The received members are
+        added to :attr:`members`.
+
+        Parameters
+        ----------
+        query : Optional[:class:`str`]
+            Only members whose username starts with this string.
+            |default| :data:`None`
+        user_ids : Optional[Iterable[:class:`~pincer.utils.snowflake.Snowflake`]]
+            Only these members, at most 100. |default| :data:`None`
+        limit : :class:`int`
+            Maximum amount of members matching ``query``, ``0`` for no
+            limit. |default| ``0``
+        presences : :class:`bool`
+            Whether to request the presences of the members, requires the
+            ``GUILD_PRESENCES`` intent. |default| :data:`False`
+        timeout : Optional[:class:`float`]
+            Seconds to wait for the next chunk. |default| ``30``
+
+        Yields
+        ------
+        :class:`~pincer.objects.guild.member.GuildMember`
+            The members as their chunks arrive.
+
+        Raises
+        ------
+        ValueError
+            Both ``query`` and ``user_ids`` were passed.
+        :class:`~pincer.exceptions.TimeoutError`
+            A chunk didn't arrive within ``timeout`` seconds.
+        """  # noqa: E501
+        if query is not None and user_ids is not None:
+            raise ValueError("`query` and `user_ids` can't be combined.")
+
+        if user_ids is None and query is None:
+            query = ""
+
+        gateway = self._client.get_shard(self.id)
+        nonce, chunks = gateway.member_requests.open()
+
+        try:
+            await gateway.send(
+                GatewayDispatch(
+                    8,
+                    remove_none(
+                        {
+                            "guild_id": self.id,
+                            "query": query,
+                            "user_ids": user_ids and list(user_ids),
+                            "limit": limit,
+                            "presences": presences,
+                            "nonce": nonce,
+                        }
+                    ),
+                )
+            )
+
+            cache = self.__member_cache()
+            received = 0
+
+            while True:
+                try:
+                    chunk = await wait_for(chunks.get(), timeout)
+                except TimeoutError:
+                    raise PincerTimeoutError(
+                        "request_members() timed out while waiting for a"
+                        " chunk."
+                    )
+
+                cache(chunk.members)
+
+                for member in chunk.members:
+                    yield member
+
+                received += 1
+                if received >= chunk.chunk_count:
+                    return
+        finally:
+            gateway.member_requests.close(nonce)
+
+    def __member_cache(self):
+        """Returns a function which adds members to the member list of this
+        guild and of the client's copy, replacing members with the same
+        id."""
+        guilds = [self]
+
+        cached = self._client.guilds.get(self.id)
+        if cached is not None and cached is not self:
+            guilds.append(cached)
+
+        targets = []
+        for guild in guilds:
+            if guild.members is MISSING:
+                guild.members = []
+
+            # Members keep the fields of their user, not the user itself.
+            index = {
+                member.id: i
+                for i, member in enumerate(guild.members)
+                if member.id is not MISSING
+            }
+            targets.append((guild.members, index))
+
+        def add(members: List[GuildMember]):
+            for member_list, index in targets:
+                for member in members:
+                    position = index.get(member.id)
+
+                    if position is None:
+                        index[member.id] = len(member_list)
+                        member_list.append(member)
+                    else:
+                        member_list[position] = member
+
+        return add
+
     @overload
     async def add_guild_member(
         self,
@@ -3,11 +3,11 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 from typing import TYPE_CHECKING
 
 from ..user.user import User
-from ...utils.api_object import APIObject
+from ...utils.api_object import APIObject, slotted
 from ...utils.snowflake import Snowflake
 from ...utils.timestamp import Timestamp
 from ...utils.types import MISSING
@@ -77,12 +77,23 @@ class PartialGuildMember(APIObject):
     member: Optional[BaseMember]
 
 
+@slotted
 @dataclass(repr=False)
 class GuildMember(BaseMember, User):
     """Represents a member which resides in a guild/server.
 
     Attributes
     ----------
+    deaf: :class:`bool`
+        Whether the user is deafened in voice channels
+    joined_at: :class:`~pincer.utils.timestamp.Timestamp`
+        Then the user joined the guild
+    mute: :class:`bool`
+        Whether the user is muted in voice channels
+    roles: List[:class:`~pincer.utils.snowflake.Snowflake`]
+        Array of role object ids
+    hoisted_role: APINullable[:class:`~pincer.utils.snowflake.Snowflake`]
+        The user's top role in the guild.
     nick: APINullable[Optional[:class:`str`]]
         This users guild nickname
     pending: APINullable[:class:`bool`]
@@ -134,8 +145,8 @@ class GuildMember(BaseMember, User):
         # Inspired from this thread
         # https://stackoverflow.com/questions/57962873/easiest-way-to-copy-all-fields-from-one-dataclass-instance-to-another
 
-        for key, value in user.__dict__.items():
-            setattr(self, key, value)
+        for field in fields(user):
+            setattr(self, field.name, getattr(user, field.name))
 
         self.user = MISSING
 
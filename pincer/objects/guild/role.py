@@ -6,7 +6,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
-from ...utils.api_object import APIObject
+from ...utils.api_object import APIObject, slotted
 from ...utils.types import MISSING
 
 if TYPE_CHECKING:
@@ -36,6 +36,7 @@ class RoleTags(APIObject):
     premium_subscriber: APINullable[bool] = MISSING
 
 
+@slotted
 @dataclass(repr=False)
 class Role(APIObject):
     """
@@ -5,6 +5,8 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
+from ...utils.types import TYPE_REGISTRY
+
 if TYPE_CHECKING:
 
     from typing import Optional, Union
@@ -18,6 +20,7 @@ if TYPE_CHECKING:
     from ...utils.snowflake import Snowflake
 
 
+@TYPE_REGISTRY.register
 @dataclass(repr=False)
 class MessageContext:
     """Represents the context of a message interaction.
@@ -6,7 +6,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
-from ...utils.api_object import APIObject
+from ...utils.api_object import APIObject, slotted
 from ...utils.types import MISSING
 
 if TYPE_CHECKING:
@@ -18,6 +18,7 @@ if TYPE_CHECKING:
     from ...utils.snowflake import Snowflake
 
 
+@slotted
 @dataclass(repr=False)
 class Emoji(APIObject):
     """Representation of an emoji in a class.
@@ -7,12 +7,12 @@ import os
 from base64 import b64encode
 from dataclasses import dataclass
 from io import BytesIO
-from json import dumps
 from typing import TYPE_CHECKING
 
 from aiohttp import FormData, Payload
 
 from ...exceptions import ImageEncodingError
+from ...utils.codec import dumps
 
 if TYPE_CHECKING:
     from typing import Any, Dict, List, Optional, Tuple
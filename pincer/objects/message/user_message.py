@@ -21,7 +21,12 @@ from ..guild.role import Role
 from ..user.user import User
 from ..._config import GatewayConfig
 from ...utils.api_data import APIDataGen
-from ...utils.api_object import APIObject, GuildProperty, ChannelProperty
+from ...utils.api_object import (
+    APIObject,
+    GuildProperty,
+    ChannelProperty,
+    slotted,
+)
 from ...utils.snowflake import Snowflake
 from ...utils.types import MISSING, JSONSerializable
 
@@ -252,6 +257,7 @@ class MessageActivity(APIObject):
     party_id: APINullable[str] = MISSING
 
 
+@slotted
 @dataclass(repr=False)
 class UserMessage(APIObject, GuildProperty, ChannelProperty):
     """Represents a message sent in a channel within Discord.
@@ -11,7 +11,7 @@ from typing import TYPE_CHECKING
 from aiohttp import ClientSession
 
 from ..guild import channel
-from ...utils.api_object import APIObject
+from ...utils.api_object import APIObject, slotted
 from ...utils.color import Color
 from ...utils.convert_message import MessageConvertable
 from ...utils.types import MISSING
@@ -66,6 +66,7 @@ class VisibilityType(IntEnum):
     EVERYONE = 1
 
 
+@slotted
 @dataclass(repr=False)
 class User(APIObject):
     """Represents a Discord user. This can be a bot account or a
@@ -183,11 +184,18 @@ class User(APIObject):
                 "pillow images,"
             )
 
-        async with ClientSession().get(
-            url=self.get_avatar_url(size, ext)
-        ) as resp:
-            avatar = io.BytesIO(await resp.read())
-            return Image.open(avatar).convert("RGBA")
+        url = self.get_avatar_url(size, ext)
+
+        if self._client:
+            # Reuse the pooled connections of the client.
+            async with self._client.pool.session.get(url) as resp:
+                avatar = io.BytesIO(await resp.read())
+        else:
+            async with ClientSession() as session:
+                async with session.get(url) as resp:
+                    avatar = io.BytesIO(await resp.read())
+
+        return Image.open(avatar).convert("RGBA")
 
     def __str__(self):
         # TODO: fix docs
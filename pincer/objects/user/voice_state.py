@@ -6,7 +6,12 @@ from __future__ import annotations
 from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
-from ...utils.api_object import APIObject, ChannelProperty, GuildProperty
+from ...utils.api_object import (
+    APIObject,
+    ChannelProperty,
+    GuildProperty,
+    slotted,
+)
 from ...utils.types import MISSING
 
 if TYPE_CHECKING:
@@ -16,6 +21,7 @@ if TYPE_CHECKING:
     from ...utils.timestamp import Timestamp
 
 
+@slotted
 @dataclass(repr=False)
 class VoiceState(APIObject, ChannelProperty, GuildProperty):
     """Used to represent a user's voice connection status
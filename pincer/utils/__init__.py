@@ -1,7 +1,8 @@
 # Copyright Pincer 2021-Present
 # Full MIT License can be found in `LICENSE` at the project root.
 
-from .api_object import APIObject, ChannelProperty, GuildProperty
+from .api_object import APIObject, ChannelProperty, GuildProperty, slotted
+from .codec import JSONCodec, get_codec, set_codec
 from .color import Color
 from .conversion import remove_none
 from .directory import chdir
@@ -21,6 +22,8 @@ from .types import (
     MissingType,
     choice_value_types,
     CheckFunction,
+    TYPE_REGISTRY,
+    TypeRegistry,
 )
 
 __all__ = (
@@ -32,20 +35,26 @@ __all__ = (
     "Coro",
     "EventMgr",
     "GuildProperty",
+    "JSONCodec",
     "MISSING",
     "MissingType",
     "Snowflake",
+    "TYPE_REGISTRY",
     "Task",
     "TaskScheduler",
     "Timestamp",
+    "TypeRegistry",
     "calculate_shard_id",
     "chdir",
     "choice_value_types",
+    "get_codec",
     "get_index",
     "get_params",
     "get_signature_and_params",
     "remove_none",
     "replace",
+    "set_codec",
     "should_pass_cls",
     "should_pass_ctx",
+    "slotted",
 )
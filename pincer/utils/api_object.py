@@ -5,12 +5,18 @@ from __future__ import annotations
 
 import copy
 import logging
-from dataclasses import fields, _is_dataclass_instance
+from dataclasses import fields, is_dataclass
+from datetime import datetime
 from enum import Enum, EnumMeta
-from inspect import getfullargspec
+from inspect import getattr_static, getfullargspec
 from itertools import chain
+from sys import modules
+from types import MemberDescriptorType
 from typing import (
+    Callable,
     Dict,
+    FrozenSet,
+    NamedTuple,
     Tuple,
     Union,
     Generic,
@@ -21,9 +27,12 @@ from typing import (
     get_origin,
     get_args,
     Optional,
+    Type,
 )
 
-from .types import MissingType, MISSING, TypeCache
+from .color import Color
+from .snowflake import Snowflake
+from .types import MISSING, TYPE_REGISTRY
 from ..exceptions import InvalidArgumentAnnotation
 
 if TYPE_CHECKING:
@@ -36,60 +45,446 @@ T = TypeVar("T")
 
 _log = logging.getLogger(__package__)
 
+_PACKAGE = __name__.partition(".")[0]
 
-def _asdict_ignore_none(obj: Generic[T]) -> Union[Tuple, Dict, T]:
+
+def _encode_value(value: Any) -> Any:
+    """Get the JSON representation of a value, with the encoder of its
+    type which is picked on first use.
+
+    Parameters
+    ----------
+    value: Any
+        The value to encode.
+
+    Returns
+    -------
+    Any
+        The value as it is sent to Discord.
+    """
+    encode = _encoders.get(type(value))
+
+    if encode is None:
+        encode = _encoders[type(value)] = _type_encoder(type(value))
+
+    return encode(value)
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+#: The encoders of the types which have been encoded.
+_encoders: Dict[type, Callable[[Any], Any]] = dict.fromkeys(
+    (str, int, float, bool, type(None)), _identity
+)
+
+
+def _type_encoder(tp: type) -> Callable[[Any], Any]:
+    """Create the encoder of a type.
+
+    Parameters
+    ----------
+    tp: :class:`type`
+        The type of the values.
+
+    Returns
+    -------
+    Callable[[Any], Any]
+        Encodes the values, dataclasses are encoded without their private
+        and missing fields.
+    """
+    if is_dataclass(tp):
+        names = tuple(f.name for f in fields(tp) if not f.name.startswith("_"))
+
+        def encode_dataclass(obj):
+            result = {}
+
+            for name in names:
+                value = getattr(obj, name)
+
+                if value is not MISSING:
+                    result[name] = _encode_value(value)
+
+            return result
+
+        return encode_dataclass
+
+    if issubclass(tp, Enum):
+        return lambda value: _encode_value(value.value)
+
+    # Snowflakes are strings in the API, as they are up to 64 bits.
+    if issubclass(tp, Snowflake):
+        return str
+
+    for base in (bool, int, float, str):
+        if issubclass(tp, base):
+            return base
+
+    if issubclass(tp, datetime):
+        return datetime.isoformat
+
+    if issubclass(tp, Color):
+        return lambda color: int(color.hex, 16)
+
+    if issubclass(tp, tuple) and hasattr(tp, "_fields"):
+        return lambda value: tp(*map(_encode_value, value))
+
+    if issubclass(tp, (list, tuple, set, frozenset)):
+        return lambda value: [_encode_value(item) for item in value]
+
+    if issubclass(tp, dict):
+        return lambda value: {
+            _encode_value(key): _encode_value(item)
+            for key, item in value.items()
+        }
+
+    return copy.deepcopy
+
+
+class _DecoderPlan(NamedTuple):
+    """How the objects of one class are built, computed once per class.
+
+    Attributes
+    ----------
+    args : Tuple[:class:`str`, ...]
+        The arguments of ``__init__`` which are taken from the data.
+    converters : Dict[:class:`str`, Callable[[Any], Any]]
+        The public attributes with the converter of their type annotation.
+    nested : FrozenSet[:class:`str`]
+        The slots which hold API objects, lists or dicts. Those are
+        converted on first access when ``lazy_fields`` is enabled.
     """
-    Returns a dict from a dataclass that ignores
-    all values that are None
-    Modification of _asdict_inner from dataclasses
+
+    args: Tuple[str, ...]
+    converters: Dict[str, Callable[[Any], Any]]
+    nested: FrozenSet[str]
+
+
+_plans: Dict[type, _DecoderPlan] = {}
+
+_NO_DEFAULT = object()
+
+
+def _get_types(cls: type, attr: str, arg_type: type) -> Tuple[type]:
+    """Get the types from type annotations.
 
     Parameters
     ----------
+    cls: :class:`type`
+        The class the attribute belongs to.
+    attr: :class:`str`
+        The attribute the typehint belongs to.
+    arg_type: :class:`type`
+        The type annotation for the attribute.
+
+    Returns
+    -------
+    Tuple[:class:`type`]
+        A collection of type annotation(s). Will most of the time
+        consist of 1 item.
+
+    Raises
+    ------
+    :class:`~pincer.exceptions.InvalidArgumentAnnotation`
+        Exception which is raised when the type annotation has not enough
+        or too many arguments for the parser to handle.
+    """
+    origin = get_origin(arg_type)
+
+    if origin is Union:
+        # Ahh yes, typing module has no type annotations for this...
+        # noinspection PyTypeChecker
+        args: Tuple[type] = get_args(arg_type)
+
+        if 2 <= len(args) < 4:
+            return args
+
+        raise InvalidArgumentAnnotation(
+            f"Attribute `{attr}` in `{cls.__name__}` has too many "
+            f"or not enough arguments! (got {len(args)} expected 2-3)"
+        )
+
+    return (arg_type,)
+
 
-    obj: Generic[T]
-        The object to convert
+def _attr_converter(attr_type: T) -> Callable[[Any], T]:
+    """Create the function which converts an attribute to the requested
+    attribute type using the factory or the __init__.
+
+    Parameters
+    ----------
+    attr_type: T
+        The type annotation for the attribute.
 
     Returns
     -------
-        A dict without None values
+    Callable[[Any], T]
+        Instantiates the attr_type from a value.
     """
+    # Always use `__factory__` over __init__
+    factory = getattr(attr_type, "__factory__", None) or attr_type
 
-    if _is_dataclass_instance(obj):
-        result = []
-        for f in fields(obj):
-            value = _asdict_ignore_none(getattr(obj, f.name))
+    def convert(attr_value):
+        if attr_value is MISSING:
+            return MISSING
+
+        if attr_type is not None and isinstance(attr_value, attr_type):
+            return attr_value
 
-            if isinstance(value, Enum):
-                result.append((f.name, value.value))
-            # This if statement was added to the function
-            elif not isinstance(value, MissingType) and not f.name.startswith(
-                "_"
-            ):
-                result.append((f.name, value))
+        return factory(attr_value)
 
-        return dict(result)
+    return convert
 
-    elif isinstance(obj, tuple) and hasattr(obj, "_fields"):
-        return type(obj)(*[_asdict_ignore_none(v) for v in obj])
 
-    elif isinstance(obj, (list, tuple)):
-        return type(obj)(_asdict_ignore_none(v) for v in obj)
+def _field_converter(
+    cls: type, attr: str, attr_type: type
+) -> Tuple[Callable[[Any], Any], bool]:
+    types = tuple(
+        filter(
+            lambda tpe: tpe is not None and tpe is not MISSING,
+            _get_types(cls, attr, attr_type),
+        )
+    )
 
-    elif isinstance(obj, dict):
-        return type(obj)(
-            (_asdict_ignore_none(k), _asdict_ignore_none(v))
-            for k, v in obj.items()
+    if not types:
+        raise InvalidArgumentAnnotation(
+            f"Attribute `{attr}` in `{cls.__name__}` only "
+            "consisted of missing/optional type!"
         )
-    else:
-        return copy.deepcopy(obj)
+
+    specific_tp = types[0]
+
+    if tp := get_origin(specific_tp):
+        specific_tp = tp
+
+    convert = _attr_converter(specific_tp)
+
+    if isinstance(specific_tp, EnumMeta):
+
+        def convert_enum(attr_value):
+            return convert(attr_value) if attr_value else MISSING
+
+        return convert_enum, False
+
+    if tp in (list, dict) and (classes := get_args(types[0])):
+        convert_item = _attr_converter(classes[-1])
+
+        if tp is list:
+
+            def convert_list(attr_value):
+                if not attr_value:
+                    return convert(attr_value)
+
+                return [convert_item(attr_item) for attr_item in attr_value]
+
+            return convert_list, True
+
+        def convert_dict(attr_value):
+            if not attr_value:
+                return convert(attr_value)
+
+            return {
+                key: convert_item(value) for key, value in attr_value.items()
+            }
+
+        return convert_dict, True
+
+    return convert, isinstance(specific_tp, type) and issubclass(
+        specific_tp, APIObject
+    )
+
+
+def _type_hints(cls: type) -> Dict[str, Any]:
+    """Get the type hints of a class. The annotations of every base are
+    resolved with the names of its own module first, names which are only
+    imported when type checking are taken from the registry.
+
+    Parameters
+    ----------
+    cls: :class:`type`
+        The class.
+
+    Returns
+    -------
+    Dict[:class:`str`, Any]
+        The resolved annotations, in the order of the fields.
+    """
+    hints = {}
+
+    for base in reversed(cls.__mro__):
+        annotations = base.__dict__.get("__annotations__")
+
+        if not annotations:
+            continue
+
+        module = modules.get(base.__module__)
+        namespace = {
+            **TYPE_REGISTRY.namespace,
+            **getattr(module, "__dict__", {}),
+        }
+
+        # Only the annotations of the base itself use its module.
+        own = type(base.__name__, (), {"__annotations__": annotations})
+        hints.update(get_type_hints(own, globalns=namespace))
+
+    return hints
+
+
+def _decoder_plan(cls: type) -> _DecoderPlan:
+    """Get the decoder plan of a class, the plan is created from the
+    ``__init__`` arguments and the type annotations on first use.
+
+    Parameters
+    ----------
+    cls: :class:`type`
+        A subclass of :class:`~pincer.utils.api_object.APIObject`.
+
+    Returns
+    -------
+    :class:`~pincer.utils.api_object._DecoderPlan`
+        The plan of the class.
+    """
+    if plan := _plans.get(cls):
+        return plan
+
+    converters = {}
+    nested = set()
+
+    for attr, attr_type in _type_hints(cls).items():
+        # Ignore private attributes.
+        if attr.startswith("_"):
+            continue
+
+        converters[attr], is_nested = _field_converter(cls, attr, attr_type)
+
+        # A default on the class would be found instead of ``__getattr__``
+        # while the field isn't converted, which only slots don't have.
+        default = getattr_static(cls, attr, _NO_DEFAULT)
+
+        if is_nested and (
+            default is _NO_DEFAULT or isinstance(default, MemberDescriptorType)
+        ):
+            nested.add(attr)
+
+    plan = _plans[cls] = _DecoderPlan(
+        args=tuple(getfullargspec(cls.__init__).args[1:]),
+        converters=converters,
+        nested=frozenset(nested),
+    )
+    return plan
+
+
+def slotted(cls: Type[T]) -> Type[T]:
+    """Recreate a dataclass with ``__slots__`` for its fields, so its
+    instances don't have a ``__dict__``. Does what ``slots=True`` of
+    :func:`dataclasses.dataclass` does on Python 3.10 and newer.
+
+    Only one of the base classes may have fields in slots. A base without
+    ``__slots__`` gives the instances a ``__dict__``, which stays empty
+    as the fields of the class are kept in slots.
+
+    Parameters
+    ----------
+    cls: Type[T]
+        The dataclass.
+
+    Returns
+    -------
+    Type[T]
+        The class with slots.
+    """
+    inherited = {
+        name
+        for base in cls.__mro__[1:]
+        for name in base.__dict__.get("__slots__", ())
+    }
+    # ``_lazy`` holds the raw values of the nested fields of lazy objects.
+    names = tuple(
+        name
+        for name in (*(f.name for f in fields(cls)), "_lazy")
+        if name not in inherited
+    )
+
+    cls_dict = dict(cls.__dict__)
+    cls_dict["__slots__"] = names
+
+    # The defaults are passed to ``__init__`` when the dataclass is
+    # created, the class attributes would hide the slots.
+    for name in (*(f.name for f in fields(cls)), "__dict__", "__weakref__"):
+        cls_dict.pop(name, None)
+
+    new_cls = type(cls)(cls.__name__, cls.__bases__, cls_dict)
+
+    # ``super()`` without arguments refers to the class through a closure.
+    for value in cls_dict.values():
+        value = getattr(value, "__func__", value)
+        functions = (
+            (value.fget, value.fset, value.fdel)
+            if isinstance(value, property)
+            else (value,)
+        )
+
+        for cell in chain.from_iterable(
+            getattr(func, "__closure__", None) or () for func in functions
+        ):
+            if cell.cell_contents is cls:
+                cell.cell_contents = new_cls
+
+    return new_cls
+
+
+def _attributes(obj: Any) -> Dict[str, Any]:
+    """Get the attributes of an object with or without slots.
+
+    Parameters
+    ----------
+    obj: Any
+        The object.
+
+    Returns
+    -------
+    Dict[:class:`str`, Any]
+        The fields of a dataclass in order, followed by the other
+        attributes of the instance.
+    """
+    attributes = (
+        {f.name: getattr(obj, f.name, MISSING) for f in fields(obj)}
+        if is_dataclass(obj)
+        else {}
+    )
+    attributes.update(getattr(obj, "__dict__", ()))
+    return attributes
 
 
 class APIObject:
     """
     Represents an object which has been fetched from the Discord API.
+
+    Attributes
+    ----------
+    lazy_fields: :class:`bool`
+        Whether nested objects, lists and dicts are kept as received and
+        only converted when they are first accessed. Can be enabled for
+        every object or for the objects of one class, e.g.
+        ``UserMessage.lazy_fields = True``. Only applies to classes with
+        slots, see :func:`~pincer.utils.api_object.slotted`.
+        |default| :data:`False`
     """
 
+    __slots__ = ()
+
     _client: Optional[Client] = None
+    lazy_fields = False
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+
+        # Registers the classes the annotations of Pincer's objects may use,
+        # other modules resolve their own annotations.
+        if cls.__module__.partition(".")[0] == _PACKAGE:
+            TYPE_REGISTRY.register(cls)
+            TYPE_REGISTRY.register_module(cls.__module__)
 
     @property
     def _http(self) -> HTTPClient:
@@ -110,128 +505,46 @@ class APIObject:
         """
         cls._client = client
 
-    def __get_types(self, attr: str, arg_type: type) -> Tuple[type]:
-        """Get the types from type annotations.
-
-        Parameters
-        ----------
-        attr: :class:`str`
-            The attribute the typehint belongs to.
-        arg_type: :class:`type`
-            The type annotation for the attribute.
-
-        Returns
-        -------
-        Tuple[:class:`type`]
-            A collection of type annotation(s). Will most of the time
-            consist of 1 item.
-
-        Raises
-        ------
-        :class:`~pincer.exceptions.InvalidArgumentAnnotation`
-            Exception which is raised when the type annotation has not enough
-            or too many arguments for the parser to handle.
-        """
-        origin = get_origin(arg_type)
-
-        if origin is Union:
-            # Ahh yes, typing module has no type annotations for this...
-            # noinspection PyTypeChecker
-            args: Tuple[type] = get_args(arg_type)
-
-            if 2 <= len(args) < 4:
-                return args
-
-            raise InvalidArgumentAnnotation(
-                f"Attribute `{attr}` in `{type(self).__name__}` has too many "
-                f"or not enough arguments! (got {len(args)} expected 2-3)"
-            )
-
-        return (arg_type,)
-
-    def __attr_convert(self, attr_value: Dict, attr_type: T) -> T:
-        """Convert an attribute to the requested attribute type using
-        the factory or the __init__.
-
-        Parameters
-        ----------
-        attr: :class:`str`
-            The attribute the typehint belongs to.
-        arg_type: T
-            The type annotation for the attribute.
+    def __post_init__(self):
+        plan = _decoder_plan(type(self))
 
-        Returns
-        -------
-        T
-            The instantiated version of the arg_type.
-        """
-        factory = attr_type
+        if not self.lazy_fields:
+            for attr, convert in plan.converters.items():
+                setattr(self, attr, convert(getattr(self, attr)))
 
-        # Always use `__factory__` over __init__
-        if getattr(attr_type, "__factory__", None):
-            factory = attr_type.__factory__
+            return
 
-        if attr_value is MISSING:
-            return MISSING
+        lazy = {}
 
-        if attr_type is not None and isinstance(attr_value, attr_type):
-            return attr_value
+        for attr, convert in plan.converters.items():
+            value = getattr(self, attr)
 
-        if isinstance(attr_value, dict):
-            return factory(attr_value)
+            # Empty values are cheap to convert right away.
+            if value and attr in plan.nested:
+                lazy[attr] = value
+                delattr(self, attr)
+            else:
+                setattr(self, attr, convert(value))
 
-        return factory(attr_value)
+        if lazy:
+            self._lazy = lazy
 
-    def __post_init__(self):
-        TypeCache()
+    def __getattr__(self, name: str) -> Any:
+        # Only called for attributes which are not set, like the nested
+        # fields of a lazy object which haven't been accessed yet, and for
+        # properties which raised an AttributeError.
+        try:
+            lazy = object.__getattribute__(self, "_lazy")
+        except AttributeError:
+            lazy = None
 
-        attributes = chain.from_iterable(
-            get_type_hints(cls, globalns=TypeCache.cache).items()
-            for cls in chain(self.__class__.__bases__, (self,))
-        )
-
-        for attr, attr_type in attributes:
-            # Ignore private attributes.
-            if attr.startswith("_"):
-                continue
-
-            types = self.__get_types(attr, attr_type)
-
-            types = tuple(
-                filter(
-                    lambda tpe: tpe is not None and tpe is not MISSING, types
-                )
-            )
-
-            if not types:
-                raise InvalidArgumentAnnotation(
-                    f"Attribute `{attr}` in `{type(self).__name__}` only "
-                    "consisted of missing/optional type!"
-                )
-
-            specific_tp = types[0]
-
-            attr_gotten = getattr(self, attr)
-
-            if tp := get_origin(specific_tp):
-                specific_tp = tp
-
-            if isinstance(specific_tp, EnumMeta) and not attr_gotten:
-                attr_value = MISSING
-            elif tp == list and attr_gotten and (classes := get_args(types[0])):
-                attr_value = [
-                    self.__attr_convert(attr_item, classes[0])
-                    for attr_item in attr_gotten
-                ]
-            elif tp == dict and attr_gotten and (classes := get_args(types[0])):
-                attr_value = {
-                    key: self.__attr_convert(value, classes[1])
-                    for key, value in attr_gotten.items()
-                }
-            else:
-                attr_value = self.__attr_convert(attr_gotten, specific_tp)
+        if not lazy or name not in lazy:
+            # Raises the original error instead of a generic one.
+            return object.__getattribute__(self, name)
 
-            setattr(self, attr, attr_value)
+        value = _decoder_plan(type(self)).converters[name](lazy.pop(name))
+        setattr(self, name, value)
+        return value
 
     # Set default factory method to from_dict for APIObject's.
     @classmethod
@@ -241,7 +554,7 @@ class APIObject:
     def __repr__(self):
         attrs = ", ".join(
             f"{k}={v!r}"
-            for k, v in self.__dict__.items()
+            for k, v in _attributes(self).items()
             if v and not k.startswith("_")
         )
 
@@ -270,36 +583,34 @@ class APIObject:
         if isinstance(data, cls):
             return data
 
+        kwargs = {}
+
+        for key in _decoder_plan(cls).args:
+            value = data.get(key)
+
+            if value is not None:
+                kwargs[key] = value.value if isinstance(value, Enum) else value
+
         # Disable inspection for IDE because this is valid code for the
         # inherited classes:
         # noinspection PyArgumentList
-        return cls(
-            **dict(
-                map(
-                    lambda key: (
-                        key,
-                        data[key].value
-                        if isinstance(data[key], Enum)
-                        else data[key],
-                    ),
-                    filter(
-                        lambda object_argument: data.get(object_argument)
-                        is not None,
-                        getfullargspec(cls.__init__).args,
-                    ),
-                )
-            )
-        )
+        return cls(**kwargs)
 
     def to_dict(self) -> Dict:
         """
         Transform the current object to a dictionary representation. Parameters that
         start with an underscore are not serialized.
+
+        Missing fields are left out, enums, snowflakes, colors and datetimes
+        are replaced with their JSON representation, so the result can be
+        passed to the JSON codec as it is.
         """
-        return _asdict_ignore_none(self)
+        return _encode_value(self)
 
 
 class GuildProperty:
+    __slots__ = ()
+
     @property
     def guild(self) -> Guild:
         """Return a guild from an APIObject
@@ -315,6 +626,8 @@ class GuildProperty:
 
 
 class ChannelProperty:
+    __slots__ = ()
+
     @property
     def channel(self) -> Channel:
         """Return a channel from an APIObject
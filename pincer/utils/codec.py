@@ -0,0 +1,136 @@
+# Copyright Pincer 2021-Present
+# Full MIT License can be found in `LICENSE` at the project root.
+
+from __future__ import annotations
+
+import json
+import logging
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from typing import Any, Callable, Optional, Union
+
+_log = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class JSONCodec:
+    """The JSON implementation used by the gateway, the REST client and
+    multipart uploads.
+
+    Attributes
+    ----------
+    name : :class:`str`
+        Name of the implementation, e.g. ``orjson``.
+    loads : Callable[[Union[:class:`str`, :class:`bytes`]], Any]
+        Decodes a document. Must accept :class:`bytes` without converting
+        them to :class:`str` first.
+    dumps : Callable[[Any], :class:`str`]
+        Encodes an object into a :class:`str`.
+    dumpb : Callable[[Any], :class:`bytes`]
+        Encodes an object into UTF-8 :class:`bytes`.
+    """
+
+    name: str
+    loads: Callable[[Union[str, bytes]], Any]
+    dumps: Callable[[Any], str]
+    dumpb: Callable[[Any], bytes]
+
+
+#: The :mod:`json` module of the standard library.
+STDLIB_CODEC = JSONCodec(
+    "json", json.loads, json.dumps, lambda obj: json.dumps(obj).encode()
+)
+
+#: `orjson <https://github.com/ijl/orjson>`_, which is installed with the
+#: ``speed`` extra. :data:`None` if it is not installed.
+ORJSON_CODEC: Optional[JSONCodec] = None
+
+try:
+    import orjson
+
+    ORJSON_CODEC = JSONCodec(
+        "orjson",
+        orjson.loads,
+        lambda obj: orjson.dumps(obj).decode(),
+        orjson.dumps,
+    )
+except (ModuleNotFoundError, ImportError):
+    pass
+
+_codec: JSONCodec = ORJSON_CODEC or STDLIB_CODEC
+
+
+def get_codec() -> JSONCodec:
+    """
+    Returns
+    -------
+    :class:`~pincer.utils.codec.JSONCodec`
+        The codec that is currently in use.
+    """
+    return _codec
+
+
+def set_codec(codec: JSONCodec):
+    """Replaces the JSON codec used by Pincer. By default orjson is used
+    when it is installed, otherwise the standard library.
+
+    Parameters
+    ----------
+    codec : :class:`~pincer.utils.codec.JSONCodec`
+        The new codec.
+    """
+    global _codec
+
+    _log.debug("Using the %s JSON codec", codec.name)
+    _codec = codec
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """Decodes a JSON document with the current codec.
+
+    Parameters
+    ----------
+    data : Union[:class:`str`, :class:`bytes`]
+        The document, raw bytes are decoded without an intermediate
+        :class:`str`.
+
+    Returns
+    -------
+    Any
+        The decoded object.
+    """
+    return _codec.loads(data)
+
+
+def dumpb(obj: Any) -> bytes:
+    """Encodes an object with the current codec.
+
+    Parameters
+    ----------
+    obj : Any
+        The object to encode.
+
+    Returns
+    -------
+    :class:`bytes`
+        The UTF-8 encoded JSON document.
+    """
+    return _codec.dumpb(obj)
+
+
+def dumps(obj: Any) -> str:
+    """Encodes an object with the current codec.
+
+    Parameters
+    ----------
+    obj : Any
+        The object to encode.
+
+    Returns
+    -------
+    :class:`str`
+        The JSON document.
+    """
+    return _codec.dumps(obj)
@@ -4,7 +4,10 @@
 import string
 from typing import Union
 
+from .types import TYPE_REGISTRY
 
+
+@TYPE_REGISTRY.register
 class Color:
     """
     A color in RGB.
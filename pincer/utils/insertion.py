@@ -4,7 +4,7 @@
 from inspect import getfullargspec, Parameter, Signature
 from typing import Any, Union, Callable, Mapping, List
 
-from .types import Coro, TypeCache
+from .types import Coro, TYPE_REGISTRY
 from ..objects.message.context import MessageContext
 
 
@@ -65,7 +65,6 @@ def should_pass_ctx(sig: Mapping[str, Parameter], params: List[str]) -> bool:
 
     annotation = sig[params[0]].annotation
     if isinstance(annotation, str):
-        TypeCache()
-        annotation = eval(annotation, TypeCache.cache, globals())
+        annotation = TYPE_REGISTRY.resolve(annotation)
 
     return annotation == MessageContext or params[0] == "ctx"
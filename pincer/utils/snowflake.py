@@ -3,7 +3,10 @@
 
 from __future__ import annotations
 
+from .types import TYPE_REGISTRY
 
+
+@TYPE_REGISTRY.register
 class Snowflake(int):
     """Discord utilizes Twitter's snowflake format for uniquely
     identifiable descriptors (IDs).
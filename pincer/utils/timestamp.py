@@ -6,10 +6,13 @@ from __future__ import annotations
 from datetime import datetime
 from typing import Optional, TypeVar, Union
 
+from .types import TYPE_REGISTRY
+
 DISCORD_EPOCH = 1420070400
 TS = TypeVar("TS", str, datetime, float, int)
 
 
+@TYPE_REGISTRY.register
 class Timestamp:
     """Contains a lot of useful methods for working with timestamps.
 
@@ -2,8 +2,23 @@
 # Full MIT License can be found in `LICENSE` at the project root.
 from __future__ import annotations
 
+import logging
+import typing
 from sys import modules
-from typing import TypeVar, Callable, Coroutine, Any, Union, Optional
+from typing import (
+    TYPE_CHECKING,
+    TypeVar,
+    Callable,
+    Coroutine,
+    Any,
+    Union,
+    Optional,
+)
+
+if TYPE_CHECKING:
+    from typing import Dict, List, Set
+
+_log = logging.getLogger(__name__)
 
 
 class MissingType:
@@ -59,15 +74,130 @@ class Singleton(type):
         return cls._instances[cls]
 
 
-class TypeCache(metaclass=Singleton):
-    cache = {}
+def _is_pincer(obj: Any) -> bool:
+    module = getattr(obj, "__module__", None) or ""
+    return module.partition(".")[0] == __name__.partition(".")[0]
+
+
+class TypeRegistry:
+    """The names the string annotations of Pincer's objects are resolved
+    with, as those are often only imported when type checking.
+
+    Pincer's :class:`~pincer.utils.api_object.APIObject` subclasses
+    register themselves and the classes defined next to them, other classes
+    used in annotations are registered with :meth:`register`. A name which
+    refers to different objects of Pincer is left out, it must be imported
+    by the module which uses it. Objects from outside of Pincer never
+    replace or remove Pincer's names.
+    """
 
     def __init__(self):
-        # Register all known types to the cache. This gets used later
-        # to auto-convert the properties to their desired type.
-        lcp = modules.copy()
-        for module in lcp:
-            if not module.startswith("pincer"):
-                continue
-
-            TypeCache.cache.update(lcp[module].__dict__)
+        self.__types: Dict[str, Any] = {
+            name: getattr(typing, name)
+            for name in typing.__all__
+            if name[0].isupper()
+        }
+        self.__ambiguous: Set[str] = set()
+        self.__modules: List[str] = []
+        self.__resolved: Dict[str, Any] = {}
+
+    def register(self, obj: T, name: Optional[str] = None) -> T:
+        """Registers an object, can be used as a class decorator.
+
+        Parameters
+        ----------
+        obj : T
+            The object.
+        name : Optional[:class:`str`]
+            The name annotations use. |default| ``obj.__name__``
+
+        Returns
+        -------
+        T
+            The object.
+        """
+        name = name or obj.__name__
+
+        if name in self.__ambiguous:
+            return obj
+
+        existing = self.__types.get(name, obj)
+
+        # A class which is recreated, e.g. by a decorator, replaces itself.
+        if existing is obj or (
+            getattr(existing, "__module__", None)
+            == getattr(obj, "__module__", None)
+            and getattr(existing, "__qualname__", None)
+            == getattr(obj, "__qualname__", None)
+        ):
+            self.__types[name] = obj
+        elif _is_pincer(existing) != _is_pincer(obj):
+            if _is_pincer(obj):
+                self.__types[name] = obj
+        else:
+            _log.debug("%s is ambiguous, annotations must import it", name)
+            self.__ambiguous.add(name)
+            del self.__types[name]
+
+        self.__resolved.clear()
+        return obj
+
+    def register_module(self, module: str):
+        """Registers the public classes defined in a module once the names
+        are needed, as the module may not be fully executed yet.
+
+        Parameters
+        ----------
+        module : :class:`str`
+            The name of the module.
+        """
+        if module not in self.__modules:
+            self.__modules.append(module)
+
+    @property
+    def namespace(self) -> Dict[str, Any]:
+        """Dict[:class:`str`, Any]: The registered names."""
+        while self.__modules:
+            module = self.__modules.pop()
+
+            for name, value in vars(modules[module]).items():
+                if (
+                    isinstance(value, type)
+                    and value.__module__ == module
+                    and not name.startswith("_")
+                ):
+                    self.register(value, name)
+
+        return self.__types
+
+    def resolve(self, annotation: str) -> Any:
+        """
+        Parameters
+        ----------
+        annotation : :class:`str`
+            A string annotation.
+
+        Returns
+        -------
+        Any
+            The object the annotation refers to, the annotation itself if
+            it can't be resolved.
+        """
+        try:
+            return self.__resolved[annotation]
+        except KeyError:
+            pass
+
+        try:
+            value = eval(annotation, {}, self.namespace)
+        except Exception:
+            value = annotation
+
+        self.__resolved[annotation] = value
+        return value
+
+
+#: The registry used to resolve the annotations of Pincer's objects.
+TYPE_REGISTRY = TypeRegistry()
+TYPE_REGISTRY.register(APINullable, "APINullable")
+TYPE_REGISTRY.register(choice_value_types, "choice_value_types")
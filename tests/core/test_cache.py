@@ -0,0 +1,68 @@
+# Copyright Pincer 2021-Present
+# Full MIT License can be found in `LICENSE` at the project root.
+
+from pincer.core.cache import ResponseCache
+
+
+class TestResponseCache:
+    def test_uncached_route(self):
+        cache = ResponseCache()
+        key = cache.make_key("channels/1/messages")
+
+        cache.set(key, b"[]")
+        assert cache.get(key) is None
+
+    def test_invalidate(self):
+        cache = ResponseCache()
+        guild = cache.make_key("guilds/1")
+        roles = cache.make_key("guilds/1/roles")
+        other = cache.make_key("guilds/2")
+
+        for key in (guild, roles, other):
+            cache.set(key, b"{}")
+
+        assert cache.invalidate("guilds/1/roles/3", parents=True) == 2
+        assert cache.get(guild) is None
+        assert cache.get(other).body == b"{}"
+        assert cache.size == 2
+
+    def test_invalidate_index(self):
+        cache = ResponseCache(max_size=6)
+        member = cache.make_key("guilds/1/members/2")
+        query = cache.make_key("guilds/1", {"with_counts": True})
+
+        cache.set(member, b"12")
+        cache.set(query, b"12")
+        cache.set(cache.make_key("guilds/10"), b"12")
+        # Evicts the member, which must not be invalidated again.
+        cache.set(cache.make_key("users/1"), b"12")
+
+        assert cache.invalidate("guilds/1/members/2/roles/3", parents=True) == 1
+        assert cache.get(query) is None
+        assert cache.invalidate("guilds/1") == 0
+        assert len(cache) == 2 and cache.size == 4
+
+    def test_lru_eviction(self):
+        cache = ResponseCache(max_size=8)
+        first = cache.make_key("users/1")
+        second = cache.make_key("users/2")
+
+        cache.set(first, b"1234")
+        cache.set(second, b"1234")
+        cache.get(first)
+        cache.set(cache.make_key("users/3"), b"1234")
+
+        assert cache.get(second) is None
+        assert cache.get(first) is not None
+        assert cache.size == 8
+
+    def test_stale_without_etag(self):
+        cache = ResponseCache(ttls={"users/{id}": -1})
+        stale = cache.make_key("users/1")
+        tagged = cache.make_key("users/2")
+
+        cache.set(stale, b"{}")
+        cache.set(tagged, b"{}", etag='"abc"')
+
+        assert cache.get(stale) is None
+        assert not cache.get(tagged).fresh
@@ -0,0 +1,117 @@
+# Copyright Pincer 2021-Present
+# Full MIT License can be found in `LICENSE` at the project root.
+
+import asyncio
+from types import SimpleNamespace
+
+from pincer.core.cluster import (
+    ClusterClient,
+    ClusterHub,
+    ClusterIdentifyScheduler,
+    ClusterLauncher,
+)
+from pincer.core.dispatch import GatewayDispatch
+from pincer.core.gateway import SessionStartLimit
+from pincer.middleware import guild_create, ready
+
+GUILD = {
+    "name": "Pincer",
+    "features": [],
+    "nsfw_level": 1,
+    "verification_level": 1,
+    "channels": [],
+}
+
+
+def limit():
+    return SessionStartLimit(
+        total=1000, remaining=1000, reset_after=0, max_concurrency=16
+    )
+
+
+class TestCluster:
+    def test_shard_ranges(self):
+        launcher = ClusterLauncher("token", dict, clusters=3)
+
+        assert launcher.shard_ranges(8) == [
+            range(0, 3),
+            range(3, 6),
+            range(6, 8),
+        ]
+        assert launcher.shard_ranges(2) == [range(0, 1), range(1, 2)]
+
+    def test_queries_and_identify(self, tmp_path, monkeypatch):
+        class Handler:
+            def __init__(self, client):
+                pass
+
+            async def initialize(self):
+                pass
+
+        monkeypatch.setattr(ready, "ChatCommandHandler", Handler)
+
+        gateway = SimpleNamespace(set_session_id=lambda *args: None)
+
+        async def cache(client, guild_ids):
+            # The guilds are sent in READY and again in GUILD_CREATE.
+            await ready.on_ready_middleware(
+                client,
+                gateway,
+                GatewayDispatch(
+                    0,
+                    {
+                        "user": {"id": "1", "username": "Pincer"},
+                        "guilds": [{"id": str(i)} for i in guild_ids],
+                    },
+                ),
+            )
+
+            for guild_id in guild_ids:
+                await guild_create.guild_create_middleware(
+                    client,
+                    gateway,
+                    GatewayDispatch(0, {**GUILD, "id": str(guild_id)}),
+                )
+
+        async def run():
+            hub = ClusterHub(str(tmp_path / "hub.sock"), limit())
+            await hub.start()
+
+            clusters = []
+
+            # Guilds are routed to the shard of their id, the first cluster
+            # runs shard 0 and the second one shard 1.
+            for cluster_id, guild_ids in enumerate(((2 << 22, 4 << 22), (1 << 22,))):
+                client = SimpleNamespace(guilds={}, channels={})
+                await cache(client, guild_ids)
+
+                cluster = ClusterClient(hub.path, cluster_id, client)
+                await cluster.connect([cluster_id], 2)
+                clusters.append(cluster)
+
+            # Lets the hub handle the hellos.
+            await asyncio.sleep(0.01)
+
+            first, second = clusters
+            second.handlers["echo"] = lambda value: value
+
+            assert await first.guild_count() == 3
+            assert (await first.get_guild(1 << 22)).id == 1 << 22
+            assert await first.query("echo", "hi", shard=1) == ["hi"]
+
+            scheduler = ClusterIdentifyScheduler(limit(), first)
+            await scheduler.acquire(0)
+            scheduler.mark_ready(0)
+            await asyncio.sleep(0.01)
+
+            assert hub.identify_scheduler.identified == {0}
+            assert hub.identify_scheduler.ready == {0}
+            assert hub.identify_scheduler.expected == 2
+
+            for cluster in clusters:
+                await cluster.close()
+
+            await asyncio.sleep(0.01)
+            await hub.close()
+
+        asyncio.run(run())
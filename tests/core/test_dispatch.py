@@ -1,7 +1,10 @@
 # Copyright Pincer 2021-Present
 # Full MIT License can be found in `LICENSE` at the project root.
 
-from pincer.core.dispatch import GatewayDispatch
+from json import loads
+
+from pincer.core.dispatch import GatewayDispatch, peek_dispatch
+from pincer.utils.codec import STDLIB_CODEC, ORJSON_CODEC
 
 
 class TestDispatch:
@@ -22,14 +25,37 @@ class TestDispatch:
         Tests whether or not the dispatch class its string conversion
         is correct.
         """
-        assert str(self.dispatch) == self.dispatch_string
+        assert loads(str(self.dispatch)) == loads(self.dispatch_string)
 
     def test_from_string(self):
         """
         Tests whether or not the from_string function is properly
         parsing the string and creating a GatewayDispatch instance.
         """
-        assert (
+        assert loads(
             str(GatewayDispatch.from_string(self.dispatch_string))
-            == self.dispatch_string
-        )
+        ) == loads(self.dispatch_string)
+
+    def test_from_bytes(self):
+        """
+        Tests whether or not raw payloads are decoded by every codec.
+        """
+        for codec in filter(None, (STDLIB_CODEC, ORJSON_CODEC)):
+            assert codec.loads(self.dispatch_string.encode()) == loads(
+                self.dispatch_string
+            )
+            assert codec.dumpb(self.data) == codec.dumps(self.data).encode()
+
+        dispatch = GatewayDispatch.from_string(self.dispatch_string.encode())
+        assert dispatch.data == self.data
+
+    def test_peek(self):
+        """
+        Tests whether or not the envelope of a dispatch is read without
+        decoding its data.
+        """
+        envelope = '{"t":"TYPING_START","s":7,"op":0,"d":{"unparsed'
+
+        assert peek_dispatch(envelope) == ("TYPING_START", 7)
+        assert peek_dispatch(envelope.encode()) == ("TYPING_START", 7)
+        assert peek_dispatch(self.dispatch_string) is None
@@ -0,0 +1,89 @@
+# Copyright Pincer 2021-Present
+# Full MIT License can be found in `LICENSE` at the project root.
+
+import asyncio
+from unittest.mock import patch
+
+from pincer.core import health
+from pincer.core.health import ShardHealth, ShardSupervisor
+from pincer.core.retry import RetryPolicy
+
+
+class FakeGateway:
+    shard = 0
+    shard_key = [0, 1]
+
+    def __init__(self, failures):
+        self.failures = failures
+        self.health = ShardHealth()
+        self.starts = 0
+
+    async def start_loop(self):
+        self.starts += 1
+
+        if self.starts <= self.failures:
+            raise ConnectionError
+
+    async def reconnect(self):
+        pass
+
+
+class TestShardHealth:
+    def test_latency(self):
+        shard = ShardHealth()
+        assert shard.status == "down"
+
+        shard.record_connect()
+        for latency in (0.1, 0.2, 0.3, 0.4):
+            with patch.object(health, "monotonic", return_value=0):
+                shard.record_heartbeat()
+            with patch.object(health, "monotonic", return_value=latency):
+                shard.record_ack()
+
+        assert shard.latency == 0.4
+        assert shard.percentile(50) == 0.2
+        assert shard.status == "healthy"
+
+        shard.record_connect()
+        assert shard.reconnects == 1
+
+    def test_zombie(self):
+        shard = ShardHealth()
+        shard.heartbeat_interval = 40
+
+        with patch.object(health, "monotonic", return_value=0):
+            shard.record_connect()
+
+        with patch.object(health, "monotonic", return_value=100):
+            assert shard.is_zombie
+            assert shard.status == "degraded"
+
+
+class TestShardSupervisor:
+    def test_restarts(self):
+        async def run():
+            supervisor = ShardSupervisor(RetryPolicy(base_delay=0.001, jitter=False))
+            gateway = FakeGateway(failures=2)
+            supervisor.watch(gateway)
+
+            await asyncio.sleep(0.05)
+            supervisor.close()
+            return gateway
+
+        gateway = asyncio.run(run())
+
+        assert gateway.starts == 3
+        assert gateway.health.restarts == 2
+
+    def test_fatal_close_code(self):
+        async def run():
+            supervisor = ShardSupervisor()
+            gateway = FakeGateway(failures=1)
+            gateway.health.close_code = 4004
+            supervisor.watch(gateway)
+
+            await asyncio.sleep(0.01)
+            supervisor.close()
+            return gateway
+
+        assert asyncio.run(run()).starts == 1
@@ -0,0 +1,239 @@
+# Copyright Pincer 2021-Present
+# Full MIT License can be found in `LICENSE` at the project root.
+
+from asyncio import gather, run, sleep
+from time import monotonic
+
+import pytest
+
+from pincer.core.cache import ResponseCache
+from pincer.core.connection import ConnectionPool
+from pincer.core.http import HTTPClient
+from pincer.core.retry import RetryPolicy
+from pincer.core.scheduler import Priority
+from pincer.exceptions import CircuitOpenError, ServerError
+
+
+class Response:
+    """Stand-in for :class:`aiohttp.ClientResponse`"""
+
+    headers = {}
+    reason = "reason"
+
+    def __init__(self, body: bytes = b"", status: int = 200):
+        self.body = body
+        self.status = status
+        self.ok = status < 400
+        self.reads = 0
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        pass
+
+    async def read(self) -> bytes:
+        self.reads += 1
+        return self.body
+
+    async def text(self):
+        raise AssertionError("The body must only be read as bytes")
+
+    async def json(self):
+        raise AssertionError("The body must only be decoded once")
+
+
+class Method:
+    """Stand-in for :meth:`aiohttp.ClientSession.get`"""
+
+    __name__ = "get"
+
+    def __init__(self, *responses: Response):
+        self.responses = list(responses)
+        self.calls = 0
+
+    def __call__(self, url, **kwargs) -> Response:
+        self.calls += 1
+        self.headers = kwargs["headers"]
+        response = self.responses.pop(0)
+
+        if isinstance(response, Exception):
+            raise response
+
+        return response
+
+
+class TestHTTPClient:
+    def test_get_coalescing(self):
+        sent = []
+
+        async def send(method, route, **kwargs):
+            sent.append(route)
+            await sleep(0)
+            return {"id": route}
+
+        async def main():
+            async with HTTPClient("token") as http:
+                http._HTTPClient__send = send
+
+                responses = await gather(
+                    http.get("users/1"),
+                    http.get("users/1"),
+                    http.get("users/2"),
+                )
+                await http.get("users/1")
+                return http, responses
+
+        http, responses = run(main())
+
+        assert responses == [{"id": "users/1"}] * 2 + [{"id": "users/2"}]
+        assert responses[0] is not responses[1]
+        assert sent == ["users/1", "users/2", "users/1"]
+        assert http.get_requests == 3
+        assert http.get_coalesced == 1
+
+    def test_get_coalescing_options(self):
+        """
+        Tests whether or not requests with another priority or with a
+        deadline are sent on their own.
+        """
+        sent = []
+
+        async def send(method, route, **kwargs):
+            sent.append((kwargs["priority"], kwargs["deadline"]))
+            await sleep(0)
+            return {}
+
+        async def main():
+            async with HTTPClient("token") as http:
+                http._HTTPClient__send = send
+
+                await gather(
+                    http.get("users/1", priority=Priority.BACKGROUND),
+                    http.get("users/1"),
+                    http.get("users/1", deadline=1),
+                    http.get("users/1", deadline=1),
+                )
+                return http
+
+        http = run(main())
+
+        assert sorted(sent, key=str) == [
+            (Priority.BACKGROUND, None),
+            (None, 1),
+            (None, 1),
+            (None, None),
+        ]
+        assert http.get_coalesced == 0
+
+    def test_body_read_once(self):
+        res = Response(b'{"id": "1"}')
+
+        async def main():
+            async with HTTPClient("token") as http:
+                return await http._HTTPClient__send(Method(res), "users/1")
+
+        assert run(main()) == {"id": "1"}
+        assert res.reads == 1
+
+    def test_not_modified(self):
+        """
+        Tests whether or not a stale response which Discord confirms as not
+        modified is returned from the cache.
+        """
+        tagged = Response(b'{"id": "1"}')
+        tagged.headers = {"ETag": '"abc"'}
+        method = Method(tagged, Response(status=304))
+
+        async def main():
+            cache = ResponseCache(ttls={"users/{id}": -1})
+            async with HTTPClient("token", cache=cache) as http:
+                first = await http._HTTPClient__send(method, "users/1")
+                second = await http._HTTPClient__send(method, "users/1")
+                return cache, first, second
+
+        cache, first, second = run(main())
+
+        assert first == second == {"id": "1"}
+        assert method.headers["If-None-Match"] == '"abc"'
+        assert cache.revalidations == 1
+        assert cache.get(cache.make_key("users/1")).body == b'{"id": "1"}'
+
+    def test_retry_server_error(self):
+        method = Method(Response(status=502), Response(b"{}"))
+
+        async def main():
+            retry = RetryPolicy(base_delay=0)
+            async with HTTPClient("token", retry=retry) as http:
+                return await http._HTTPClient__send(method, "users/1")
+
+        assert run(main()) == {}
+        assert method.calls == 2
+
+    def test_rate_limit_retry_after(self):
+        """
+        Tests whether or not a request is sent again once the
+        ``retry_after`` of a global rate limit has passed.
+        """
+        limited = Response(b'{"retry_after": 0.05, "global": true}', 429)
+        limited.headers = {"X-RateLimit-Scope": "global"}
+        method = Method(limited, Response(b"{}"))
+
+        async def main():
+            async with HTTPClient("token") as http:
+                start = monotonic()
+                await http._HTTPClient__send(method, "users/1")
+                return monotonic() - start
+
+        assert run(main()) >= 0.05
+        assert method.calls == 2
+
+    def test_circuit_breaker(self):
+        method = Method(Response(status=500), Response(status=503))
+
+        async def main():
+            retry = RetryPolicy(max_attempts=2, base_delay=0, failure_threshold=2)
+            async with HTTPClient("token", retry=retry) as http:
+                with pytest.raises(ServerError):
+                    await http._HTTPClient__send(method, "users/1")
+
+                # The route is failing, further requests aren't sent.
+                with pytest.raises(CircuitOpenError):
+                    await http._HTTPClient__send(method, "users/2")
+
+        run(main())
+        assert method.calls == 2
+
+    def test_circuit_breaker_probe_error(self):
+        """
+        Tests whether or not a probe which fails unexpectedly gives up the
+        probe, so a later request can close the breaker.
+        """
+        method = Method(Response(status=500), ValueError(), Response(b"{}"))
+
+        async def main():
+            retry = RetryPolicy(max_attempts=1, failure_threshold=1, recovery_time=0)
+            async with HTTPClient("token", retry=retry) as http:
+                with pytest.raises(ServerError):
+                    await http._HTTPClient__send(method, "users/1")
+
+                with pytest.raises(ValueError):
+                    await http._HTTPClient__send(method, "users/1")
+
+                return await http._HTTPClient__send(method, "users/1")
+
+        assert run(main()) == {}
+        assert method.calls == 3
+
+    def test_shared_pool(self):
+        async def main():
+            async with ConnectionPool() as pool:
+                async with HTTPClient("token", pool=pool) as http:
+                    session = http.pool.session
+
+                # The pool outlives clients which do not own it.
+                assert not pool.closed
+                assert "Authorization" not in session.headers
+                return pool
+
+        assert run(main()).closed
@@ -0,0 +1,61 @@
+# Copyright Pincer 2021-Present
+# Full MIT License can be found in `LICENSE` at the project root.
+
+import asyncio
+from unittest.mock import patch
+
+from pincer.core import identify
+from pincer.core.gateway import SessionStartLimit
+from pincer.core.identify import IdentifyScheduler
+
+
+def limit(remaining=1000, max_concurrency=1):
+    return SessionStartLimit(
+        total=1000,
+        remaining=remaining,
+        reset_after=50,
+        max_concurrency=max_concurrency,
+    )
+
+
+class TestIdentifyScheduler:
+    def test_buckets(self):
+        async def run():
+            scheduler = IdentifyScheduler(limit(max_concurrency=2))
+            scheduler.expected = 4
+            loop = asyncio.get_running_loop()
+            start = loop.time()
+            times = {}
+
+            async def identify(shard):
+                await scheduler.acquire(shard)
+                times[shard] = loop.time() - start
+
+            await asyncio.gather(*map(identify, range(4)))
+            return scheduler, times
+
+        with patch.object(identify, "IDENTIFY_DELAY", 0.05):
+            scheduler, times = asyncio.run(run())
+
+        # Shards 0 and 1 are in separate buckets, 2 and 3 wait for them.
+        assert times[0] < 0.05 and times[1] < 0.05
+        assert times[2] >= 0.05 and times[3] >= 0.05
+        assert scheduler.remaining == 996
+        assert scheduler.estimated_duration == identify.IDENTIFY_DELAY
+
+        scheduler.mark_ready(0)
+        assert scheduler.progress == 0.25
+
+    def test_waits_for_reset(self):
+        async def run():
+            scheduler = IdentifyScheduler(limit(remaining=0))
+            loop = asyncio.get_running_loop()
+            start = loop.time()
+
+            await scheduler.acquire(0)
+            return scheduler, loop.time() - start
+
+        scheduler, waited = asyncio.run(run())
+
+        assert waited >= 0.05
+        assert scheduler.remaining == 999
@@ -0,0 +1,36 @@
+# Copyright Pincer 2021-Present
+# Full MIT License can be found in `LICENSE` at the project root.
+
+from zlib import Z_SYNC_FLUSH, compress, compressobj
+
+from pincer.core.inflator import Inflator
+
+
+def stream(*payloads: bytes):
+    context = compressobj()
+    return [context.compress(p) + context.flush(Z_SYNC_FLUSH) for p in payloads]
+
+
+class TestInflator:
+    def test_split_stream(self):
+        first, second = stream(b'{"op": 10}', b'{"op": 11}' * 100)
+        inflator = Inflator("zlib-stream")
+
+        assert inflator.decompress(first) == b'{"op": 10}'
+        assert inflator.decompress(second[:5]) is None
+        assert inflator.decompress(second[5:]) == b'{"op": 11}' * 100
+        assert inflator.bytes_in == len(first) + len(second)
+
+    def test_context_per_shard(self):
+        shards = [Inflator("zlib-stream"), Inflator("zlib-stream")]
+
+        first, second = stream(b"a", b"b")
+        assert [i.decompress(first) for i in shards] == [b"a", b"a"]
+        assert [i.decompress(second) for i in shards] == [b"b", b"b"]
+
+        shards[0].reset()
+        assert shards[0].decompress(stream(b"c")[0]) == b"c"
+
+    def test_payload(self):
+        inflator = Inflator("zlib-payload")
+        assert inflator.decompress(compress(b"{}")) == b"{}"
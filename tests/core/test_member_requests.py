@@ -0,0 +1,83 @@
+# Copyright Pincer 2021-Present
+# Full MIT License can be found in `LICENSE` at the project root.
+
+import asyncio
+from types import SimpleNamespace
+
+from pincer.core.member_requests import MemberRequests
+from pincer.objects import Guild
+from pincer.objects.events.guild import GuildMembersChunkEvent
+
+
+def chunk(nonce, members=(), index=0, count=1):
+    return GuildMembersChunkEvent.from_dict(
+        {
+            "guild_id": "1",
+            "members": [
+                {"user": {"id": str(member), "username": "Nelly"}} for member in members
+            ],
+            "chunk_index": index,
+            "chunk_count": count,
+            "nonce": nonce,
+        }
+    )
+
+
+class FakeGateway:
+    def __init__(self):
+        self.member_requests = MemberRequests()
+        self.sent = []
+
+    async def send(self, payload):
+        self.sent.append(payload.data)
+        nonce = payload.data["nonce"]
+
+        self.member_requests.feed(chunk(nonce, (2, 3), 0, 2))
+        self.member_requests.feed(chunk(nonce, (3, 4), 1, 2))
+
+
+class TestMemberRequests:
+    def test_routes_by_nonce(self):
+        async def run():
+            requests = MemberRequests()
+            first, first_chunks = requests.open()
+            second, second_chunks = requests.open()
+
+            assert first != second
+            assert requests.feed(chunk(second))
+            assert not requests.feed(chunk("unknown"))
+
+            assert first_chunks.empty()
+            assert (await second_chunks.get()).nonce == second
+
+            requests.close(first)
+            assert not requests.feed(chunk(first))
+            assert requests.pending == 1
+
+        asyncio.run(run())
+
+    def test_request_members(self, monkeypatch):
+        gateway = FakeGateway()
+        guild = Guild.from_dict(
+            {
+                "id": "1",
+                "name": "Pincer",
+                "features": [],
+                "nsfw_level": 1,
+                "verification_level": 1,
+            }
+        )
+        client = SimpleNamespace(
+            guilds={guild.id: guild}, get_shard=lambda guild_id: gateway
+        )
+        monkeypatch.setattr(Guild, "_client", client)
+
+        async def run():
+            return [
+                member.id async for member in guild.request_members(user_ids=[2, 3, 4])
+            ]
+
+        assert asyncio.run(run()) == [2, 3, 3, 4]
+        assert gateway.sent[0]["user_ids"] == [2, 3, 4]
+        assert gateway.member_requests.pending == 0
+        assert [member.id for member in guild.members] == [2, 3, 4]
@@ -0,0 +1,62 @@
+# Copyright Pincer 2021-Present
+# Full MIT License can be found in `LICENSE` at the project root.
+
+import asyncio
+
+from pincer.core.outbound import OutboundQueue
+
+
+class TestOutboundQueue:
+    def test_coalesce_until_ready(self):
+        written = []
+
+        async def write(payload):
+            written.append(payload)
+
+        async def run():
+            queue = OutboundQueue(write)
+
+            sends = [
+                asyncio.ensure_future(queue.send("presence 1", 3, "presence")),
+                asyncio.ensure_future(queue.send("members", 8)),
+                asyncio.ensure_future(queue.send("presence 2", 3, "presence")),
+            ]
+            await asyncio.sleep(0)
+
+            # Heartbeats are sent before the connection is ready.
+            await queue.send("heartbeat", 1)
+            assert written == ["heartbeat"]
+            assert queue.depth == 2
+
+            queue.open()
+            await asyncio.gather(*sends)
+            return queue
+
+        queue = asyncio.run(run())
+
+        assert written == ["heartbeat", "presence 2", "members"]
+        assert queue.coalesced == 1
+
+    def test_reserved_slots(self):
+        written = []
+
+        async def write(payload):
+            written.append(payload)
+
+        async def run():
+            queue = OutboundQueue(write, limit=3, per=0.1, reserved=1)
+            queue.open()
+            loop = asyncio.get_running_loop()
+            start = loop.time()
+
+            await asyncio.gather(*(queue.send(str(i), 0) for i in range(2)))
+            await queue.send("heartbeat", 1)
+            assert loop.time() - start < 0.1
+
+            # The window is full, the next command waits for it to pass.
+            await queue.send("2", 0)
+            assert loop.time() - start >= 0.1
+
+        asyncio.run(run())
+
+        assert written == ["0", "1", "heartbeat", "2"]
@@ -0,0 +1,146 @@
+# Copyright Pincer 2021-Present
+# Full MIT License can be found in `LICENSE` at the project root.
+
+import asyncio
+
+from pincer.core.dispatch import GatewayDispatch
+from pincer.core.pipeline import DispatchPipeline, PipelineConfig, dispatch_key
+
+
+class TestDispatchPipeline:
+    def test_dispatch_key(self):
+        def key(name, data):
+            return dispatch_key(GatewayDispatch(0, data, 1, name))
+
+        assert key("GUILD_CREATE", {"id": "1"}) == "1"
+        assert key("GUILD_MEMBER_ADD", {"guild_id": "1", "id": "2"}) == "1"
+        assert key("MESSAGE_CREATE", {"channel_id": "3"}) == "3"
+        assert key("READY", {"v": 9}) is None
+
+    def test_order_per_key(self):
+        handled = []
+
+        async def handle(key, index):
+            # Later jobs of other keys finish first, the order of a key is
+            # kept regardless.
+            await asyncio.sleep(0.001 * (5 - index))
+            handled.append((key, index))
+
+        async def run():
+            pipeline = DispatchPipeline(PipelineConfig(workers=2))
+
+            for index in range(5):
+                for key in ("a", "b"):
+                    await pipeline.put(key, lambda k=key, i=index: handle(k, i))
+
+            await pipeline.join()
+            pipeline.close()
+            return pipeline
+
+        pipeline = asyncio.run(run())
+
+        for key in ("a", "b"):
+            assert [i for k, i in handled if k == key] == list(range(5))
+
+        assert pipeline.processed == 10
+        assert pipeline.depth == 0
+
+    def test_backpressure(self):
+        async def run():
+            pipeline = DispatchPipeline(PipelineConfig(workers=1, max_size=2))
+            release = asyncio.Event()
+
+            for _ in range(3):
+                await pipeline.put(None, release.wait)
+
+            # One job is running and the queue is full.
+            blocked = asyncio.ensure_future(pipeline.put(None, release.wait))
+            await asyncio.sleep(0.01)
+            assert not blocked.done()
+            assert pipeline.depth == 2
+
+            release.set()
+            await blocked
+            await pipeline.join()
+            pipeline.close()
+
+        asyncio.run(run())
+
+    def test_listeners_wait_for_later_events(self):
+        """
+        Tests whether or not listeners which wait for a later dispatch
+        don't block the workers, also when the listener limit is reached.
+        """
+
+        async def run():
+            pipeline = DispatchPipeline(PipelineConfig(workers=1, max_listeners=1))
+            later = asyncio.Event()
+            finished = []
+
+            async def listener():
+                await later.wait()
+                finished.append(True)
+
+            async def dispatch():
+                pipeline.spawn(listener())
+
+            async def set_later():
+                later.set()
+
+            await pipeline.put(None, dispatch)
+            await pipeline.put(None, dispatch)
+            await pipeline.put(None, set_later)
+            await asyncio.wait_for(pipeline.join(), 1)
+
+            while pipeline.running_listeners:
+                await asyncio.sleep(0.001)
+
+            assert len(finished) == 2
+            assert pipeline.waiting_listeners == 0
+            pipeline.close()
+
+        asyncio.run(asyncio.wait_for(run(), 1))
+
+    def test_listener_backpressure(self):
+        """
+        Tests whether or not a burst of dispatches keeps at most
+        ``max_listeners`` listener tasks alive and stops the workers once
+        too many listeners are waiting.
+        """
+
+        async def run():
+            pipeline = DispatchPipeline(
+                PipelineConfig(workers=1, max_listeners=2, max_waiting_listeners=4)
+            )
+            release = asyncio.Event()
+            finished = []
+            tasks = len(asyncio.all_tasks())
+
+            async def listener():
+                await release.wait()
+                finished.append(True)
+
+            async def dispatch():
+                pipeline.spawn(listener())
+
+            for _ in range(20):
+                await pipeline.put(None, dispatch)
+
+            await asyncio.sleep(0.01)
+
+            # The worker and the running listeners.
+            assert len(asyncio.all_tasks()) - tasks == 3
+            assert pipeline.running_listeners == 2
+            assert pipeline.waiting_listeners == 4
+            assert pipeline.depth == 14
+
+            release.set()
+            await asyncio.wait_for(pipeline.join(), 1)
+
+            while pipeline.running_listeners:
+                await asyncio.sleep(0.001)
+
+            assert len(finished) == 20
+            pipeline.close()
+
+        asyncio.run(asyncio.wait_for(run(), 1))
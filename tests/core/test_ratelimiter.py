@@ -0,0 +1,166 @@
+# Copyright Pincer 2021-Present
+# Full MIT License can be found in `LICENSE` at the project root.
+
+from asyncio import gather, run, sleep
+
+import pytest
+
+from pincer.core.coordinator import RateLimitCoordinator, SharedRateLimitState
+from pincer.core.ratelimiter import RateLimiter, get_route
+from pincer.core.scheduler import Priority, PriorityLock
+from pincer.exceptions import DeadlineExceededError
+
+
+async def get():
+    """Stand-in for :meth:`aiohttp.ClientSession.get`"""
+
+
+def headers(remaining: int, reset: float = 1.0):
+    return {
+        "X-RateLimit-Bucket": "abcd",
+        "X-RateLimit-Limit": "5",
+        "X-RateLimit-Remaining": str(remaining),
+        "X-RateLimit-Reset": str(reset),
+        "X-RateLimit-Reset-After": "60",
+    }
+
+
+class TestRateLimiter:
+    def test_route_template(self):
+        assert get_route("channels/123/messages/456") == (
+            "channels/{channel_id}/messages/{id}",
+            "123",
+        )
+        assert get_route("/users/789?limit=2") == ("users/{id}", "")
+        assert get_route("webhooks/1/tok/messages/@original") == (
+            "webhooks/{webhook_id}/{token}/messages/@original",
+            "1/tok",
+        )
+        assert get_route("channels/1/messages/2/reactions/%F0%9F/@me") == (
+            "channels/{channel_id}/messages/{id}/reactions/{emoji}/@me",
+            "1",
+        )
+
+    def test_bucket_shared_by_route(self):
+        limiter = RateLimiter()
+        limiter.save_response_bucket("channels/1/messages/2", get, headers(3))
+
+        assert limiter.get_bucket_key(
+            "channels/1/messages/3", get
+        ) == limiter.get_bucket_key("channels/1/messages/2", get)
+        assert limiter.get_bucket_key(
+            "channels/2/messages/3", get
+        ) != limiter.get_bucket_key("channels/1/messages/2", get)
+
+    def test_remaining_is_reserved(self):
+        limiter = RateLimiter()
+        limiter.save_response_bucket("channels/1", get, headers(3))
+
+        run(limiter.wait_until_not_ratelimited("channels/1", get))
+        run(limiter.wait_until_not_ratelimited("channels/1", get))
+
+        bucket = limiter.buckets[limiter.get_bucket_key("channels/1", get)]
+        assert bucket.remaining == 1
+
+        # A late response from the same window must not raise the count.
+        limiter.save_response_bucket("channels/1", get, headers(2))
+        bucket = limiter.buckets[limiter.get_bucket_key("channels/1", get)]
+        assert bucket.remaining == 1
+
+    def test_deadline_fails_fast(self):
+        limiter = RateLimiter()
+        limiter.save_response_bucket("channels/1", get, headers(0))
+
+        assert limiter.estimate_wait("channels/1", get) > 50
+
+        with pytest.raises(DeadlineExceededError):
+            run(limiter.wait_until_not_ratelimited("channels/1", get, deadline=1))
+
+        assert limiter.queue_depth() == 0
+
+    def test_global_window(self):
+        limiter = RateLimiter(global_limit=2)
+
+        async def main():
+            await limiter.wait_for_global()
+            await limiter.wait_for_global()
+            return await limiter.state.reserve(None, limiter.global_limit)
+
+        wait, scope = run(main())
+        assert scope == "global" and 0 < wait <= 1
+
+    def test_global_429_pauses_every_bucket(self):
+        limiter = RateLimiter()
+        limiter.save_rate_limit("channels/1", get, 5, "global")
+
+        assert limiter.estimate_wait("channels/1", get) > 4
+        assert limiter.estimate_wait("guilds/2/members", get) > 4
+
+    def test_bucket_429_pauses_its_bucket(self):
+        limiter = RateLimiter()
+        limiter.save_rate_limit("channels/1", get, 5, "user")
+
+        assert limiter.estimate_wait("channels/1", get) > 4
+        assert limiter.estimate_wait("channels/2", get) == 0
+        assert limiter.estimate_wait("guilds/2/members", get) == 0
+
+
+class TestPriorityLock:
+    def test_priority_order(self):
+        order = []
+
+        async def waiter(lock: PriorityLock, priority: Priority):
+            await lock.acquire(priority)
+            order.append(priority)
+            lock.release()
+
+        async def main():
+            lock = PriorityLock()
+            await lock.acquire()
+
+            tasks = gather(
+                waiter(lock, Priority.BACKGROUND),
+                waiter(lock, Priority.USER),
+                waiter(lock, Priority.INTERACTION),
+            )
+            await sleep(0)
+            assert lock.waiting(Priority.USER) == 3
+
+            lock.release()
+            await tasks
+
+        run(main())
+        assert order == [
+            Priority.INTERACTION,
+            Priority.USER,
+            Priority.BACKGROUND,
+        ]
+
+
+class TestSharedRateLimitState:
+    def test_bucket_shared_between_states(self, tmp_path):
+        key = "abcd:1"
+
+        async def main():
+            coordinator = RateLimitCoordinator(str(tmp_path / "rl.sock"))
+            await coordinator.start()
+
+            first = SharedRateLimitState(coordinator.path)
+            second = SharedRateLimitState(coordinator.path)
+
+            try:
+                await first.reserve(None, 50)
+                first.update(key, 1, 1, 1.0, 60)
+
+                # The round trip makes sure the update has been handled.
+                await first.reserve(None, 50)
+                assert await second.reserve(key, 50) == (0, None)
+
+                wait, scope = await first.reserve(key, 50)
+                assert scope == "bucket" and wait > 50
+            finally:
+                await first.close()
+                await second.close()
+                await coordinator.close()
+
+        run(main())
@@ -0,0 +1,52 @@
+# Copyright Pincer 2021-Present
+# Full MIT License can be found in `LICENSE` at the project root.
+
+from types import SimpleNamespace
+
+import pytest
+
+from pincer.core.recorder import (
+    BINARY,
+    CONNECT,
+    TEXT,
+    GatewayRecorder,
+    GatewayReplay,
+    read_recording,
+)
+
+
+class TestRecorder:
+    def test_round_trip(self, tmp_path):
+        """
+        Tests whether or not recorded frames are read back in order,
+        including an interrupted last frame.
+        """
+        path = str(tmp_path / "traffic.pgr")
+        gateway = SimpleNamespace(shard=1, num_shards=2)
+
+        recorder = GatewayRecorder(path)
+        recorder.record(gateway, CONNECT)
+        recorder.record(gateway, TEXT, '{"op": 10}')
+        recorder.record(gateway, BINARY, b"\x78\x9c")
+        recorder.close()
+
+        with open(path, "ab") as file:
+            file.write(b"\x00\x01")
+
+        frames = list(read_recording(path))
+
+        assert recorder.frames == 3
+        assert [frame.kind for frame in frames] == [CONNECT, TEXT, BINARY]
+        assert frames[1].data == b'{"op": 10}'
+        assert {(f.shard, f.num_shards) for f in frames} == {(1, 2)}
+        assert GatewayReplay(path).gateway_info.shards == 2
+
+    def test_not_a_recording(self, tmp_path):
+        """
+        Tests whether or not other files are rejected.
+        """
+        path = tmp_path / "other.pgr"
+        path.write_bytes(b"{}")
+
+        with pytest.raises(ValueError):
+            list(read_recording(str(path)))
@@ -0,0 +1,191 @@
+# Copyright Pincer 2021-Present
+# Full MIT License can be found in `LICENSE` at the project root.
+
+import asyncio
+from json import dumps, loads
+from time import time
+from types import SimpleNamespace
+
+from aiohttp import WSMsgType
+
+from pincer.core.gateway import Gateway
+from pincer.core.session import FileSessionStore, GatewaySession
+from pincer.middleware import resumed
+
+
+class TestFileSessionStore:
+    def test_round_trip(self, tmp_path):
+        store = FileSessionStore(str(tmp_path / "sessions"))
+        session = GatewaySession("abc", 42, "wss://resume.discord.gg")
+
+        assert store.load([0, 2]) is None
+
+        store.save([0, 2], session)
+        assert store.load([0, 2]) == session
+        assert store.load([1, 2]) is None
+
+    def test_expired(self, tmp_path):
+        store = FileSessionStore(str(tmp_path), max_age=60)
+        store.save([0, 1], GatewaySession("abc", 1, saved_at=time() - 120))
+
+        assert store.load([0, 1]) is None
+        assert store.get([0, 1]).session_id == "abc"
+
+    def test_unreadable(self, tmp_path):
+        (tmp_path / "0-1.json").write_text("{")
+
+        assert FileSessionStore(str(tmp_path)).load([0, 1]) is None
+
+
+class TestColdResume:
+    def test_resumed_without_ready(self, monkeypatch):
+        """
+        Tests whether or not resuming a saved session sets the bot user,
+        registers the commands and calls ``on_ready`` although no
+        ``READY`` is received.
+        """
+        initialized = []
+
+        class Handler:
+            def __init__(self, client):
+                self.client = client
+
+            async def initialize(self):
+                initialized.append(self.client)
+
+        async def get(route):
+            assert route == "users/@me"
+            return {"id": "1", "username": "Pincer"}
+
+        monkeypatch.setattr(resumed, "ChatCommandHandler", Handler)
+
+        client = SimpleNamespace(bot=None, http=SimpleNamespace(get=get))
+        gateway = SimpleNamespace(
+            shard=0,
+            shard_key=[0, 1],
+            identify_scheduler=None,
+            start_heartbeat=lambda: None,
+        )
+
+        async def run():
+            first = await resumed.on_resumed(client, gateway, None)
+            second = await resumed.on_resumed(client, gateway, None)
+            return first, second
+
+        assert asyncio.run(run()) == (("on_ready",), ("on_resumed",))
+        assert client.bot.id == 1
+        assert initialized == [client]
+
+
+class TestCheckpoint:
+    def test_unhandled_dispatches(self, tmp_path):
+        """
+        Tests whether or not the saved sequence stops before dispatches
+        which were dropped from the pipeline on close.
+        """
+        store = FileSessionStore(str(tmp_path))
+
+        async def run():
+            gateway = Gateway(
+                "token",
+                intents=0,
+                url="wss://gateway.invalid",
+                shard=0,
+                num_shards=1,
+                session_store=store,
+            )
+            gateway.set_session_id("abc")
+
+            blocked = asyncio.Event()
+
+            async def handler(payload):
+                if payload.seq == 2:
+                    await blocked.wait()
+
+            gateway.append_handlers({0: handler})
+
+            for seq in (1, 2, 3):
+                await gateway.handle_data(
+                    dumps(
+                        {
+                            "op": 0,
+                            "t": "MESSAGE_CREATE",
+                            "s": seq,
+                            "d": {"guild_id": "1"},
+                        }
+                    )
+                )
+
+            await asyncio.sleep(0.01)
+            await gateway.close()
+
+        asyncio.run(run())
+        assert store.load([0, 1]).seq == 1
+
+
+class FakeSocket:
+    def __init__(self, close_code=None):
+        self.close_code = close_code
+        self.closed = False
+        self.sent = []
+        self.__received = asyncio.Event()
+
+    async def __aiter__(self):
+        yield SimpleNamespace(
+            type=WSMsgType.TEXT,
+            data=dumps({"op": 10, "d": {"heartbeat_interval": 45000}}),
+        )
+
+        # With a close code Discord closes after the resume or identify,
+        # otherwise the connection stays open until the shard closes it.
+        await self.__received.wait()
+        while self.close_code is None:
+            await asyncio.sleep(0.01)
+
+        self.closed = True
+
+    async def send_str(self, payload):
+        self.sent.append(loads(payload)["op"])
+        self.__received.set()
+
+    async def close(self, code=1000):
+        self.close_code = code
+        self.closed = True
+
+
+class TestSessionCloseCodes:
+    def test_invalid_seq(self, tmp_path):
+        """
+        Tests whether or not a shard whose resume is closed with 4007
+        removes the saved session and identifies again.
+        """
+        store = FileSessionStore(str(tmp_path))
+        store.save([0, 1], GatewaySession("abc", 5))
+        first, second = sockets = [FakeSocket(4007), FakeSocket()]
+
+        async def ws_connect(url):
+            return sockets.pop(0)
+
+        async def run():
+            gateway = Gateway(
+                "token",
+                intents=0,
+                url="wss://gateway.invalid",
+                shard=0,
+                num_shards=1,
+                pool=SimpleNamespace(session=SimpleNamespace(ws_connect=ws_connect)),
+                session_store=store,
+            )
+            await gateway.init_session()
+            loop = asyncio.ensure_future(gateway.start_loop())
+
+            while not second.sent:
+                await asyncio.sleep(0.01)
+
+            await gateway.close()
+            await loop
+
+        asyncio.run(asyncio.wait_for(run(), 5))
+
+        assert first.sent == [6] and second.sent == [2]
+        assert store.get([0, 1]) is None
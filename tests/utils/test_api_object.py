@@ -0,0 +1,113 @@
+# Copyright Pincer 2021-Present
+# Full MIT License can be found in `LICENSE` at the project root.
+
+import pytest
+
+from pincer.objects import (
+    AppCommand,
+    AppCommandType,
+    BaseMember,
+    GuildMember,
+    Role,
+    User,
+    UserMessage,
+)
+from pincer.utils.api_object import APIObject, _decoder_plan
+from pincer.utils.snowflake import Snowflake
+
+
+class TestAPIObject:
+    def test_decoder_plan(self):
+        """
+        Tests whether or not nested objects are converted through the plan
+        of their class, which is only created once.
+        """
+        member = GuildMember.from_dict(
+            {"user": {"id": "1", "username": "Nelly"}, "roles": ["2", "3"]}
+        )
+
+        assert member.id == 1 and isinstance(member.id, Snowflake)
+        assert member.roles == [2, 3]
+        assert all(isinstance(role, Snowflake) for role in member.roles)
+
+        assert _decoder_plan(GuildMember) is _decoder_plan(GuildMember)
+        assert "color" in _decoder_plan(Role).args
+
+    def test_slotted(self):
+        """
+        Tests whether or not slotted objects keep their attributes in
+        slots, including the ones copied from the user.
+        """
+        member = GuildMember.from_dict(
+            {"user": {"id": "1", "username": "Nelly"}, "nick": "Nell"}
+        )
+
+        assert not hasattr(User.from_dict({"id": "1"}), "__dict__")
+        assert isinstance(member, BaseMember) and not vars(member)
+        assert member.username == "Nelly" and member.nick == "Nell"
+        assert repr(member) == "GuildMember(id=1, username='Nelly', nick='Nell')"
+
+    def test_lazy_fields(self):
+        """
+        Tests whether or not nested fields of lazy objects are converted
+        on first access only.
+        """
+        UserMessage.lazy_fields = True
+
+        try:
+            message = UserMessage.from_dict(
+                {
+                    "id": "1",
+                    "channel_id": "2",
+                    "author": {"id": "3", "username": "Nelly"},
+                    "content": "hi",
+                }
+            )
+        finally:
+            UserMessage.lazy_fields = False
+
+        assert message.content == "hi"
+        assert "author" in message._lazy
+
+        assert isinstance(message.author, User) and message.author.id == 3
+        assert message.author is message.author
+        assert "author" not in message._lazy
+
+    def test_property_errors(self, monkeypatch):
+        """
+        Tests whether or not an AttributeError raised by a property is not
+        replaced by a generic one.
+        """
+        monkeypatch.setattr(APIObject, "_client", None)
+        user = User.from_dict({"id": "1"})
+
+        with pytest.raises(AttributeError, match="not yet linked"):
+            user._http
+
+        with pytest.raises(AttributeError, match="has no attribute 'nick'"):
+            user.nick
+
+    def test_to_dict(self):
+        """
+        Tests whether or not objects are encoded with their wire values,
+        without missing fields.
+        """
+        command = AppCommand.from_dict(
+            {
+                "type": 1,
+                "name": "ping",
+                "description": "Pong",
+                "guild_id": "290926798999357249",
+            }
+        )
+
+        assert command.type is AppCommandType.CHAT_INPUT
+        assert command.to_dict() == {
+            "type": 1,
+            "name": "ping",
+            "description": "Pong",
+            "guild_id": "290926798999357249",
+            "default_permission": True,
+            "default_member_permissions": None,
+            "dm_permission": None,
+        }
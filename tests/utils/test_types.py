@@ -0,0 +1,78 @@
+# Copyright Pincer 2021-Present
+# Full MIT License can be found in `LICENSE` at the project root.
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import List, Optional
+
+from pincer.objects import VoiceState
+from pincer.utils.api_object import APIObject, _plans, _type_hints
+from pincer.utils.types import TYPE_REGISTRY, TypeRegistry
+
+
+class First:
+    pass
+
+
+class Second:
+    pass
+
+
+class GuildMember:
+    """Shares its name with Pincer's member."""
+
+
+@dataclass
+class Team(APIObject):
+    member: Optional[GuildMember] = None
+
+
+class TestTypeRegistry:
+    def test_resolve(self):
+        """
+        Tests whether or not annotations are resolved with the registered
+        names and typing's, and are left as strings otherwise.
+        """
+        registry = TypeRegistry()
+        registry.register(First)
+
+        assert registry.resolve("Optional[List[First]]") == Optional[List[First]]
+        assert registry.resolve("Second") == "Second"
+
+    def test_ambiguous(self):
+        """
+        Tests whether or not a name which refers to different classes is
+        left out of the registry.
+        """
+        registry = TypeRegistry()
+        registry.register(First, "Shared")
+        registry.register(Second, "Shared")
+
+        assert "Shared" not in registry.namespace
+        assert registry.resolve("Shared") == "Shared"
+
+    def test_outside_names(self):
+        """
+        Tests whether or not classes outside of Pincer resolve their own
+        names without removing Pincer's.
+        """
+        assert _type_hints(Team)["member"] == Optional[GuildMember]
+        assert TYPE_REGISTRY.namespace["GuildMember"] is not GuildMember
+
+        _plans.pop(VoiceState, None)
+        state = VoiceState.from_dict(
+            {
+                "user_id": "1",
+                "session_id": "abc",
+                "deaf": False,
+                "mute": False,
+                "self_deaf": False,
+                "self_mute": False,
+                "self_video": False,
+                "suppress": False,
+                "member": {"user": {"id": "1", "username": "Nelly"}},
+            }
+        )
+
+        assert type(state.member).__module__ == "pincer.objects.guild.member"